@@ -1,21 +1,418 @@
 #!/usr/bin/env python3
 """Entry point for the Streamlit app."""
 import datetime
+from collections import deque
+from dataclasses import asdict
+from functools import partial
+from typing import TYPE_CHECKING
 from zoneinfo import ZoneInfo
 
 import pandas as pd
 import streamlit as st
 
+from blackout_stats.aggregates import compute_data_version
+from blackout_stats.aggregates import split_rows_by_year
+from blackout_stats.data_access import fetch_blackout_events_from_google_sheet
+from blackout_stats.data_access import read_blackout_events_concurrently
 from blackout_stats.data_access import read_blackout_events_from_google_sheet
+from blackout_stats.distribution import OutageDistribution
 from blackout_stats.formatting import format_human_readable_summary_stats_df
 from blackout_stats.formatting import format_last_n_blackouts_df
-from blackout_stats.stats import compute_rolling_statistics
-from blackout_stats.stats import compute_summary_statistics
+from blackout_stats.formatting import format_location_ranking_df
+from blackout_stats.formatting import format_outage_distribution_statistics_df
+from blackout_stats.formatting import format_period_summary_df
+from blackout_stats.formatting import format_rolling_aggregation_label
+from blackout_stats.formatting import format_rolling_statistics_df
+from blackout_stats.formatting import format_survival_curves_df
+from blackout_stats.instrumentation import StageRecorder
+from blackout_stats.instrumentation import mark_cache_miss
+from blackout_stats.instrumentation import summarize_stage_timings
+from blackout_stats.precomputed import PrecomputedResults
+from blackout_stats.precomputed import SharedResultStore
+from blackout_stats.precomputed import precompute_results
+from blackout_stats.precomputed import precompute_results_from_daily_downtime
+from blackout_stats.precomputed import update_precomputed_results
+from blackout_stats.refresh import BackgroundRefresher
+from blackout_stats.refresh import RefreshStatus
+from blackout_stats.rolling import DEFAULT_ROLLING_AGGREGATIONS
+from blackout_stats.stats import compute_location_ranking
+from blackout_stats.stats import compute_rolling_statistics_by_location
+from blackout_stats.stats import parse_blackout_events
 from blackout_stats.stats import transform_events_to_daily_records
-from blackout_stats.visualization import generate_year_calendar_heatmap_plot
+from blackout_stats.streaming import OutageLogStream
+from blackout_stats.summary import DowntimePrefixSums
+from blackout_stats.summary import get_month_to_date_range
+from blackout_stats.summary import get_same_period_last_year
+from blackout_stats.summary import get_week_to_date_range
+from blackout_stats.timeline import OutageTimeline
+
+if TYPE_CHECKING:
+    from blackout_stats.visualization import CalendarHeatmap
+
+# The precomputed results are shared by all sessions, and no stage modifies its inputs.
+# With copy-on-write, a frame derived from the shared results is a lazy view, and an accidental
+# write to it copies the data instead of changing the results of the other sessions.
+pd.set_option("mode.copy_on_write", True)
+
+
+@st.cache_resource(show_spinner=False)
+def get_shared_result_store() -> SharedResultStore[PrecomputedResults]:
+    # A single store for the whole server, so that all sessions share the precomputed results.
+    return SharedResultStore(max_entries=4)
+
+
+def load_precomputed_results(
+    df_blackout_events: pd.DataFrame,
+    df_rejected_events: pd.DataFrame,
+    target_tzinfo: ZoneInfo,
+    store: SharedResultStore[PrecomputedResults],
+) -> PrecomputedResults:
+    # The rejected rows include the outage that is still going on, which the banner shows.
+    data_version = compute_data_version(df_blackout_events, df_rejected_events)
+
+    def build() -> PrecomputedResults:
+        mark_cache_miss()
+        return precompute_results(
+            df_blackout_events=df_blackout_events,
+            df_rejected_events=df_rejected_events,
+            data_version=data_version,
+            target_tzinfo=target_tzinfo,
+            daily_downtime_state_path=st.secrets.get("daily_downtime_state_path"),
+        )
+
+    # The daily report runs till today, so it is rebuilt every day even if the data is the same.
+    today = datetime.datetime.now(tz=target_tzinfo).date()
+    return store.get_or_build(
+        key=(data_version, str(target_tzinfo), today),
+        build=build,
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def get_location_result_store(location_count: int) -> SharedResultStore[pd.DataFrame]:
+    # The daily downtime of every location is computed once per data version for all sessions.
+    return SharedResultStore(max_entries=2 * location_count)
+
+
+def load_location_daily_downtime(
+    df_blackout_events: pd.DataFrame,
+    target_tzinfo: ZoneInfo,
+    store: SharedResultStore[pd.DataFrame],
+) -> pd.DataFrame:
+    data_version = compute_data_version(df_blackout_events)
+
+    def build() -> pd.DataFrame:
+        mark_cache_miss()
+        return transform_events_to_daily_records(
+            df_blackout_events=parse_blackout_events(df_blackout_events, target_tzinfo),
+            target_tzinfo=target_tzinfo,
+        )
+
+    # The daily report runs till today, so it is rebuilt every day even if the data is the same.
+    today = datetime.datetime.now(tz=target_tzinfo).date()
+    return store.get_or_build(
+        key=(data_version, str(target_tzinfo), today),
+        build=build,
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def get_background_refresher(
+    sheet_url: str,
+    cache_path: str | None,
+    timezone_name: str,
+    interval_seconds: float,
+) -> BackgroundRefresher[PrecomputedResults]:
+    # One refresher per server and sheet: after the first load, viewers never wait for the sheet.
+    store = get_shared_result_store()
+    gcp_service_account_info = st.secrets["gcp_service_account"].to_dict()
+    target_tzinfo = ZoneInfo(timezone_name)
+
+    def refresh() -> PrecomputedResults:
+        # The results are only rebuilt if the data has changed since the last refresh.
+        df_blackout_events, df_rejected_events = fetch_blackout_events_from_google_sheet(
+            gcp_service_account_info=gcp_service_account_info,
+            sheet_url=sheet_url,
+            cache_path=cache_path,
+        )
+        return load_precomputed_results(
+            df_blackout_events,
+            df_rejected_events,
+            target_tzinfo,
+            store,
+        )
+
+    refresher = BackgroundRefresher(refresh, interval=datetime.timedelta(seconds=interval_seconds))
+    refresher.start()
+    return refresher
+
+
+@st.cache_resource(show_spinner=False)
+def get_outage_log_stream(path: str, timezone_name: str) -> OutageLogStream:
+    # One stream per server and log: every poll only reads what has been appended since.
+    return OutageLogStream(path, ZoneInfo(timezone_name))
+
+
+def load_results_from_outage_log(
+    recorder: StageRecorder,
+    target_tzinfo: ZoneInfo,
+    path: str,
+) -> PrecomputedResults:
+    stream = get_outage_log_stream(path, str(target_tzinfo))
+    with recorder.measure("log_poll") as record:
+        snapshot = stream.poll()
+        record.rows = len(snapshot.df_blackout_events)
+
+    def build() -> PrecomputedResults:
+        mark_cache_miss()
+        # After an append, only the years it changed are aggregated again.
+        previous_results = get_shared_result_store().get_latest()
+        if previous_results is not None and previous_results.timezone_name == str(target_tzinfo):
+            return update_precomputed_results(
+                previous_results=previous_results,
+                df_blackout_events=snapshot.df_blackout_events,
+                df_rejected_events=snapshot.df_rejected_events,
+                df_daily_downtime=snapshot.df_daily_downtime,
+                data_version=snapshot.data_version,
+            )
+        return precompute_results_from_daily_downtime(
+            df_blackout_events=snapshot.df_blackout_events,
+            df_rejected_events=snapshot.df_rejected_events,
+            df_daily_downtime=snapshot.df_daily_downtime,
+            data_version=snapshot.data_version,
+            target_tzinfo=target_tzinfo,
+        )
+
+    # The log version changes whenever anything is appended; the daily report changes every day.
+    today = datetime.datetime.now(tz=target_tzinfo).date()
+    with recorder.measure("precompute", cached=True):
+        results = get_shared_result_store().get_or_build(
+            key=(path, snapshot.data_version, str(target_tzinfo), today),
+            build=build,
+        )
+
+    # Rerun the app as soon as anything new is logged, without waiting for the viewer.
+    @st.experimental_fragment(run_every=st.secrets.get("outage_log_poll_interval_seconds", 5))
+    def watch_outage_log() -> None:
+        if stream.poll().data_version != snapshot.data_version:
+            st.rerun()
+
+    watch_outage_log()
+    return results
+
+
+def load_results(recorder: StageRecorder, target_tzinfo: ZoneInfo) -> PrecomputedResults:
+    outage_log_path = st.secrets.get("outage_log_path")
+    if outage_log_path:
+        return load_results_from_outage_log(recorder, target_tzinfo, outage_log_path)
+
+    refresh_interval_seconds = st.secrets.get("background_refresh_interval_seconds")
+    if refresh_interval_seconds:
+        # Serve the last good snapshot right away, even if it is being refreshed.
+        refresher = get_background_refresher(
+            sheet_url=st.secrets["private_gsheets_url"],
+            cache_path=st.secrets.get("sheet_cache_path"),
+            timezone_name=str(target_tzinfo),
+            interval_seconds=refresh_interval_seconds,
+        )
+        with recorder.measure("snapshot"):
+            results = refresher.get_snapshot()
+        render_refresh_status(refresher.status)
+        return results
+
+    # Download the power outage data. Everything derived from it is computed once per data version
+    # and shared by all sessions.
+    df_blackout_events, df_rejected_events = recorder.call(
+        "fetch",
+        read_blackout_events_from_google_sheet,
+        gcp_service_account_info=st.secrets["gcp_service_account"].to_dict(),
+        sheet_url=st.secrets["private_gsheets_url"],
+        cache_path=st.secrets.get("sheet_cache_path"),
+        cached=True,
+    )
+    with recorder.measure("precompute", cached=True):
+        return load_precomputed_results(
+            df_blackout_events,
+            df_rejected_events,
+            target_tzinfo,
+            get_shared_result_store(),
+        )
+
+
+def render_refresh_status(status: RefreshStatus) -> None:
+    if status.last_success_at is not None:
+        now = datetime.datetime.now(tz=datetime.timezone.utc)
+        age_minutes = (now - status.last_success_at).total_seconds() / 60
+        refresh_note = " Триває оновлення…" if status.is_refreshing else ""
+        st.caption(f"Дані завантажено {age_minutes:.0f} хв тому.{refresh_note}")
+    if status.last_error is not None:
+        st.warning(
+            f"Не вдалося оновити дані: {status.last_error}. Показано останні доступні дані."
+        )
+
+
+def render_outage_banner(timeline: OutageTimeline, target_tzinfo: ZoneInfo) -> None:
+    # A single binary search, so the state is fresh on every rerun even if the data is not.
+    state = timeline.state_at(datetime.datetime.now(tz=target_tzinfo))
+    if not state.is_down or state.since is None or state.duration is None:
+        return
+    total_minutes = int(state.duration.total_seconds() // 60)
+    st.error(
+        f"🔴 Зараз світла немає вже {total_minutes // 60} год {total_minutes % 60} хв "
+        f"(з {state.since:%Y-%m-%d %H:%M})."
+    )
+
+
+def render_period_summary(prefix_sums: DowntimePrefixSums, target_tzinfo: ZoneInfo) -> None:
+    today = datetime.datetime.now(tz=target_tzinfo).date()
+    month_start, _ = get_month_to_date_range(today)
+    # Every range is summed up from the precomputed prefix sums, so picking one is instant.
+    picked_dates = st.date_input(
+        label="Оберіть період",
+        value=(month_start, today),
+        min_value=min(prefix_sums.start_date, month_start),
+        max_value=today,
+        format="YYYY-MM-DD",
+    )
+    periods = {
+        "Цей тиждень": get_week_to_date_range(today),
+        "Цей місяць": get_month_to_date_range(today),
+    }
+    # While the viewer is picking the range, only its first day is known.
+    match picked_dates:
+        case (start_date, end_date):
+            periods["Обраний період"] = (start_date, end_date + datetime.timedelta(days=1))
+
+    df_period_summary = format_period_summary_df(
+        summary_by_period={
+            period_name: prefix_sums.summarize(start, end)
+            for period_name, (start, end) in periods.items()
+        },
+        summary_last_year_by_period={
+            period_name: prefix_sums.summarize(*get_same_period_last_year(start, end))
+            for period_name, (start, end) in periods.items()
+        },
+    )
+    st.dataframe(
+        data=df_period_summary,
+        column_config={
+            column: st.column_config.NumberColumn(format="%.1f")
+            for column in df_period_summary.columns[1:]
+        },
+        hide_index=True,
+    )
+
+
+def render_outage_distribution(distribution: OutageDistribution) -> None:
+    df_statistics = format_outage_distribution_statistics_df(distribution.df_statistics)
+    st.dataframe(
+        data=df_statistics,
+        column_config={
+            column: st.column_config.NumberColumn(format="%.1f")
+            for column in df_statistics.columns[1:]
+        },
+        hide_index=True,
+    )
+
+    outage_column, gap_column = st.columns(2)
+    with outage_column:
+        st.caption("Кількість відключень за тривалістю (від X годин)")
+        st.bar_chart(distribution.df_outage_histogram["count"])
+    with gap_column:
+        st.caption("Кількість перерв між відключеннями за тривалістю (від X годин)")
+        st.bar_chart(distribution.df_gap_histogram["count"])
+
+    st.caption("Імовірність, що відключення чи перерва триватиме понад X годин (%)")
+    st.line_chart(format_survival_curves_df(distribution.df_survival))
+
+
+def get_year_calendar_heatmap(year: int, df_daily_downtime: pd.DataFrame) -> "CalendarHeatmap":
+    from blackout_stats.visualization import create_year_calendar_heatmap
+    from blackout_stats.visualization import update_year_calendar_heatmap
+
+    # Bokeh models cannot be shared between sessions, so the plots are reused per session only.
+    heatmaps = st.session_state.setdefault("calendar_heatmaps", {})
+    if year not in heatmaps:
+        heatmaps[year] = create_year_calendar_heatmap(year)
+    heatmap = heatmaps[year]
+    update_year_calendar_heatmap(heatmap, df_daily_downtime)
+    return heatmap
+
+
+def render_calendar_heatmap(
+    year: int,
+    df_daily_downtime: pd.DataFrame,
+    recorder: StageRecorder,
+) -> None:
+    # Imported on first use: Bokeh is slow to import and is not needed for the page header.
+    from blackout_stats.visualization import compute_plot_payload_size
+    from blackout_stats.visualization import generate_compact_calendar_heatmap_plot
+
+    calendar_renderer = st.radio(
+        label="Вигляд календаря",
+        options=["Окремі місяці", "Компактний"],
+        horizontal=True,
+        label_visibility="collapsed",
+    )
+    with recorder.measure("calendar_build"):
+        if calendar_renderer == "Компактний":
+            plot = generate_compact_calendar_heatmap_plot(df_daily_downtime, years=[year])
+        else:
+            plot = get_year_calendar_heatmap(year, df_daily_downtime).plot
+    # Streamlit serializes the plot right away, so this measures the serialization.
+    with recorder.measure("calendar_render"):
+        st.bokeh_chart(plot)
+    # Measuring the payload serializes the plot once more, so it is only done for debugging.
+    if is_debug_panel_enabled():
+        st.caption(f"Розмір даних календаря: {compute_plot_payload_size(plot) / 1024:.1f} КБ")
+
+
+def render_hour_of_day_heatmap(df_hour_of_day_profile: pd.DataFrame) -> None:
+    from blackout_stats.visualization import generate_hour_of_day_heatmap_plot
+
+    st.bokeh_chart(generate_hour_of_day_heatmap_plot(df_hour_of_day_profile))
+
+
+def is_debug_panel_enabled() -> bool:
+    return st.query_params.get("debug") == "timings" or bool(st.secrets.get("debug_timings"))
+
+
+def finish_instrumented_run(recorder: StageRecorder) -> None:
+    # Keep the measurements of the recent reruns of this session to compute the percentiles.
+    timing_history = st.session_state.setdefault("stage_timing_history", deque(maxlen=2000))
+    timing_history.extend(recorder.records)
+
+    timing_log_path = st.secrets.get("timing_log_path")
+    if timing_log_path:
+        recorder.append_to_file(timing_log_path)
+
+    if not is_debug_panel_enabled():
+        return
+    with st.expander("⏱️ Налагодження: тривалість етапів"):
+        st.caption(f"Запуск {recorder.run_id}")
+        st.dataframe(pd.DataFrame([asdict(record) for record in recorder.records]))
+        st.caption(f"Останні вимірювання цієї сесії: {len(timing_history)}")
+        st.dataframe(summarize_stage_timings(timing_history))
+        st.download_button(
+            label="Завантажити у форматі JSON Lines",
+            data=recorder.to_json_lines(),
+            file_name=f"stage_timings_{recorder.run_id}.jsonl",
+            mime="application/jsonl",
+        )
 
 
 def main() -> None:
+    recorder = StageRecorder()
+    try:
+        if "locations" in st.secrets:
+            multi_location_main(recorder)
+        else:
+            single_location_main(recorder)
+    finally:
+        finish_instrumented_run(recorder)
+
+
+def single_location_main(recorder: StageRecorder) -> None:
     location_name = st.secrets["location_name"]
     target_tzinfo = ZoneInfo(st.secrets["target_timezone_name"])
 
@@ -23,39 +420,34 @@ def main() -> None:
     st.title("💡 Статистика відключень")
     st.subheader(location_name)
 
-    # Download the power outage data.
-    df_blackout_events = read_blackout_events_from_google_sheet(
-        gcp_service_account_info=st.secrets["gcp_service_account"].to_dict(),
-        sheet_url=st.secrets["private_gsheets_url"],
-    )
-    df_daily_downtime = transform_events_to_daily_records(
-        df_blackout_events=df_blackout_events,
-        target_tzinfo=target_tzinfo,
-    )
-    last_update_date = df_blackout_events["end_date"].max()
+    results = load_results(recorder, target_tzinfo)
+    cube = results.cube
+    df_rejected_events = results.df_rejected_events
+    last_update_date = results.df_blackout_events["end_date"].max()
 
+    with recorder.measure("outage_state"):
+        render_outage_banner(results.outage_timeline, target_tzinfo)
     st.write("Дані відображають фактичні відключення.")
     st.write("Дані можуть оновлюватися з затримкою та не враховувати недавні відключення.")
     st.write(f"Останнє оновлення даних: {last_update_date:%Y-%m-%d %H:%M}.")
+    if not df_rejected_events.empty:
+        with st.expander(f"Пропущено рядків із некоректними даними: {len(df_rejected_events)}"):
+            st.dataframe(df_rejected_events, hide_index=True)
 
-    available_years = [2022, 2023, 2024, 2025]
+    available_years = cube.years
     year_selector = st.selectbox(
         label="Оберіть рік",
         placeholder="Оберіть рік",
         options=available_years,
         index=len(available_years) - 1,
     )
-    is_current_year_selected = (year_selector == datetime.datetime.now().year == year_selector)
-
-    # Filter the outage data to the currently selected year.
-    df_blackout_events = pd.DataFrame(
-        df_blackout_events[df_blackout_events["start_date"].dt.year == year_selector]
-    )
-    df_daily_downtime = pd.DataFrame(
-        df_daily_downtime[df_daily_downtime["date"].dt.year == year_selector]
-    )
+    if year_selector is None:
+        # There is no data for any year yet.
+        return
+    is_current_year_selected = year_selector == datetime.datetime.now().year
 
-    summary_stats = compute_summary_statistics(df_daily_downtime)
+    df_daily_downtime = cube.daily_downtime_by_year[year_selector]
+    summary_stats = cube.summary_stats_by_year[year_selector]
 
     st.header("📊 Скільки часу не було світла")
     df_summary_stats = format_human_readable_summary_stats_df(
@@ -70,20 +462,152 @@ def main() -> None:
         hide_index=True,
     )
 
+    st.header("🔎 Порівняння з минулим роком")
+    render_period_summary(results.downtime_prefix_sums, target_tzinfo)
+
     st.header("🗓️ Календар тривалості відключень")
     st.caption("(годин за добу)")
-    plot = generate_year_calendar_heatmap_plot(df_daily_downtime)
-    st.bokeh_chart(plot)
+    render_calendar_heatmap(year_selector, df_daily_downtime, recorder)
 
-    st.header("📈 Середньотижнева тривалість відключень")
-    st.caption("(годин за добу)")
-    df_rolling_stats = compute_rolling_statistics(df_daily_downtime)
+    st.header("📈 Ковзна тривалість відключень")
+    st.caption("(годин за добу, за останні 7, 30 та 90 днів)")
+    rolling_aggregation = st.radio(
+        label="Показник",
+        options=DEFAULT_ROLLING_AGGREGATIONS,
+        format_func=format_rolling_aggregation_label,
+        horizontal=True,
+        label_visibility="collapsed",
+    )
+    df_rolling_stats = format_rolling_statistics_df(
+        results.rolling_stats_by_year[year_selector],
+        aggregation=rolling_aggregation or DEFAULT_ROLLING_AGGREGATIONS[0],
+    )
     st.line_chart(df_rolling_stats)
 
+    st.header("📅 Порівняння з іншими роками")
+    st.caption("(годин за місяць)")
+    st.line_chart(cube.df_monthly_downtime.T.rename(columns=str))
+
+    st.header("🕓 Відключення за годинами доби")
+    st.caption("(частка часу без світла, %)")
+    render_hour_of_day_heatmap(results.hour_of_day_profile_by_year[year_selector])
+
+    if year_selector in results.outage_distribution_by_year:
+        st.header("🔋 Тривалість відключень і перерв між ними")
+        render_outage_distribution(results.outage_distribution_by_year[year_selector])
+
     st.header("⏱️ Останні 5 відключень")
-    df_last_5_blackouts = format_last_n_blackouts_df(df_blackout_events, year=year_selector, n=5)
+    df_last_5_blackouts = recorder.call(
+        "last_blackouts",
+        format_last_n_blackouts_df,
+        results.event_index,
+        year=year_selector,
+        n=5,
+    )
     st.dataframe(df_last_5_blackouts)
 
 
+def multi_location_main(recorder: StageRecorder) -> None:
+    target_tzinfo = ZoneInfo(st.secrets["target_timezone_name"])
+    gcp_service_account_info = st.secrets["gcp_service_account"].to_dict()
+
+    st.set_page_config(page_title="Статистика відключень: порівняння локацій")
+    st.title("💡 Статистика відключень")
+    st.subheader("Порівняння локацій")
+
+    # Download the power outage data for all locations at once.
+    # A failed or slow location must not block the others.
+    fetchers = {
+        location["name"]: partial(
+            read_blackout_events_from_google_sheet,
+            gcp_service_account_info=gcp_service_account_info,
+            sheet_url=location["private_gsheets_url"],
+            cache_path=location.get("sheet_cache_path"),
+        )
+        for location in st.secrets["locations"]
+    }
+    # The cache misses happen in the worker threads, so the fetch is not counted as cached.
+    with recorder.measure("fetch"):
+        fetch_results = read_blackout_events_concurrently(
+            fetchers=fetchers,
+            timeout_seconds=st.secrets.get("location_fetch_timeout_seconds", 30.0),
+        )
+
+    store = get_location_result_store(len(fetchers))
+    daily_downtime_by_location = {}
+    for location_name, result in fetch_results.items():
+        if result.error is not None or result.df_blackout_events is None:
+            st.warning(f"Не вдалося завантажити дані для «{location_name}»: {result.error}")
+            continue
+        with recorder.measure("precompute", cached=True) as record:
+            df_daily_downtime = load_location_daily_downtime(
+                result.df_blackout_events,
+                target_tzinfo,
+                store,
+            )
+            record.rows = len(df_daily_downtime)
+        daily_downtime_by_location[location_name] = df_daily_downtime
+
+    with st.expander("Час завантаження даних"):
+        st.dataframe(
+            pd.Series(
+                {name: result.elapsed_seconds for name, result in fetch_results.items()},
+                name="Секунд",
+            ).rename_axis("Локація"),
+            column_config={"Секунд": st.column_config.NumberColumn(format="%.2f")},
+        )
+
+    if not daily_downtime_by_location:
+        st.error("Немає даних для жодної локації.")
+        return
+
+    # Split the outage data by year once, as slices of the daily records.
+    daily_downtime_by_location_and_year = {
+        location_name: split_rows_by_year(
+            df_daily_downtime,
+            df_daily_downtime["date"].dt.year.to_numpy(),
+        )
+        for location_name, df_daily_downtime in daily_downtime_by_location.items()
+    }
+
+    # The years that have any daily downtime records for at least one location.
+    available_years = sorted(set().union(*daily_downtime_by_location_and_year.values()))
+    year_selector = st.selectbox(
+        label="Оберіть рік",
+        placeholder="Оберіть рік",
+        options=available_years,
+        index=len(available_years) - 1,
+    )
+    if year_selector is None:
+        # There is no data for any year yet.
+        return
+    is_current_year_selected = year_selector == datetime.datetime.now(tz=target_tzinfo).year
+
+    # Filter the outage data to the currently selected year.
+    daily_downtime_by_location = {
+        location_name: daily_downtime_by_year.get(
+            year_selector,
+            daily_downtime_by_location[location_name].iloc[:0],
+        )
+        for location_name, daily_downtime_by_year in daily_downtime_by_location_and_year.items()
+    }
+
+    st.header("🏆 Де найдовше не було світла")
+    df_ranking = format_location_ranking_df(
+        df_ranking=compute_location_ranking(daily_downtime_by_location),
+        include_recent_n_days_stats=is_current_year_selected,
+    )
+    st.dataframe(
+        data=df_ranking,
+        column_config={
+            column: st.column_config.NumberColumn(format="%.1f") for column in df_ranking.columns
+        },
+    )
+
+    st.header("📈 Середньотижнева тривалість відключень")
+    st.caption("(годин за добу)")
+    st.line_chart(compute_rolling_statistics_by_location(daily_downtime_by_location))
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Benchmark the rendering of the year calendar heatmap, with both renderers.
+
+The compact renderer is timed including the serialization, since it has no separate data update.
+
+Usage: python -m benchmarks.bench_calendar_heatmap [--years 4]
+"""
+import argparse
+import json
+import time
+from collections.abc import Callable
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import pandas as pd
+from bokeh.embed import json_item
+
+from benchmarks.synthetic import generate_blackout_events
+from blackout_stats.stats import transform_events_to_daily_records
+from blackout_stats.visualization import CalendarHeatmap
+from blackout_stats.visualization import compute_plot_payload_size
+from blackout_stats.visualization import create_year_calendar_heatmap
+from blackout_stats.visualization import generate_compact_calendar_heatmap_plot
+from blackout_stats.visualization import update_year_calendar_heatmap
+
+
+def time_best_of(func: Callable[[], object], repeat: int = 5) -> float:
+    best_seconds = float("inf")
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        func()
+        best_seconds = min(best_seconds, time.perf_counter() - start_time)
+    return best_seconds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--years", type=int, default=4)
+    parser.add_argument("--outages-per-day", type=int, default=20)
+    parser.add_argument("--timezone", default="Europe/Kyiv")
+    args = parser.parse_args()
+
+    target_tzinfo = ZoneInfo(args.timezone)
+    df_blackout_events = generate_blackout_events(
+        start_date=datetime(2022, 1, 1, tzinfo=target_tzinfo),
+        days=365 * args.years,
+        outages_per_day=args.outages_per_day,
+    )
+    df_daily_downtime = transform_events_to_daily_records(
+        df_blackout_events,
+        target_tzinfo=target_tzinfo,
+        max_output_date=df_blackout_events["end_date"].max().to_pydatetime(),
+    )
+
+    print(
+        f"{'Year':>6} {'Build + fill, s':>16} {'Data update, s':>15} {'Serialize, s':>13}"
+        f" {'Compact, s':>11} {'Payload, KB':>12} {'Compact payload, KB':>20}"
+    )
+    for year, df_year in df_daily_downtime.groupby(df_daily_downtime["date"].dt.year):
+        heatmap = create_year_calendar_heatmap(year)
+        update_year_calendar_heatmap(heatmap, df_year)
+        compact_plot = generate_compact_calendar_heatmap_plot(df_year, years=[year])
+
+        def build_and_fill(year: int = year, df_year: pd.DataFrame = df_year) -> None:
+            update_year_calendar_heatmap(create_year_calendar_heatmap(year), df_year)
+
+        def fill(heatmap: CalendarHeatmap = heatmap, df_year: pd.DataFrame = df_year) -> None:
+            update_year_calendar_heatmap(heatmap, df_year)
+
+        def serialize(heatmap: CalendarHeatmap = heatmap) -> None:
+            json.dumps(json_item(heatmap.plot))
+
+        def render_compact(year: int = year, df_year: pd.DataFrame = df_year) -> None:
+            json.dumps(json_item(generate_compact_calendar_heatmap_plot(df_year, years=[year])))
+
+        print(
+            f"{year:>6} {time_best_of(build_and_fill):>16.4f} {time_best_of(fill):>15.4f}"
+            f" {time_best_of(serialize):>13.4f} {time_best_of(render_compact):>11.4f}"
+            f" {compute_plot_payload_size(heatmap.plot) / 1024:>12.1f}"
+            f" {compute_plot_payload_size(compact_plot) / 1024:>20.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
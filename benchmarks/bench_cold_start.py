@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Benchmark the cold start of the app: the time until the first header is rendered.
+
+Every run starts a fresh interpreter, runs the app with Streamlit's app tester on a small
+local outage log (so that no network is involved), and records when `st.title` is called.
+
+Usage: python -m benchmarks.bench_cold_start [--runs 5]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+from benchmarks.startup import measure_import_times
+
+# Runs the app in a fresh interpreter and prints the timings as JSON.
+COLD_START_SCRIPT = """
+import json
+import sys
+import time
+
+start_time = time.perf_counter()
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+tester_ready_time = time.perf_counter()
+header_times = []
+header_modules = []
+render_title = st.title
+
+
+def title(*args, **kwargs):
+    header_times.append(time.perf_counter())
+    header_modules.append(sorted(sys.modules))
+    return render_title(*args, **kwargs)
+
+
+st.title = title
+app_test = AppTest.from_file(sys.argv[1], default_timeout=120)
+app_test.secrets["location_name"] = "Home"
+app_test.secrets["target_timezone_name"] = "Europe/Kyiv"
+app_test.secrets["outage_log_path"] = sys.argv[2]
+app_test.run()
+print(json.dumps({
+    "tester_seconds": tester_ready_time - start_time,
+    "first_header_seconds": header_times[0] - tester_ready_time,
+    "app_seconds": time.perf_counter() - tester_ready_time,
+    "modules_at_first_header": header_modules[0],
+}))
+"""
+
+
+def run_cold_start(app_path: str, log_path: str) -> dict:
+    """Run the app once in a fresh interpreter and return its timings."""
+    result = subprocess.run(
+        [sys.executable, "-c", COLD_START_SCRIPT, app_path, log_path],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=os.path.dirname(app_path),
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--app", default=os.path.abspath("app.py"))
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        log_path = os.path.join(temp_dir, "outages.jsonl")
+        with open(log_path, "w", encoding="utf-8") as log_file:
+            log_file.write('{"timestamp": "2024-01-01T10:00:00+02:00", "event": "start"}\n')
+            log_file.write('{"timestamp": "2024-01-01T12:00:00+02:00", "event": "stop"}\n')
+        runs = [run_cold_start(args.app, log_path) for _ in range(args.runs)]
+
+    first_header_seconds = statistics.median(run["first_header_seconds"] for run in runs)
+    app_seconds = statistics.median(run["app_seconds"] for run in runs)
+    print(f"Runs: {args.runs} (medians, excluding {runs[0]['tester_seconds']:.2f} s of the tester)")
+    print(f"Until the first header: {first_header_seconds:.3f} s")
+    print(f"Until the whole page:   {app_seconds:.3f} s")
+    for module in ("bokeh", "shillelagh", "sqlalchemy"):
+        print(f"Imports {module} before the header: {module in runs[0]['modules_at_first_header']}")
+
+    print("Slowest imports of `app` (-X importtime, cumulative):")
+    import_times = measure_import_times("app", cwd=os.path.dirname(args.app))
+    for module, microseconds in sorted(import_times.items(), key=lambda item: -item[1])[:10]:
+        print(f"  {microseconds / 1000:8.1f} ms  {module}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Benchmark the sub-daily downtime bucketing.
+
+Usage: python -m benchmarks.bench_downtime_buckets [--years 4] [--freq 15min]
+"""
+import argparse
+import time
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+from benchmarks.synthetic import generate_blackout_events
+from blackout_stats.stats import transform_events_to_bucket_records
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--years", type=int, default=4)
+    parser.add_argument("--outages-per-day", type=int, default=20)
+    parser.add_argument("--freq", default="15min")
+    parser.add_argument("--timezone", default="Europe/Kyiv")
+    args = parser.parse_args()
+
+    target_tzinfo = ZoneInfo(args.timezone)
+    df_blackout_events = generate_blackout_events(
+        start_date=datetime(2022, 1, 1, tzinfo=target_tzinfo),
+        days=365 * args.years,
+        outages_per_day=args.outages_per_day,
+    )
+    max_output_date = df_blackout_events["end_date"].max().to_pydatetime()
+
+    best_seconds = float("inf")
+    for _ in range(5):
+        df_input = df_blackout_events.copy()
+        start_time = time.perf_counter()
+        df_bucket_downtime = transform_events_to_bucket_records(
+            df_input,
+            target_tzinfo=target_tzinfo,
+            freq=args.freq,
+            max_output_date=max_output_date,
+        )
+        best_seconds = min(best_seconds, time.perf_counter() - start_time)
+
+    print(f"Events: {len(df_blackout_events)}, {args.freq} buckets: {len(df_bucket_downtime)}")
+    print(f"Bucketing: {best_seconds:.4f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Benchmark the multi-location, multi-year daily downtime backfill on a process pool.
+
+Usage: python -m benchmarks.bench_parallel_backfill [--locations 8] [--years 4] [--workers 4]
+"""
+import argparse
+import time
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import pandas as pd
+
+from benchmarks.synthetic import generate_blackout_events
+from blackout_stats.batch import transform_events_to_daily_records_by_location
+from blackout_stats.stats import transform_events_to_daily_records
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--locations", type=int, default=8)
+    parser.add_argument("--years", type=int, default=4)
+    parser.add_argument("--outages-per-day", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--timezone", default="Europe/Kyiv")
+    args = parser.parse_args()
+
+    target_tzinfo = ZoneInfo(args.timezone)
+    events_by_location = {
+        f"Location {location}": generate_blackout_events(
+            start_date=datetime(2022, 1, 1, tzinfo=target_tzinfo),
+            days=365 * args.years,
+            outages_per_day=args.outages_per_day,
+            seed=location,
+        )
+        for location in range(args.locations)
+    }
+    max_output_date = max(
+        df_blackout_events["end_date"].max() for df_blackout_events in events_by_location.values()
+    ).to_pydatetime()
+    event_count = sum(len(df) for df in events_by_location.values())
+    print(f"Locations: {args.locations}, years: {args.years}, events: {event_count}")
+
+    start_time = time.perf_counter()
+    serial_results = {
+        location_name: transform_events_to_daily_records(
+            df_blackout_events,
+            target_tzinfo=target_tzinfo,
+            max_output_date=max_output_date,
+        )
+        for location_name, df_blackout_events in events_by_location.items()
+    }
+    serial_seconds = time.perf_counter() - start_time
+    print(f"Serial:        {serial_seconds:.4f} s")
+
+    start_time = time.perf_counter()
+    parallel_results = transform_events_to_daily_records_by_location(
+        events_by_location,
+        target_tzinfo=target_tzinfo,
+        max_output_date=max_output_date,
+        max_workers=args.workers,
+    )
+    parallel_seconds = time.perf_counter() - start_time
+    print(f"Process pool:  {parallel_seconds:.4f} s (including the worker startup)")
+
+    for location_name, df_serial in serial_results.items():
+        pd.testing.assert_frame_equal(parallel_results[location_name], df_serial)
+    print(f"Results match. Speedup: {serial_seconds / parallel_seconds:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark the memory the app holds per data version, and allocates per session rerun.
+
+The precomputed results are built once per data version and shared by all sessions,
+so their retained size is what every data version costs. A rerun then only reads from them.
+
+Usage: python -m benchmarks.bench_session_memory [--scale 10] [--reruns 20]
+"""
+import argparse
+import tracemalloc
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import pandas as pd
+
+from benchmarks.synthetic import generate_outage_history
+from blackout_stats.aggregates import compute_data_version
+from blackout_stats.data_sources import validate_blackout_events
+from blackout_stats.formatting import format_last_n_blackouts_df
+from blackout_stats.precomputed import PrecomputedResults
+from blackout_stats.precomputed import precompute_results
+from blackout_stats.stats import parse_blackout_events
+
+# The length of the real outage history the app currently shows, with about 1000 events.
+REAL_HISTORY_DAYS = 730
+
+
+def rerun_session(results: PrecomputedResults) -> None:
+    """Read what a rerun of the dashboard reads from the precomputed results."""
+    for year in results.cube.years:
+        results.cube.events_by_year.get(year)
+        results.rolling_stats_by_year[year]
+        format_last_n_blackouts_df(results.event_index, year=year, n=5)
+    format_last_n_blackouts_df(results.event_index, n=5)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scale", type=int, default=10)
+    parser.add_argument("--reruns", type=int, default=20)
+    parser.add_argument("--timezone", default="Europe/Kyiv")
+    args = parser.parse_args()
+
+    # As in the app, see `app.py`.
+    pd.set_option("mode.copy_on_write", True)
+    target_tzinfo = ZoneInfo(args.timezone)
+    df_raw_events = generate_outage_history(
+        end_date=datetime(2025, 10, 1, tzinfo=target_tzinfo),
+        days=REAL_HISTORY_DAYS * args.scale,
+    )
+    df_blackout_events, df_rejected_events = validate_blackout_events(df_raw_events)
+    print(f"Events: {len(df_blackout_events)} ({args.scale}x the real history)")
+
+    df_parsed_events = parse_blackout_events(df_blackout_events, target_tzinfo)
+    dataframe_bytes = df_parsed_events.memory_usage(deep=True).sum()
+    del df_parsed_events
+
+    tracemalloc.start()
+    results = precompute_results(
+        df_blackout_events=df_blackout_events,
+        df_rejected_events=df_rejected_events,
+        data_version=compute_data_version(df_blackout_events),
+        target_tzinfo=target_tzinfo,
+    )
+    retained_bytes, build_peak_bytes = tracemalloc.get_traced_memory()
+    print(f"Precomputed results: {retained_bytes / 2**20:.1f} MiB retained, "
+          f"{build_peak_bytes / 2**20:.1f} MiB peak while building")
+
+    print(f"Events: {results.event_store.records.nbytes / 2**10:.1f} KiB in the store, "
+          f"{dataframe_bytes / 2**10:.1f} KiB as a dataframe")
+
+    tracemalloc.reset_peak()
+    snapshot_before = tracemalloc.take_snapshot()
+    for _ in range(args.reruns):
+        rerun_session(results)
+    _, rerun_peak_bytes = tracemalloc.get_traced_memory()
+    snapshot_after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    allocation_count = sum(
+        max(stat.count_diff, 0) for stat in snapshot_after.compare_to(snapshot_before, "lineno")
+    )
+    print(f"Per rerun: {(rerun_peak_bytes - retained_bytes) / 2**10:.1f} KiB peak above "
+          f"the results, {allocation_count / args.reruns:.0f} live blocks left over")
+
+
+if __name__ == "__main__":
+    main()
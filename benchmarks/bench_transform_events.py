@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Benchmark the daily downtime transform against the original per-day loop.
+
+Usage: python -m benchmarks.bench_transform_events [--years 10] [--outages-per-day 20]
+"""
+import argparse
+import time
+from collections.abc import Callable
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import pandas as pd
+
+from benchmarks.reference import transform_events_to_daily_records_loop
+from benchmarks.synthetic import generate_blackout_events
+from benchmarks.synthetic import generate_outage_history
+from blackout_stats.data_sources import validate_blackout_events
+from blackout_stats.stats import transform_events_to_daily_records
+
+# The length of the realistic, overlapping history to cross-check, in days.
+OVERLAPPING_HISTORY_DAYS = 730
+
+HOURS_PER_DAY = 24.0
+
+
+def time_transform(
+    transform: Callable[..., pd.DataFrame],
+    df_blackout_events: pd.DataFrame,
+    target_tzinfo: ZoneInfo,
+    max_output_date: datetime,
+    repeat: int,
+) -> tuple[float, pd.DataFrame]:
+    """Run the transform several times on fresh copies of the input, return the best time."""
+    best_seconds = float("inf")
+    df_result = pd.DataFrame()
+    for _ in range(repeat):
+        df_input = df_blackout_events.copy()
+        start_time = time.perf_counter()
+        df_result = transform(
+            df_input,
+            target_tzinfo=target_tzinfo,
+            max_output_date=max_output_date,
+        )
+        best_seconds = min(best_seconds, time.perf_counter() - start_time)
+    return best_seconds, df_result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--years", type=int, default=10)
+    parser.add_argument("--outages-per-day", type=int, default=20)
+    parser.add_argument("--timezone", default="Europe/Kyiv")
+    args = parser.parse_args()
+
+    target_tzinfo = ZoneInfo(args.timezone)
+    days = 365 * args.years
+    df_blackout_events = generate_blackout_events(
+        start_date=datetime(2022, 1, 1, tzinfo=target_tzinfo),
+        days=days,
+        outages_per_day=args.outages_per_day,
+    )
+    max_output_date = df_blackout_events["end_date"].max().to_pydatetime()
+    print(f"Events: {len(df_blackout_events)}, days: {days}")
+
+    vectorized_seconds, df_vectorized = time_transform(
+        transform_events_to_daily_records,
+        df_blackout_events,
+        target_tzinfo,
+        max_output_date,
+        repeat=5,
+    )
+    print(f"Vectorized sweep: {vectorized_seconds:.4f} s")
+
+    loop_seconds, df_loop = time_transform(
+        transform_events_to_daily_records_loop,
+        df_blackout_events,
+        target_tzinfo,
+        max_output_date,
+        repeat=1,
+    )
+    print(f"Per-day loop:     {loop_seconds:.4f} s")
+
+    pd.testing.assert_frame_equal(df_vectorized, df_loop.reset_index(drop=True))
+    print(f"Results match. Speedup: {loop_seconds / vectorized_seconds:.0f}x")
+
+    # The realistic history has multi-day outages with rolling blackouts logged over them.
+    df_overlapping_events, _ = validate_blackout_events(generate_outage_history(
+        end_date=datetime(2025, 10, 1, tzinfo=target_tzinfo),
+        days=OVERLAPPING_HISTORY_DAYS,
+    ))
+    max_output_date = df_overlapping_events["end_date"].max().to_pydatetime()
+    _, df_vectorized = time_transform(
+        transform_events_to_daily_records,
+        df_overlapping_events,
+        target_tzinfo,
+        max_output_date,
+        repeat=1,
+    )
+    _, df_loop = time_transform(
+        transform_events_to_daily_records_loop,
+        df_overlapping_events,
+        target_tzinfo,
+        max_output_date,
+        repeat=1,
+    )
+    capped_day_count = compare_with_loop(df_vectorized, df_loop.reset_index(drop=True))
+    print(f"Overlapping events: {len(df_overlapping_events)}. Results match, except for "
+          f"{capped_day_count} fully covered days capped at 24 hours")
+
+
+def compare_with_loop(df_vectorized: pd.DataFrame, df_loop: pd.DataFrame) -> int:
+    """
+    Check that the daily downtime matches the per-day loop on overlapping events.
+
+    The loop adds the blackouts that overlap a fully covered day on top of its 24 hours,
+    while the vectorized sweep caps such days at 24 hours (see `compute_daily_downtime_hours`).
+
+    Returns
+    -------
+    The number of the days that were capped.
+    """
+    is_capped = (
+        (df_vectorized["daily_downtime"] == HOURS_PER_DAY)
+        & (df_loop["daily_downtime"] > HOURS_PER_DAY)
+    )
+    pd.testing.assert_frame_equal(df_vectorized[~is_capped], df_loop[~is_capped])
+    return int(is_capped.sum())
+
+
+if __name__ == "__main__":
+    main()
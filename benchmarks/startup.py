@@ -0,0 +1,34 @@
+"""Measure the import times of modules in a fresh interpreter."""
+import subprocess
+import sys
+
+
+def measure_import_times(module: str, cwd: str | None = None) -> dict[str, int]:
+    """
+    Import a module in a fresh interpreter with `-X importtime`.
+
+    Parameters
+    ----------
+    module
+        The module to import, e.g. "app".
+    cwd
+        The working directory of the interpreter, so that local modules can be imported.
+
+    Returns
+    -------
+    The cumulative import time of every imported module, in microseconds.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=cwd,
+    )
+    import_times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        import_times[name.strip()] = int(cumulative)
+    return import_times
@@ -0,0 +1,91 @@
+"""
+Benchmarks of the app pipeline stages on synthetic histories of growing length.
+
+Usage: make benchmark-suite (compares against the stored baseline)
+"""
+import pandas as pd
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from benchmarks.suite.conftest import HISTORY_END_DATE
+from benchmarks.suite.conftest import TARGET_TZINFO
+from blackout_stats.data_sources import validate_blackout_events
+from blackout_stats.distribution import compute_outage_distribution
+from blackout_stats.formatting import format_last_n_blackouts_df
+from blackout_stats.rolling import compute_rolling_window_statistics
+from blackout_stats.stats import compute_rolling_statistics
+from blackout_stats.stats import transform_events_to_daily_records
+from blackout_stats.summary import DowntimePrefixSums
+from blackout_stats.summary import get_same_period_last_year
+from blackout_stats.visualization import generate_year_calendar_heatmap_plot
+
+
+def test_validate_blackout_events(
+    benchmark: BenchmarkFixture,
+    df_raw_history: pd.DataFrame,
+) -> None:
+    benchmark(validate_blackout_events, df_raw_history)
+
+
+def test_transform_events_to_daily_records(
+    benchmark: BenchmarkFixture,
+    df_history: pd.DataFrame,
+) -> None:
+    benchmark(
+        transform_events_to_daily_records,
+        df_history,
+        target_tzinfo=TARGET_TZINFO,
+        max_output_date=HISTORY_END_DATE,
+    )
+
+
+def test_compute_rolling_statistics(
+    benchmark: BenchmarkFixture,
+    df_daily_downtime: pd.DataFrame,
+) -> None:
+    benchmark(compute_rolling_statistics, df_daily_downtime)
+
+
+def test_compute_rolling_window_statistics(
+    benchmark: BenchmarkFixture,
+    df_daily_downtime: pd.DataFrame,
+) -> None:
+    benchmark(compute_rolling_window_statistics, df_daily_downtime)
+
+
+def test_format_last_n_blackouts_df(
+    benchmark: BenchmarkFixture,
+    df_history: pd.DataFrame,
+) -> None:
+    benchmark(format_last_n_blackouts_df, df_history, year=HISTORY_END_DATE.year, n=5)
+
+
+def test_generate_year_calendar_heatmap_plot(
+    benchmark: BenchmarkFixture,
+    df_daily_downtime: pd.DataFrame,
+) -> None:
+    benchmark(generate_year_calendar_heatmap_plot, df_daily_downtime)
+
+
+def test_summarize_period_with_last_year(
+    benchmark: BenchmarkFixture,
+    df_daily_downtime: pd.DataFrame,
+) -> None:
+    # The prefix sums are built once per data version, and every picked range is a lookup.
+    prefix_sums = DowntimePrefixSums(df_daily_downtime)
+    end_date = prefix_sums.end_date
+    start_date = end_date.replace(day=1)
+
+    def summarize() -> tuple[dict[str, float], dict[str, float]]:
+        return (
+            prefix_sums.summarize(start_date, end_date),
+            prefix_sums.summarize(*get_same_period_last_year(start_date, end_date)),
+        )
+
+    benchmark(summarize)
+
+
+def test_compute_outage_distribution(
+    benchmark: BenchmarkFixture,
+    df_history: pd.DataFrame,
+) -> None:
+    benchmark(compute_outage_distribution, df_history)
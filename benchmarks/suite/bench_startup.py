@@ -0,0 +1,28 @@
+"""
+Benchmark of the app import time, which the viewer waits for before the first header.
+
+Usage: make benchmark-suite (compares against the stored baseline)
+"""
+import os
+import subprocess
+import sys
+
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from benchmarks.startup import measure_import_times
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def import_app() -> None:
+    subprocess.run([sys.executable, "-c", "import app"], check=True, cwd=REPO_DIR)
+
+
+def test_import_app(benchmark: BenchmarkFixture) -> None:
+    benchmark.pedantic(import_app, rounds=5, iterations=1)
+    import_times = measure_import_times("app", cwd=REPO_DIR)
+    benchmark.extra_info["import_milliseconds"] = {
+        module: import_times[module] / 1000
+        for module in ("app", "pandas", "streamlit", "blackout_stats.data_access")
+        if module in import_times
+    }
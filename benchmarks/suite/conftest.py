@@ -0,0 +1,44 @@
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic import generate_outage_history
+from blackout_stats.data_sources import validate_blackout_events
+from blackout_stats.stats import parse_blackout_events
+from blackout_stats.stats import transform_events_to_daily_records
+
+# The length of the real outage history the app currently shows, with about 1000 events.
+REAL_HISTORY_DAYS = 730
+
+# How much longer than the real one the benchmarked histories are.
+HISTORY_SCALES = [1, 10, 100]
+
+TARGET_TZINFO = ZoneInfo("Europe/Kyiv")
+HISTORY_END_DATE = datetime(2025, 10, 1, tzinfo=TARGET_TZINFO)
+
+
+@pytest.fixture(scope="session", params=HISTORY_SCALES, ids=lambda scale: f"{scale}x")
+def df_raw_history(request: pytest.FixtureRequest) -> pd.DataFrame:
+    """Generate an outage history with dirty rows, as it comes from the sheet."""
+    return generate_outage_history(
+        end_date=HISTORY_END_DATE,
+        days=REAL_HISTORY_DAYS * request.param,
+    )
+
+
+@pytest.fixture(scope="session")
+def df_history(df_raw_history: pd.DataFrame) -> pd.DataFrame:
+    """Keep the valid events of the history, with the dates in the target timezone."""
+    df_valid, _ = validate_blackout_events(df_raw_history)
+    return parse_blackout_events(df_valid, TARGET_TZINFO)
+
+
+@pytest.fixture(scope="session")
+def df_daily_downtime(df_history: pd.DataFrame) -> pd.DataFrame:
+    return transform_events_to_daily_records(
+        df_history,
+        target_tzinfo=TARGET_TZINFO,
+        max_output_date=HISTORY_END_DATE,
+    )
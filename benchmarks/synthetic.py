@@ -0,0 +1,174 @@
+"""Seeded generator of synthetic outage histories for benchmarks."""
+from datetime import datetime
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+
+
+def generate_blackout_events(
+    start_date: datetime,
+    days: int,
+    outages_per_day: int,
+    seed: int = 42,
+) -> pd.DataFrame:
+    """
+    Generate a reproducible history of non-overlapping blackout events.
+
+    Parameters
+    ----------
+    start_date
+        TZ-aware date of the first generated day.
+    days
+        The number of days to generate the events for.
+    outages_per_day
+        The number of blackouts per day. Each day is split into that many equal slots,
+        and every slot has one blackout of random position and duration.
+    seed
+        The seed for the random number generator.
+
+    Returns
+    -------
+    Dataframe of blackout events.
+        Schema: {"id": int, "start_date": datetime with TZ, "end_date": datetime with TZ,
+        "duration": timedelta}.
+    """
+    rng = np.random.default_rng(seed)
+    event_count = days * outages_per_day
+    slot_seconds = 86400 // outages_per_day
+
+    slot_starts = np.arange(event_count, dtype=np.int64) * slot_seconds
+    offsets = rng.integers(0, slot_seconds // 2, size=event_count)
+    durations = rng.integers(60, slot_seconds // 2, size=event_count)
+
+    start_seconds = slot_starts + offsets
+    origin = pd.Timestamp(start_date).tz_convert("UTC")
+    start_dates = origin + pd.to_timedelta(start_seconds, unit="s")
+    end_dates = start_dates + pd.to_timedelta(durations, unit="s")
+
+    return pd.DataFrame({
+        "id": np.arange(1, event_count + 1),
+        "start_date": start_dates,
+        "end_date": end_dates,
+        "duration": [timedelta(seconds=int(duration)) for duration in durations],
+    })
+
+
+# Rolling blackout schedules: (hours between the starts of the blocks, block length in hours).
+ROLLING_BLACKOUT_SCHEDULES = [(12, 4), (8, 4), (9, 3)]
+
+# The share of the scheduled blocks that actually happen.
+SCHEDULED_BLOCK_PROBABILITY = 0.85
+
+# The ways a row of the sheet can be wrong.
+DIRT_KINDS = ["duplicate", "missing start", "missing end", "reversed"]
+
+
+def generate_outage_history(
+    end_date: datetime,
+    days: int,
+    seed: int = 42,
+    dirty_fraction: float = 0.01,
+) -> pd.DataFrame:
+    """
+    Generate a reproducible, realistic outage history, as it would come from the sheet.
+
+    The history alternates between calm periods with sporadic outages and periods of
+    rolling blackouts that follow a schedule in local time, with jitter and skipped blocks.
+    On top of that, there are rare multi-day outages that overlap the scheduled ones.
+    The schedule is laid out in local time, so the events cross DST transitions, and the ones
+    scheduled in the skipped hour are shifted forward.
+
+    Some rows are dirty: exact duplicates, rows without a start or an end date,
+    and rows that end before they start.
+
+    Parameters
+    ----------
+    end_date
+        TZ-aware date of the last generated day. Its timezone is used for the schedule.
+    days
+        The number of days to generate the events for, ending with `end_date`.
+    seed
+        The seed for the random number generator.
+    dirty_fraction
+        The share of the dirty rows among all rows.
+
+    Returns
+    -------
+    Dataframe of blackout events, sorted by the start date (dirty rows are mixed in).
+        Schema: {"id": int, "start_date": datetime with TZ, "end_date": datetime with TZ,
+        "duration": timedelta}.
+    """
+    rng = np.random.default_rng(seed)
+    tzinfo = end_date.tzinfo
+    first_day = pd.Timestamp(end_date).tz_localize(None).normalize() - pd.Timedelta(days=days - 1)
+    day_offsets_hours = np.arange(days) * 24.0
+
+    # Split the history into periods of about a month, each calm or following a schedule.
+    period_ids = np.cumsum(rng.random(days) < 1 / 30)
+    period_schedules = rng.integers(-1, len(ROLLING_BLACKOUT_SCHEDULES), size=period_ids[-1] + 1)
+    period_shifts = rng.integers(0, 12, size=period_ids[-1] + 1)
+    day_schedules = period_schedules[period_ids]
+
+    start_parts = []
+    length_parts = []
+
+    # Calm days: a few sporadic outages of random length.
+    calm_days = np.flatnonzero(day_schedules < 0)
+    outage_counts = rng.poisson(0.3, size=len(calm_days))
+    outage_days = np.repeat(calm_days, outage_counts)
+    start_parts.append(day_offsets_hours[outage_days] + rng.uniform(0, 24, len(outage_days)))
+    length_parts.append(rng.exponential(1.5, len(outage_days)) + 0.05)
+
+    # Rolling blackout days: blocks on schedule, some skipped, with jittered start and length.
+    for schedule_index, (period_hours, block_hours) in enumerate(ROLLING_BLACKOUT_SCHEDULES):
+        schedule_days = np.flatnonzero(day_schedules == schedule_index)
+        block_starts = np.arange(0, 24, period_hours)
+        starts = (
+            day_offsets_hours[schedule_days, None]
+            + period_shifts[period_ids[schedule_days], None] % period_hours
+            + block_starts[None, :]
+        ).ravel()
+        starts = starts[rng.random(len(starts)) < SCHEDULED_BLOCK_PROBABILITY]
+        start_parts.append(starts + rng.normal(0, 0.3, len(starts)))
+        length_parts.append(np.clip(rng.normal(block_hours, 0.5, len(starts)), 0.25, None))
+
+    # Multi-day outages, e.g. after the grid has been damaged.
+    multi_day_count = rng.poisson(days / 200)
+    start_parts.append(rng.uniform(0, days * 24.0, multi_day_count))
+    length_parts.append(rng.uniform(24, 96, multi_day_count))
+
+    start_hours = np.concatenate(start_parts)
+    end_hours = start_hours + np.concatenate(length_parts)
+
+    def to_local_dates(hours: np.ndarray) -> pd.DatetimeIndex:
+        # Round to whole minutes, as in the sheet.
+        naive_dates = first_day + pd.to_timedelta(np.round(hours * 60), unit="min")
+        return naive_dates.tz_localize(tzinfo, nonexistent="shift_forward", ambiguous=True)
+
+    df_events = pd.DataFrame({
+        "start_date": to_local_dates(start_hours),
+        "end_date": to_local_dates(end_hours),
+    })
+
+    # Mix in the dirty rows, each next to a random clean one.
+    dirty_count = int(len(df_events) * dirty_fraction)
+    df_dirty = df_events.iloc[rng.integers(0, len(df_events), size=dirty_count)].copy()
+    sort_keys = df_dirty["start_date"].copy()
+    dirt_kinds = rng.choice(DIRT_KINDS, size=dirty_count)
+    df_dirty.loc[dirt_kinds == "missing start", "start_date"] = pd.NaT
+    df_dirty.loc[dirt_kinds == "missing end", "end_date"] = pd.NaT
+    is_reversed = dirt_kinds == "reversed"
+    df_dirty.loc[is_reversed, ["start_date", "end_date"]] = (
+        df_dirty.loc[is_reversed, ["end_date", "start_date"]].to_numpy()
+    )
+
+    df_history = pd.concat([df_events, df_dirty], ignore_index=True)
+    order = np.argsort(
+        pd.concat([df_events["start_date"], sort_keys]).to_numpy(dtype="datetime64[ns]"),
+        kind="stable",
+    )
+    df_history = df_history.iloc[order].reset_index(drop=True)
+    df_history.insert(0, "id", np.arange(1, len(df_history) + 1))
+    df_history["duration"] = df_history["end_date"] - df_history["start_date"]
+    return df_history
@@ -0,0 +1,5 @@
+import sys
+
+from blackout_stats.cli import main
+
+sys.exit(main())
@@ -0,0 +1,132 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from blackout_stats.event_index import EventIndex
+from blackout_stats.stats import compute_summary_statistics
+
+
+@dataclass(frozen=True)
+class DowntimeCube:
+    """Downtime aggregates precomputed for every year, so that switching years is a lookup."""
+
+    # The blackout events that started in each year.
+    events_by_year: dict[int, pd.DataFrame]
+    # Schema: {"date": datetime with TZ, "daily_downtime": float}.
+    daily_downtime_by_year: dict[int, pd.DataFrame]
+    # See `compute_summary_statistics`.
+    summary_stats_by_year: dict[int, dict[str, float]]
+    # Total downtime hours, indexed by year, with one column per month (1-12).
+    df_monthly_downtime: pd.DataFrame
+
+    @property
+    def years(self) -> list[int]:
+        """The years that have any daily downtime records, in ascending order."""
+        return sorted(self.daily_downtime_by_year)
+
+
+def compute_data_version(
+    df_blackout_events: pd.DataFrame,
+    df_rejected_events: pd.DataFrame | None = None,
+) -> str:
+    """
+    Compute a cheap content hash of the blackout events, to use as a cache key.
+
+    Parameters
+    ----------
+    df_blackout_events
+        The dataframe containing the blackout events.
+    df_rejected_events
+        The rejected rows, see `validate_blackout_events`. Pass them whenever the cached results
+        depend on them, e.g. an outage that is still going on is rejected for its missing end date,
+        yet it is shown as the current outage.
+
+    Returns
+    -------
+    Hex string that changes whenever any event (or rejected row) is added, removed or edited.
+    """
+    version = _hash_rows(df_blackout_events)
+    if df_rejected_events is not None:
+        version = f"{version}-{_hash_rows(df_rejected_events)}"
+    return version
+
+
+def _hash_rows(df: pd.DataFrame) -> str:
+    row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    # Weight the row hashes by position so that reordering the rows changes the version too.
+    positions = pd.RangeIndex(1, len(row_hashes) + 1).to_numpy(dtype="uint64")
+    return f"{len(row_hashes):x}-{int((row_hashes * positions).sum()):016x}"
+
+
+def split_rows_by_year(df: pd.DataFrame, years: np.ndarray) -> dict[int, pd.DataFrame]:
+    """
+    Split the rows of a dataframe by year.
+
+    Parameters
+    ----------
+    df
+        The dataframe to split. It is not modified.
+    years
+        The year of every row, e.g. of its date.
+
+    Returns
+    -------
+    The rows of every year, by year. If the years are sorted, the rows of a year are
+        a slice of the dataframe that shares the memory with it, otherwise they are copied.
+    """
+    if np.any(np.diff(years) < 0):
+        return {int(year): df_year for year, df_year in df.groupby(years)}
+    boundaries = np.flatnonzero(np.diff(years)) + 1
+    starts = [0, *boundaries]
+    ends = [*boundaries, len(years)]
+    return {
+        int(years[start]): df.iloc[start:end]
+        for start, end in zip(starts, ends)
+        if start < end
+    }
+
+
+def build_downtime_cube(
+    df_blackout_events: pd.DataFrame,
+    df_daily_downtime: pd.DataFrame,
+    event_index: EventIndex | None = None,
+) -> DowntimeCube:
+    """
+    Split the events and the daily downtime by year and precompute the yearly aggregates.
+
+    Parameters
+    ----------
+    df_blackout_events
+        The dataframe containing the blackout events with parsed, TZ-aware dates.
+    df_daily_downtime
+        The daily downtime records computed from the same events.
+        Expected schema: {"date": datetime with TZ, "daily_downtime": float}.
+    event_index
+        The index over the same events, if it is already built.
+
+    Returns
+    -------
+    The precomputed aggregates.
+    """
+    event_index = event_index or EventIndex(df_blackout_events)
+    events_by_year = {year: event_index.events_in_year(year) for year in event_index.years()}
+    dates = df_daily_downtime["date"].dt
+    daily_downtime_by_year = split_rows_by_year(df_daily_downtime, dates.year.to_numpy())
+    summary_stats_by_year = {
+        year: compute_summary_statistics(df_year)
+        for year, df_year in daily_downtime_by_year.items()
+    }
+    df_monthly_downtime = (
+        df_daily_downtime["daily_downtime"]
+        .groupby([dates.year.rename("year"), dates.month.rename("month")])
+        .sum()
+        .unstack("month")
+        .reindex(columns=range(1, 13))
+    )
+    return DowntimeCube(
+        events_by_year=events_by_year,
+        daily_downtime_by_year=daily_downtime_by_year,
+        summary_stats_by_year=summary_stats_by_year,
+        df_monthly_downtime=df_monthly_downtime,
+    )
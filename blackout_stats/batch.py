@@ -0,0 +1,181 @@
+import multiprocessing
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pandas as pd
+
+from blackout_stats.stats import NAT_INT64
+from blackout_stats.stats import compute_daily_downtime_hours
+from blackout_stats.stats import generate_daily_report_boundaries
+from blackout_stats.stats import get_event_intervals
+from blackout_stats.stats import parse_datetime_column
+
+
+@dataclass(frozen=True)
+class DailyDowntimePartition:
+    """A slice of the daily downtime report of a single location, computed independently."""
+
+    location_name: str
+    year: int
+    # Int64 UTC nanoseconds of the blackouts that overlap the partition, shape (N, 2).
+    intervals: np.ndarray
+    # Int64 UTC nanoseconds of the local midnights around the days of the partition.
+    boundaries: np.ndarray
+
+
+def partition_daily_downtime_report(
+    location_name: str,
+    df_blackout_events: pd.DataFrame,
+    target_tzinfo: ZoneInfo,
+    min_output_date: datetime | None = None,
+    max_output_date: datetime | None = None,
+) -> tuple[pd.DatetimeIndex | None, list[DailyDowntimePartition]]:
+    """
+    Split the daily downtime report of a location into one partition per year.
+
+    The partitions share the day boundaries, so a blackout that spans a new year is passed
+    to both years, and each year counts only its own part of it. The blackouts that are still
+    going on last till the end of the whole report, as in `transform_events_to_daily_records`.
+
+    Parameters
+    ----------
+    location_name
+        The name of the location, to tell the partitions apart.
+    df_blackout_events
+        The dataframe containing the blackout events, see `transform_events_to_daily_records`.
+    target_tzinfo
+        The timezone to use for generating the daily downtime report.
+    min_output_date
+        If specified, excludes any daily downtime records before this date.
+    max_output_date
+        If specified, excludes any daily downtime records after this date.
+
+    Returns
+    -------
+    Tuple of the day boundaries of the whole report (None if it is empty),
+    and the partitions in chronological order.
+    """
+    intervals = get_event_intervals(
+        start_dates=parse_datetime_column(df_blackout_events["start_date"], target_tzinfo),
+        end_dates=parse_datetime_column(df_blackout_events["end_date"], target_tzinfo),
+        open_end=NAT_INT64,
+    )
+    day_boundaries = generate_daily_report_boundaries(
+        intervals,
+        target_tzinfo,
+        min_output_date=min_output_date,
+        max_output_date=max_output_date,
+    )
+    if day_boundaries is None:
+        return None, []
+
+    boundaries = day_boundaries.asi8
+    intervals[intervals[:, 1] == NAT_INT64, 1] = boundaries[-1]
+
+    day_years = day_boundaries[:-1].year.to_numpy()
+    year_starts = np.flatnonzero(np.diff(day_years, prepend=day_years[0] - 1))
+    year_ends = np.append(year_starts[1:], len(day_years))
+    partitions = []
+    for first_day, end_day in zip(year_starts, year_ends):
+        partition_boundaries = boundaries[first_day:end_day + 1]
+        is_relevant = (
+            (intervals[:, 0] < partition_boundaries[-1])
+            & (intervals[:, 1] > partition_boundaries[0])
+        )
+        partitions.append(
+            DailyDowntimePartition(
+                location_name=location_name,
+                year=int(day_years[first_day]),
+                intervals=np.ascontiguousarray(intervals[is_relevant]),
+                boundaries=partition_boundaries.copy(),
+            )
+        )
+    return day_boundaries, partitions
+
+
+def transform_events_to_daily_records_by_location(
+    events_by_location: Mapping[str, pd.DataFrame],
+    target_tzinfo: ZoneInfo,
+    min_output_date: datetime | None = None,
+    max_output_date: datetime | None = None,
+    max_workers: int | None = None,
+) -> dict[str, pd.DataFrame]:
+    """
+    Generate the daily downtime of many locations and years on a process pool.
+
+    The work is partitioned by (location, year). Only the intervals and the day boundaries
+    of a partition are sent to a worker, and only the array of its daily downtime hours
+    is sent back, so no dataframes are pickled. The partitions are reassembled in order,
+    so the result is identical to calling `transform_events_to_daily_records` per location.
+
+    Parameters
+    ----------
+    events_by_location
+        The dataframe containing the blackout events per location name.
+    target_tzinfo
+        The timezone to use for generating the daily downtime report.
+    min_output_date
+        If specified, excludes any daily downtime records before this date.
+    max_output_date
+        If specified, excludes any daily downtime records after this date.
+    max_workers
+        The number of worker processes. Defaults to the number of CPUs.
+        With a single worker, the partitions are computed in the calling process.
+
+    Returns
+    -------
+    The daily downtime dataframe per location name, in the input order.
+    """
+    day_boundaries_by_location = {}
+    partitions: list[DailyDowntimePartition] = []
+    for location_name, df_blackout_events in events_by_location.items():
+        day_boundaries, location_partitions = partition_daily_downtime_report(
+            location_name=location_name,
+            df_blackout_events=df_blackout_events,
+            target_tzinfo=target_tzinfo,
+            min_output_date=min_output_date,
+            max_output_date=max_output_date,
+        )
+        day_boundaries_by_location[location_name] = day_boundaries
+        partitions.extend(location_partitions)
+
+    if max_workers == 1:
+        downtime_hours = [
+            compute_daily_downtime_hours(partition.intervals, partition.boundaries)
+            for partition in partitions
+        ]
+    else:
+        # Spawn the workers, since forking a process with running threads is unsafe.
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            downtime_hours = list(
+                executor.map(
+                    compute_daily_downtime_hours,
+                    [partition.intervals for partition in partitions],
+                    [partition.boundaries for partition in partitions],
+                )
+            )
+
+    hours_by_location: dict[str, list[np.ndarray]] = {name: [] for name in events_by_location}
+    for partition, partition_hours in zip(partitions, downtime_hours):
+        hours_by_location[partition.location_name].append(partition_hours)
+
+    daily_downtime_by_location = {}
+    for location_name, day_boundaries in day_boundaries_by_location.items():
+        if day_boundaries is None:
+            daily_downtime_by_location[location_name] = pd.DataFrame({
+                "date": pd.Series(dtype=pd.DatetimeTZDtype(tz=target_tzinfo)),
+                "daily_downtime": pd.Series(dtype=float),
+            })
+            continue
+        daily_downtime_by_location[location_name] = pd.DataFrame({
+            "date": day_boundaries[:-1],
+            "daily_downtime": np.concatenate(hours_by_location[location_name]),
+        })
+    return daily_downtime_by_location
@@ -0,0 +1,175 @@
+"""
+Headless batch reporter: compute the blackout statistics and write them to files.
+
+Usage: python -m blackout_stats SOURCE --output-dir DIR [--format parquet|csv|json]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from collections.abc import Sequence
+from zoneinfo import ZoneInfo
+
+import pandas as pd
+from bokeh.embed import file_html
+from bokeh.resources import CDN
+
+from blackout_stats.aggregates import compute_data_version
+from blackout_stats.data_sources import BlackoutEventSource
+from blackout_stats.data_sources import CSVEventSource
+from blackout_stats.data_sources import GoogleSheetEventSource
+from blackout_stats.data_sources import ParquetEventSource
+from blackout_stats.precomputed import PrecomputedResults
+from blackout_stats.precomputed import precompute_results
+from blackout_stats.visualization import generate_compact_calendar_heatmap_plot
+
+# The file formats the tables can be written in.
+TABLE_FORMATS = ["parquet", "csv", "json"]
+
+
+def open_event_source(source: str, service_account_path: str | None = None) -> BlackoutEventSource:
+    """
+    Open the blackout event source by its location.
+
+    Parameters
+    ----------
+    source
+        A path to a CSV or a Parquet file, or the URL of a Google Sheet.
+    service_account_path
+        The path to the GCP service account JSON file, required for Google Sheets.
+
+    Returns
+    -------
+    The event source.
+    """
+    if source.startswith(("http://", "https://")):
+        if service_account_path is None:
+            raise ValueError("A GCP service account file is required to read a Google Sheet")
+        with open(service_account_path, encoding="utf-8") as service_account_file:
+            gcp_service_account_info = json.load(service_account_file)
+        return GoogleSheetEventSource(gcp_service_account_info, source)
+
+    extension = os.path.splitext(source)[1].lower()
+    if extension == ".csv":
+        return CSVEventSource(source)
+    if extension in (".parquet", ".pq"):
+        return ParquetEventSource(source)
+    raise ValueError(f"Unsupported event source: {source}")
+
+
+def build_report_tables(results: PrecomputedResults) -> dict[str, pd.DataFrame]:
+    """
+    Build the tables of the batch report.
+
+    Parameters
+    ----------
+    results
+        The precomputed results, see `precompute_results`.
+
+    Returns
+    -------
+    The tables by name:
+        "daily_downtime": {"date": datetime with TZ, "daily_downtime": float},
+        "rolling_downtime": {"date": datetime with TZ, "mean_7d": float, ...},
+        see `compute_rolling_window_statistics`,
+        "summary": one row per year with the summary statistics,
+        see `compute_summary_statistics`.
+    """
+    df_summary = pd.DataFrame.from_dict(results.cube.summary_stats_by_year, orient="index")
+    return {
+        "daily_downtime": results.df_daily_downtime,
+        "rolling_downtime": results.df_rolling_stats.reset_index(),
+        "summary": df_summary.rename_axis("year").reset_index(),
+    }
+
+
+def write_table(df: pd.DataFrame, path: str, table_format: str) -> None:
+    """Write a table to a Parquet, CSV or JSON (records) file."""
+    if table_format == "parquet":
+        df.to_parquet(path, index=False)
+    elif table_format == "csv":
+        df.to_csv(path, index=False)
+    elif table_format == "json":
+        df.to_json(path, orient="records", date_format="iso", indent=2)
+    else:
+        raise ValueError(f"Unsupported table format: {table_format}")
+
+
+def write_report(
+    results: PrecomputedResults,
+    output_dir: str,
+    table_format: str = "parquet",
+) -> list[str]:
+    """
+    Write the report tables and the calendar heatmap of all years to a directory.
+
+    Parameters
+    ----------
+    results
+        The precomputed results, see `precompute_results`.
+    output_dir
+        The directory to write the files to. It is created if it does not exist.
+    table_format
+        The file format of the tables, one of `TABLE_FORMATS`.
+
+    Returns
+    -------
+    The paths of the written files.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    paths = []
+    for table_name, df_table in build_report_tables(results).items():
+        path = os.path.join(output_dir, f"{table_name}.{table_format}")
+        write_table(df_table, path, table_format)
+        paths.append(path)
+
+    if not results.df_daily_downtime.empty:
+        plot = generate_compact_calendar_heatmap_plot(results.df_daily_downtime)
+        path = os.path.join(output_dir, "calendar_heatmap.html")
+        with open(path, "w", encoding="utf-8") as html_file:
+            html_file.write(file_html(plot, CDN, "Календар тривалості відключень"))
+        paths.append(path)
+    return paths
+
+
+def parse_args(args: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="blackout-stats",
+        description="Compute the blackout statistics and write them to files.",
+    )
+    parser.add_argument("source", help="A CSV or Parquet file, or a Google Sheet URL.")
+    parser.add_argument("--output-dir", required=True)
+    parser.add_argument("--format", choices=TABLE_FORMATS, default="parquet")
+    parser.add_argument("--timezone", default="Europe/Kyiv")
+    parser.add_argument(
+        "--service-account",
+        help="The GCP service account JSON file, to read a Google Sheet.",
+    )
+    return parser.parse_args(args)
+
+
+def main(args: Sequence[str] | None = None) -> int:
+    options = parse_args(args)
+    target_tzinfo = ZoneInfo(options.timezone)
+    start_time = time.perf_counter()
+
+    source = open_event_source(options.source, options.service_account)
+    df_blackout_events, df_rejected_events = source.read_all()
+    results = precompute_results(
+        df_blackout_events=df_blackout_events,
+        df_rejected_events=df_rejected_events,
+        data_version=compute_data_version(df_blackout_events, df_rejected_events),
+        target_tzinfo=target_tzinfo,
+    )
+    paths = write_report(results, options.output_dir, options.format)
+
+    elapsed_seconds = time.perf_counter() - start_time
+    print(
+        f"Events: {len(df_blackout_events)}, rejected rows: {len(df_rejected_events)}, "
+        f"days: {len(results.df_daily_downtime)}, {elapsed_seconds:.2f} s",
+        file=sys.stderr,
+    )
+    for path in paths:
+        print(path)
+    return 0
@@ -1,11 +1,27 @@
+import os
+import tempfile
+import time
+from collections.abc import Callable
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from dataclasses import dataclass
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
 from typing import Any
 
 import pandas as pd
-import streamlit as st
-from shillelagh.backends.apsw.db import connect
+import pyarrow as pa
 
+from blackout_stats.data_sources import DEFAULT_CHUNK_SIZE
+from blackout_stats.data_sources import CSVEventSource
+from blackout_stats.data_sources import DBAPIEventSource
+from blackout_stats.data_sources import validate_blackout_events
+from blackout_stats.instrumentation import mark_cache_miss
 
-def read_blackout_events_from_local_file(filename: str) -> pd.DataFrame:
+
+def read_blackout_events_from_local_file(filename: str) -> tuple[pd.DataFrame, pd.DataFrame]:
     """
     Read blackout events from a local CSV file and convert the results to a dataframe.
 
@@ -16,15 +32,174 @@ def read_blackout_events_from_local_file(filename: str) -> pd.DataFrame:
 
     Returns
     -------
-    Dataframe containing the blackout events.
+    Tuple of the valid blackout events and the rejected rows, see `validate_blackout_events`.
+    """
+    return CSVEventSource(filename).read_all()
+
+
+def run_query(connection: Any, query: str) -> pd.DataFrame:
+    """
+    Run the specified query on a DB-API connection and convert the results to a dataframe.
+
+    Parameters
+    ----------
+    connection
+        The DB-API connection, e.g. a shillelagh connection to a Google Sheet.
+    query
+        The SQL query to run.
+
+    Returns
+    -------
+    Dataframe containing the resulting rows as is.
+    """
+    chunks = DBAPIEventSource(connection, query).iter_raw_chunks(DEFAULT_CHUNK_SIZE)
+    return pd.concat(chunks, ignore_index=True)
+
+
+def read_cached_events(cache_path: str, table: str) -> tuple[pd.DataFrame, datetime] | None:
+    """
+    Read the locally cached table rows from an Arrow IPC file.
+
+    The file is memory-mapped, so it is not read into the Arrow buffers first,
+    but the rows are still copied once into the dataframe.
+
+    Parameters
+    ----------
+    cache_path
+        The path to the cache file.
+    table
+        The name of the table (e.g. the Google Sheet URL) the cache is expected to hold.
+
+    Returns
+    -------
+    Tuple of the cached rows and the time of the last full refresh,
+    or None if the cache does not exist, holds another table or is corrupted.
     """
-    return pd.read_csv(filename)
+    if not os.path.exists(cache_path):
+        return None
+
+    try:
+        with pa.memory_map(cache_path, "r") as source:
+            arrow_table = pa.ipc.open_file(source).read_all()
+    except (OSError, pa.ArrowException):
+        # E.g. a truncated file. It is replaced by the next full fetch.
+        return None
+
+    metadata = arrow_table.schema.metadata or {}
+    if metadata.get(b"table", b"").decode() != table or b"last_full_refresh_at" not in metadata:
+        return None
+
+    last_full_refresh_at = datetime.fromisoformat(metadata[b"last_full_refresh_at"].decode())
+    return arrow_table.to_pandas(), last_full_refresh_at
+
+
+def write_cached_events(
+    df: pd.DataFrame,
+    cache_path: str,
+    table: str,
+    last_full_refresh_at: datetime,
+) -> None:
+    """Write the table rows to an uncompressed Arrow IPC file, which is read without decoding."""
+    arrow_table = pa.Table.from_pandas(df, preserve_index=False)
+    arrow_table = arrow_table.replace_schema_metadata({
+        **(arrow_table.schema.metadata or {}),
+        b"table": table.encode(),
+        b"last_full_refresh_at": last_full_refresh_at.isoformat().encode(),
+    })
+
+    # Write to a temporary file first, so that a crash never leaves a half-written cache.
+    # Every writer has its own, since the refresher and the sessions can write at the same time.
+    with tempfile.NamedTemporaryFile(
+        dir=os.path.dirname(os.path.abspath(cache_path)),
+        prefix=f"{os.path.basename(cache_path)}.",
+        suffix=".tmp",
+        delete=False,
+    ) as temp_file:
+        temp_path = temp_file.name
+        try:
+            with pa.ipc.new_file(temp_file, arrow_table.schema) as writer:
+                writer.write_table(arrow_table)
+        except BaseException:
+            temp_file.close()
+            os.remove(temp_path)
+            raise
+    os.replace(temp_path, cache_path)
+
+
+def read_blackout_events_through_local_cache(
+    connection: Any,
+    table: str,
+    cache_path: str,
+    full_refresh_interval: timedelta = timedelta(hours=24),
+    max_refetched_rows: int = 100,
+) -> pd.DataFrame:
+    """
+    Read blackout events through a persistent local cache, fetching only the new rows.
+
+    The rows are expected to have an increasing "id" column. On refresh, only the rows beyond
+    the last cached id are fetched, along with the recent rows without an end date (an ongoing
+    blackout), since those are likely to have been filled in since. Retroactive edits of older
+    rows, as well as the rows without an id, are picked up by a full refresh once in a while.
+
+    Parameters
+    ----------
+    connection
+        The DB-API connection to read the rows from, e.g. a shillelagh connection.
+    table
+        The name of the table to query, e.g. the Google Sheet URL.
+    cache_path
+        The path to the local cache file. It is created if it does not exist.
+    full_refresh_interval
+        How often to re-read the entire table.
+    max_refetched_rows
+        How far back (in ids) to look for the rows without an end date. An older row that
+        is never completed, e.g. because of a data entry error, is not refetched on every refresh.
+
+    Returns
+    -------
+    Dataframe containing all rows of the table.
+    """
+    now = datetime.now(tz=timezone.utc)
+    cached = read_cached_events(cache_path, table)
+
+    if (
+        cached is None
+        or now - cached[1] >= full_refresh_interval
+        or cached[0]["id"].isnull().all()
+    ):
+        df = run_query(connection, f'SELECT * FROM "{table}"')
+        write_cached_events(df, cache_path, table, last_full_refresh_at=now)
+        return df
+
+    df_cached, last_full_refresh_at = cached
+    ids = df_cached["id"]
+    last_id = int(ids.max())
+    is_incomplete = (
+        ids.notnull()
+        & (ids > last_id - max_refetched_rows)
+        & df_cached["start_date"].notnull()
+        & df_cached["end_date"].isnull()
+    )
+    refetch_from_id = int(ids[is_incomplete].min()) if is_incomplete.any() else last_id + 1
+
+    df_fetched = run_query(connection, f'SELECT * FROM "{table}" WHERE id >= {refetch_from_id}')
+    if df_fetched.empty and not is_incomplete.any():
+        return df_cached
+
+    # The rows without an id cannot be fetched by id, so they are kept till the full refresh.
+    df = pd.concat(
+        [df_cached[(ids < refetch_from_id) | ids.isnull()], df_fetched],
+        ignore_index=True,
+    )
+    write_cached_events(df, cache_path, table, last_full_refresh_at=last_full_refresh_at)
+    return df
 
 
 def read_blackout_events_from_google_sheet(
     gcp_service_account_info: dict[str, Any],
     sheet_url: str,
-) -> pd.DataFrame:
+    cache_path: str | None = None,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
     """
     Read blackout events from a Google Sheet and convert the results to a dataframe.
 
@@ -34,34 +209,162 @@ def read_blackout_events_from_google_sheet(
         GCP service account info to access the Google Sheet.
     sheet_url
         URL of the Google Sheet.
+    cache_path
+        If specified, the rows are also cached in this local file,
+        and only the new rows are fetched from the Google Sheet on refresh.
+        See `read_blackout_events_through_local_cache`.
 
     Returns
     -------
-    Dataframe containing the rows from the Google Sheet.
+    Tuple of the valid blackout events and the rejected rows, see `validate_blackout_events`.
     """
+    # Imported here, so that the headless tools can use this module without Streamlit.
+    import streamlit as st
+
     @st.cache_data(ttl=600)
     def query_google_sheet(query: str) -> pd.DataFrame:
         """Run the specified Google Sheets query and convert the results to a dataframe."""
-        cursor = conn.execute(query)
+        mark_cache_miss()
+        return run_query(conn, query)
+
+    @st.cache_data(ttl=600)
+    def query_google_sheet_through_local_cache(sheet_url: str, cache_path: str) -> pd.DataFrame:
+        """Read the Google Sheet through the local cache file."""
+        mark_cache_miss()
+        return read_blackout_events_through_local_cache(conn, sheet_url, cache_path)
+
+    conn = connect_to_google_sheets(gcp_service_account_info)
+
+    if cache_path:
+        df = query_google_sheet_through_local_cache(sheet_url, cache_path)
+    else:
+        query = f'SELECT * from "{sheet_url}"'
+        df = query_google_sheet(query)
+    return validate_blackout_events(df)
+
+
+def fetch_blackout_events_from_google_sheet(
+    gcp_service_account_info: dict[str, Any],
+    sheet_url: str,
+    cache_path: str | None = None,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Read blackout events from a Google Sheet, bypassing the Streamlit cache.
+
+    Same as `read_blackout_events_from_google_sheet`, but always queries the sheet
+    (or only its new rows, if `cache_path` is specified). Meant for background refreshes.
+
+    Parameters
+    ----------
+    gcp_service_account_info
+        GCP service account info to access the Google Sheet.
+    sheet_url
+        URL of the Google Sheet.
+    cache_path
+        If specified, the rows are also cached in this local file,
+        see `read_blackout_events_through_local_cache`.
 
-        # Infer column names.
-        if cursor.description:
-            column_names = [desc[0] for desc in cursor.description]
-        else:
-            # Fall back to assumed column names. This should not happen in normal conditions.
-            # If it does, it means there is something wrong with reading the Google Sheet.
-            column_names = ["id", "start_date", "end_date", "duration"]
+    Returns
+    -------
+    Tuple of the valid blackout events and the rejected rows, see `validate_blackout_events`.
+    """
+    conn = connect_to_google_sheets(gcp_service_account_info)
+    if cache_path:
+        df = read_blackout_events_through_local_cache(conn, sheet_url, cache_path)
+    else:
+        df = run_query(conn, f'SELECT * from "{sheet_url}"')
+    return validate_blackout_events(df)
 
-        rows = cursor.fetchall()
-        return pd.DataFrame(rows, columns=column_names)
 
-    conn = connect(
+def connect_to_google_sheets(gcp_service_account_info: dict[str, Any]) -> Any:
+    """Open a shillelagh connection that can query private Google Sheets."""
+    # Imported on first use: shillelagh and its SQLAlchemy dependencies are slow to import.
+    from shillelagh.backends.apsw.db import connect
+
+    return connect(
         ":memory:",
         adapter_kwargs={"gsheetsapi": {"service_account_info": gcp_service_account_info}},
     )
 
-    query = f'SELECT * from "{sheet_url}"'
-    df = query_google_sheet(query)
-    df = pd.DataFrame(df[(df["start_date"].notnull()) & (df["end_date"].notnull())])
 
-    return df
+@dataclass
+class LocationFetchResult:
+    """The outcome of reading the blackout events of a single location."""
+
+    location_name: str
+    elapsed_seconds: float
+    df_blackout_events: pd.DataFrame | None = None
+    df_rejected_events: pd.DataFrame | None = None
+    error: str | None = None
+
+
+def fetch_location_events(
+    location_name: str,
+    fetch: Callable[[], tuple[pd.DataFrame, pd.DataFrame]],
+) -> LocationFetchResult:
+    """Call the fetch function of a location, capturing its latency and any failure."""
+    start_time = time.perf_counter()
+    try:
+        df_blackout_events, df_rejected_events = fetch()
+    except Exception as e:
+        return LocationFetchResult(
+            location_name=location_name,
+            elapsed_seconds=time.perf_counter() - start_time,
+            error=f"{type(e).__name__}: {e}",
+        )
+    return LocationFetchResult(
+        location_name=location_name,
+        elapsed_seconds=time.perf_counter() - start_time,
+        df_blackout_events=df_blackout_events,
+        df_rejected_events=df_rejected_events,
+    )
+
+
+def read_blackout_events_concurrently(
+    fetchers: Mapping[str, Callable[[], tuple[pd.DataFrame, pd.DataFrame]]],
+    timeout_seconds: float = 30.0,
+    max_workers: int = 8,
+) -> dict[str, LocationFetchResult]:
+    """
+    Read the blackout events of multiple locations concurrently on a thread pool.
+
+    The locations are isolated from each other: a failing location reports its error,
+    and a location that does not respond within the timeout is reported as timed out
+    without blocking the others.
+
+    Parameters
+    ----------
+    fetchers
+        A function per location name that reads its events, e.g. a partial application
+        of `read_blackout_events_from_google_sheet`.
+    timeout_seconds
+        How long to wait for all locations in total.
+    max_workers
+        The maximum number of locations to read at the same time.
+
+    Returns
+    -------
+    The fetch result per location name, in the same order as `fetchers`.
+    """
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="fetch")
+    futures = {
+        location_name: executor.submit(fetch_location_events, location_name, fetch)
+        for location_name, fetch in fetchers.items()
+    }
+    wait(futures.values(), timeout=timeout_seconds)
+
+    # Do not wait for the stragglers: their threads finish in the background.
+    executor.shutdown(wait=False, cancel_futures=True)
+
+    return {
+        location_name: (
+            future.result()
+            if future.done() and not future.cancelled()
+            else LocationFetchResult(
+                location_name=location_name,
+                elapsed_seconds=timeout_seconds,
+                error=f"Timed out after {timeout_seconds:.0f} s",
+            )
+        )
+        for location_name, future in futures.items()
+    }
@@ -0,0 +1,188 @@
+import sqlite3
+from abc import ABC
+from abc import abstractmethod
+from collections.abc import Callable
+from collections.abc import Iterator
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+# The columns every data source provides, in this order.
+BLACKOUT_EVENT_COLUMNS = ["id", "start_date", "end_date", "duration"]
+
+# The number of events to read at a time, unless specified otherwise.
+DEFAULT_CHUNK_SIZE = 10_000
+
+
+def validate_blackout_events(df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Convert raw blackout event rows to a typed dataframe and set the invalid rows aside.
+
+    Parameters
+    ----------
+    df
+        Raw blackout event rows, with any column types (e.g. strings or Python objects).
+        Expected columns: "id", "start_date", "end_date". Other columns are discarded.
+
+    Returns
+    -------
+    Tuple of two dataframes:
+        1. The valid blackout events, i.e. the ones that have both a start and an end date,
+           and do not end before they start.
+           Schema: {"id": Int64, "start_date": datetime64 UTC, "end_date": datetime64 UTC,
+           "duration": timedelta64}.
+           Naive dates are assumed to be in UTC. The duration is always derived from the dates.
+        2. The rejected raw rows, as is, plus a "reason" column that explains the rejection.
+    """
+    start_dates = pd.to_datetime(df["start_date"], utc=True, errors="coerce", format="mixed")
+    end_dates = pd.to_datetime(df["end_date"], utc=True, errors="coerce", format="mixed")
+
+    rejection_conditions = {
+        "missing start date": df["start_date"].isnull(),
+        "invalid start date": start_dates.isnull(),
+        "missing end date": df["end_date"].isnull(),
+        "invalid end date": end_dates.isnull(),
+        "end date before start date": end_dates < start_dates,
+    }
+    reasons = np.select(
+        condlist=[condition.to_numpy() for condition in rejection_conditions.values()],
+        choicelist=list(rejection_conditions),
+        default="",
+    )
+    is_valid = reasons == ""
+
+    df_valid = pd.DataFrame({
+        "id": pd.to_numeric(df["id"], errors="coerce").astype("Int64"),
+        "start_date": start_dates,
+        "end_date": end_dates,
+        "duration": end_dates - start_dates,
+    })
+    df_rejected = df.assign(reason=reasons)
+    return df_valid[is_valid], df_rejected[~is_valid]
+
+
+class BlackoutEventSource(ABC):
+    """A source of blackout events that can be read in typed chunks."""
+
+    @abstractmethod
+    def iter_raw_chunks(self, chunk_size: int) -> Iterator[pd.DataFrame]:
+        """
+        Yield the raw rows of the source in chunks of at most `chunk_size` rows.
+
+        At least one chunk must be yielded, even if it is empty, so that the columns are known.
+        """
+
+    def iter_chunks(
+        self,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        on_rejected: Callable[[pd.DataFrame], None] | None = None,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Yield the blackout events in typed, validated chunks.
+
+        Parameters
+        ----------
+        chunk_size
+            The maximum number of rows to read at a time.
+        on_rejected
+            If specified, is called with the rejected raw rows of every chunk that has any.
+
+        Returns
+        -------
+        Iterator over dataframes with the schema described in `validate_blackout_events`.
+        """
+        for df_chunk in self.iter_raw_chunks(chunk_size):
+            df_valid, df_rejected = validate_blackout_events(df_chunk)
+            if on_rejected is not None and not df_rejected.empty:
+                on_rejected(df_rejected)
+            yield df_valid
+
+    def read_all(self) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Read all blackout events from the source into a single typed dataframe.
+
+        Returns
+        -------
+        Tuple of the valid events and the rejected raw rows, see `validate_blackout_events`.
+        """
+        rejected_chunks: list[pd.DataFrame] = []
+        valid_chunks = list(self.iter_chunks(on_rejected=rejected_chunks.append))
+        df_valid = pd.concat(valid_chunks, ignore_index=True)
+        if not rejected_chunks:
+            return df_valid, pd.DataFrame(columns=[*BLACKOUT_EVENT_COLUMNS, "reason"])
+        return df_valid, pd.concat(rejected_chunks, ignore_index=True)
+
+
+class DBAPIEventSource(BlackoutEventSource):
+    """Blackout events returned by a query on any DB-API connection."""
+
+    def __init__(self, connection: Any, query: str):
+        self.connection = connection
+        self.query = query
+
+    def iter_raw_chunks(self, chunk_size: int) -> Iterator[pd.DataFrame]:
+        # Only the cursor methods are part of PEP 249, connection.execute() is a sqlite3 shortcut.
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(self.query)
+            if cursor.description:
+                column_names = [desc[0] for desc in cursor.description]
+            else:
+                # Fall back to assumed column names. This should not happen in normal conditions.
+                column_names = BLACKOUT_EVENT_COLUMNS
+
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                yield pd.DataFrame(rows, columns=column_names)
+                if len(rows) < chunk_size:
+                    break
+        finally:
+            cursor.close()
+
+
+class GoogleSheetEventSource(DBAPIEventSource):
+    """Blackout events stored in a private Google Sheet, read via a GCP service account."""
+
+    def __init__(self, gcp_service_account_info: dict[str, Any], sheet_url: str):
+        # Imported on first use: shillelagh and its SQLAlchemy dependencies are slow to import.
+        from shillelagh.backends.apsw.db import connect
+
+        connection = connect(
+            ":memory:",
+            adapter_kwargs={"gsheetsapi": {"service_account_info": gcp_service_account_info}},
+        )
+        super().__init__(connection, f'SELECT * FROM "{sheet_url}"')
+
+
+class SQLiteEventSource(DBAPIEventSource):
+    """Blackout events stored in a table of a SQLite database file."""
+
+    def __init__(self, filename: str, table: str = "blackout_events"):
+        super().__init__(sqlite3.connect(filename), f'SELECT * FROM "{table}"')
+
+
+class CSVEventSource(BlackoutEventSource):
+    """Blackout events stored in a CSV file with a header row."""
+
+    def __init__(self, filename: str):
+        self.filename = filename
+
+    def iter_raw_chunks(self, chunk_size: int) -> Iterator[pd.DataFrame]:
+        with pd.read_csv(self.filename, chunksize=chunk_size) as reader:
+            yield from reader
+
+
+class ParquetEventSource(BlackoutEventSource):
+    """Blackout events stored in a Parquet file."""
+
+    def __init__(self, filename: str):
+        self.filename = filename
+
+    def iter_raw_chunks(self, chunk_size: int) -> Iterator[pd.DataFrame]:
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(self.filename)
+        yield parquet_file.schema_arrow.empty_table().to_pandas()
+        for batch in parquet_file.iter_batches(batch_size=chunk_size):
+            yield batch.to_pandas()
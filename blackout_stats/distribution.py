@@ -0,0 +1,236 @@
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from blackout_stats.event_index import OPEN_END_INT64
+from blackout_stats.event_index import EventIndex
+
+# The edges of the histogram bins of the outage durations, in hours.
+OUTAGE_DURATION_BIN_EDGES = (0.0, 1.0, 2.0, 3.0, 4.0, 6.0, 8.0, 12.0, 24.0, np.inf)
+
+# The edges of the histogram bins of the gaps between the outages, in hours.
+UPTIME_GAP_BIN_EDGES = (0.0, 1.0, 2.0, 4.0, 8.0, 12.0, 24.0, 48.0, 72.0, 168.0, np.inf)
+
+# The quantiles of the outage durations and of the gaps to report.
+DISTRIBUTION_QUANTILES = (0.5, 0.75, 0.9, 0.95, 0.99)
+
+# The thresholds (in hours) of the survival curves, i.e. of P(duration > X hours).
+SURVIVAL_CURVE_THRESHOLDS = np.arange(0.0, 48.5, 0.5)
+
+NANOSECONDS_PER_HOUR = 3600 * 10**9
+
+
+@dataclass(frozen=True)
+class OutageDistribution:
+    """The distribution of the outage durations and of the gaps between the outages."""
+
+    # The durations of the finished outages, in hours, in the order of their starts.
+    # Overlapping and adjacent events are merged into a single outage.
+    outage_durations: np.ndarray
+    # The gaps between the consecutive outages, in hours, in chronological order.
+    uptime_gaps: np.ndarray
+    # See `compute_histogram`.
+    df_outage_histogram: pd.DataFrame
+    df_gap_histogram: pd.DataFrame
+    # See `compute_distribution_statistics`, with the columns "outage" and "gap".
+    df_statistics: pd.DataFrame
+    # See `compute_survival_curve`, with the columns "outage" and "gap".
+    df_survival: pd.DataFrame
+
+
+def merge_outage_intervals(starts: np.ndarray, ends: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Merge the overlapping and adjacent outages into continuous runs without power.
+
+    Parameters
+    ----------
+    starts
+        The starts of the outages, int64 UTC nanoseconds, sorted.
+    ends
+        The ends of the outages, with `OPEN_END_INT64` for the ongoing ones.
+
+    Returns
+    -------
+    Tuple of the starts and the ends of the runs, sorted and separated by gaps.
+    A run that includes an ongoing outage ends with `OPEN_END_INT64`, and is the last one.
+    """
+    if not len(starts):
+        return starts, ends
+    # The power comes back only when all the outages that started so far are over.
+    power_on_since = np.maximum.accumulate(ends)
+    is_run_start = np.concatenate([[True], starts[1:] > power_on_since[:-1]])
+    run_first_rows = np.flatnonzero(is_run_start)
+    run_last_rows = np.append(run_first_rows[1:] - 1, len(starts) - 1)
+    return starts[run_first_rows], power_on_since[run_last_rows]
+
+
+def compute_outage_durations(starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """
+    Compute the durations of the finished outages.
+
+    Parameters
+    ----------
+    starts
+        The starts of the outages, int64 UTC nanoseconds, sorted.
+        Overlapping outages are counted separately, unless merged by `merge_outage_intervals`.
+    ends
+        The ends of the outages, with `OPEN_END_INT64` for the ongoing ones.
+
+    Returns
+    -------
+    The durations in hours, in the order of the starts. The ongoing outages are skipped.
+    """
+    is_finished = ends != OPEN_END_INT64
+    return (ends[is_finished] - starts[is_finished]) / NANOSECONDS_PER_HOUR
+
+
+def compute_uptime_gaps(starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """
+    Compute the gaps between the consecutive outages, i.e. how long the power stayed on.
+
+    Parameters
+    ----------
+    starts
+        The starts of the runs without power, int64 UTC nanoseconds,
+        see `merge_outage_intervals`.
+    ends
+        The ends of the runs, with `OPEN_END_INT64` for the ongoing one.
+
+    Returns
+    -------
+    The gaps in hours, in chronological order. Nothing follows an outage that is still going on.
+    """
+    return (starts[1:] - ends[:-1]) / NANOSECONDS_PER_HOUR
+
+
+def compute_histogram(values: np.ndarray, bin_edges: Sequence[float]) -> pd.DataFrame:
+    """
+    Count the values in the histogram bins.
+
+    Parameters
+    ----------
+    values
+        The values, e.g. the outage durations in hours.
+    bin_edges
+        The ascending edges of the bins. Each bin includes its start and excludes its end.
+
+    Returns
+    -------
+    Dataframe indexed by the start of the bin ("bin_start"),
+    with the end of the bin ("bin_end"), the number of values ("count"),
+    and their share of all values ("share", 0..1, or NaN if there are no values).
+    """
+    edges = np.asarray(bin_edges, dtype=float)
+    bin_indexes = np.searchsorted(edges, values, side="right") - 1
+    is_binned = (bin_indexes >= 0) & (bin_indexes < len(edges) - 1)
+    counts = np.bincount(bin_indexes[is_binned], minlength=len(edges) - 1)
+    total_count = counts.sum()
+    return pd.DataFrame(
+        {
+            "bin_end": edges[1:],
+            "count": counts,
+            "share": counts / total_count if total_count else np.full(len(counts), np.nan),
+        },
+        index=pd.Index(edges[:-1], name="bin_start"),
+    )
+
+
+def compute_distribution_statistics(
+    values: np.ndarray,
+    quantiles: Sequence[float] = DISTRIBUTION_QUANTILES,
+) -> pd.Series:
+    """
+    Compute the summary statistics of a distribution.
+
+    Parameters
+    ----------
+    values
+        The values, e.g. the outage durations in hours.
+    quantiles
+        The quantiles to compute (0..1), with linear interpolation.
+
+    Returns
+    -------
+    Series with the number of values ("count"), the mean ("mean"), the quantiles
+    (e.g. "p50" for the median) and the maximum ("max"). All but "count" are NaN without values.
+    """
+    quantile_names = [f"p{quantile * 100:g}" for quantile in quantiles]
+    if not len(values):
+        statistics = dict.fromkeys(["mean", *quantile_names, "max"], np.nan)
+        return pd.Series({"count": 0.0, **statistics})
+    return pd.Series({
+        "count": float(len(values)),
+        "mean": float(np.mean(values)),
+        **dict(zip(quantile_names, np.quantile(values, quantiles))),
+        "max": float(np.max(values)),
+    })
+
+
+def compute_survival_curve(
+    values: np.ndarray,
+    thresholds: np.ndarray = SURVIVAL_CURVE_THRESHOLDS,
+) -> pd.Series:
+    """
+    Compute the share of the values that exceed every threshold, e.g. P(outage > X hours).
+
+    Parameters
+    ----------
+    values
+        The values, e.g. the outage durations in hours.
+    thresholds
+        The ascending thresholds, in the same units as the values.
+
+    Returns
+    -------
+    Series indexed by the threshold ("hours"), with the share of the values
+    greater than it (0..1, or NaN if there are no values).
+    """
+    sorted_values = np.sort(values)
+    exceeding_counts = len(sorted_values) - np.searchsorted(sorted_values, thresholds, side="right")
+    probabilities = exceeding_counts / len(sorted_values) if len(sorted_values) else np.nan
+    return pd.Series(
+        probabilities,
+        index=pd.Index(thresholds, name="hours"),
+        dtype=float,
+    )
+
+
+def compute_outage_distribution(df_blackout_events: pd.DataFrame) -> OutageDistribution:
+    """
+    Compute the distribution of the outage durations and of the gaps between them.
+
+    To analyze a year or any other window, pass only its events, e.g. from `EventIndex`.
+
+    Parameters
+    ----------
+    df_blackout_events
+        The dataframe containing the blackout events with parsed, TZ-aware dates,
+        see `parse_blackout_events`. It is not modified.
+
+    Returns
+    -------
+    The outage distribution.
+    """
+    # The index sorts the events by the start, and marks the ongoing ones.
+    event_index = EventIndex(df_blackout_events)
+    # Both the durations and the gaps are measured between the same merged runs,
+    # so that an outage recorded as several overlapping rows is counted once.
+    run_starts, run_ends = merge_outage_intervals(event_index.starts, event_index.ends)
+    outage_durations = compute_outage_durations(run_starts, run_ends)
+    uptime_gaps = compute_uptime_gaps(run_starts, run_ends)
+    return OutageDistribution(
+        outage_durations=outage_durations,
+        uptime_gaps=uptime_gaps,
+        df_outage_histogram=compute_histogram(outage_durations, OUTAGE_DURATION_BIN_EDGES),
+        df_gap_histogram=compute_histogram(uptime_gaps, UPTIME_GAP_BIN_EDGES),
+        df_statistics=pd.DataFrame({
+            "outage": compute_distribution_statistics(outage_durations),
+            "gap": compute_distribution_statistics(uptime_gaps),
+        }),
+        df_survival=pd.DataFrame({
+            "outage": compute_survival_curve(outage_durations),
+            "gap": compute_survival_curve(uptime_gaps),
+        }),
+    )
@@ -0,0 +1,155 @@
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from blackout_stats.event_store import EventStore
+from blackout_stats.stats import NAT_INT64
+
+# The end of the blackouts that are still ongoing, so that they overlap any later range.
+OPEN_END_INT64 = np.iinfo(np.int64).max
+
+
+class EventIndex:
+    """
+    An index over the blackout events for fast time range queries.
+
+    The events are sorted by the start date once. A query then finds its range of rows with
+    a binary search over the sorted starts, instead of scanning the whole dataframe.
+    To find the events that overlap a time range, the running maximum of the end dates
+    bounds how far back an event that is still going on could have started.
+    """
+
+    def __init__(self, blackout_events: pd.DataFrame | EventStore):
+        """
+        Build the index.
+
+        Parameters
+        ----------
+        blackout_events
+            The dataframe containing the blackout events with parsed, TZ-aware dates,
+            see `parse_blackout_events`, or the store of the events. It is not modified.
+            Events without a start date are not indexed, and events without an end date
+            are treated as ongoing.
+        """
+        if isinstance(blackout_events, EventStore):
+            # The store is already sorted, and its dataframe view shares its memory.
+            self.tzinfo = blackout_events.tzinfo
+            self.df_blackout_events = blackout_events.to_dataframe()
+            self.starts = blackout_events.starts
+            self.ends = blackout_events.ends
+        else:
+            starts = blackout_events["start_date"].array.asi8
+            order = np.argsort(starts, kind="stable")
+            order = order[starts[order] != NAT_INT64]
+
+            self.tzinfo = blackout_events["start_date"].dt.tz
+            if np.array_equal(order, np.arange(len(starts))):
+                # Already sorted, so the rows are not copied.
+                self.df_blackout_events = blackout_events
+                self.starts = starts
+                self.ends = blackout_events["end_date"].array.asi8
+            else:
+                self.df_blackout_events = blackout_events.iloc[order]
+                self.starts = starts[order]
+                self.ends = blackout_events["end_date"].array.asi8[order]
+        self.ends = np.where(self.ends == NAT_INT64, OPEN_END_INT64, self.ends)
+        self._running_max_ends = np.maximum.accumulate(self.ends)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def _to_int64(self, date: datetime) -> int:
+        timestamp = pd.Timestamp(date)
+        if timestamp.tzinfo is None:
+            timestamp = timestamp.tz_localize(self.tzinfo)
+        return timestamp.as_unit("ns").value
+
+    def events_overlapping(self, start: datetime, end: datetime) -> pd.DataFrame:
+        """
+        Get the events that overlap a time range, in the order of their start dates.
+
+        The cost is O(log n + k), where k is the number of candidate events between the first
+        event that could still be going on at the start of the range and the last one that
+        starts before its end. Unless a very long event covers the whole range, these are
+        exactly the events that overlap it.
+
+        Parameters
+        ----------
+        start
+            The start of the range. Naive dates are assumed to be in the timezone of the events.
+        end
+            The end of the range (exclusive).
+
+        Returns
+        -------
+        The overlapping events, i.e. the ones that end after the start of the range
+        and start before its end.
+        """
+        start_value = self._to_int64(start)
+        first = int(np.searchsorted(self._running_max_ends, start_value, side="right"))
+        last = int(np.searchsorted(self.starts, self._to_int64(end), side="left"))
+        if first >= last:
+            return self.df_blackout_events.iloc[:0]
+        is_overlapping = self.ends[first:last] > start_value
+        if is_overlapping.all():
+            return self.df_blackout_events.iloc[first:last]
+        return self.df_blackout_events.iloc[first:last][is_overlapping]
+
+    def events_starting_between(self, start: datetime, end: datetime) -> pd.DataFrame:
+        """
+        Get the events that start within a time range, in the order of their start dates.
+
+        Parameters
+        ----------
+        start
+            The start of the range. Naive dates are assumed to be in the timezone of the events.
+        end
+            The end of the range (exclusive).
+
+        Returns
+        -------
+        The events that start at or after the start of the range and before its end.
+        """
+        first, last = np.searchsorted(
+            self.starts,
+            [self._to_int64(start), self._to_int64(end)],
+            side="left",
+        )
+        return self.df_blackout_events.iloc[first:last]
+
+    def events_in_year(self, year: int) -> pd.DataFrame:
+        """Get the events that started in a year, in the timezone of the events."""
+        return self.events_starting_between(datetime(year, 1, 1), datetime(year + 1, 1, 1))
+
+    def last_n(self, n: int, before: datetime | None = None) -> pd.DataFrame:
+        """
+        Get the N most recent events, in the order of their start dates.
+
+        Parameters
+        ----------
+        n
+            The maximum number of events to get.
+        before
+            If specified, only considers the events that started before this date.
+            Naive dates are assumed to be in the timezone of the events.
+
+        Returns
+        -------
+        At most N events that started last.
+        """
+        last = len(self.starts)
+        if before is not None:
+            last = int(np.searchsorted(self.starts, self._to_int64(before), side="left"))
+        return self.df_blackout_events.iloc[max(last - n, 0):last]
+
+    def years(self) -> list[int]:
+        """Get the years in which any event started, in ascending order."""
+        if not len(self.starts):
+            return []
+        first_year = pd.Timestamp(self.starts[0], tz="UTC").tz_convert(self.tzinfo).year
+        last_year = pd.Timestamp(self.starts[-1], tz="UTC").tz_convert(self.tzinfo).year
+        return [
+            year for year in range(first_year, last_year + 1)
+            if len(self.events_in_year(year))
+        ]
@@ -0,0 +1,133 @@
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pandas as pd
+
+from blackout_stats.stats import NAT_INT64
+from blackout_stats.stats import parse_datetime_column
+
+# The layout of a blackout event in the store: 24 bytes, with the dates in UTC nanoseconds.
+EVENT_RECORD_DTYPE = np.dtype([("id", np.int64), ("start", np.int64), ("end", np.int64)])
+
+# The int64 representation of a missing event ID.
+MISSING_ID = np.iinfo(np.int64).min
+
+
+class EventStore:
+    """
+    A compact, read-only store of blackout events.
+
+    The events are held in a single NumPy structured array of int64 IDs, starts and ends,
+    sorted by the start, instead of a dataframe of nullable, TZ-aware and timedelta columns.
+    The slices of the store, its columns and its dataframe view share the same memory,
+    and the array is read-only, so the store can be shared without defensive copies.
+    """
+
+    __slots__ = ("records", "tzinfo")
+
+    def __init__(self, records: np.ndarray, target_tzinfo: ZoneInfo):
+        """
+        Wrap the event records.
+
+        Parameters
+        ----------
+        records
+            The structured array of `EVENT_RECORD_DTYPE`, sorted by the start.
+            It is made read-only, without copying.
+        target_tzinfo
+            The timezone of the dates in the dataframe view.
+        """
+        records.flags.writeable = False
+        self.records = records
+        self.tzinfo = target_tzinfo
+
+    @classmethod
+    def from_dataframe(
+        cls,
+        df_blackout_events: pd.DataFrame,
+        target_tzinfo: ZoneInfo | None = None,
+    ) -> "EventStore":
+        """
+        Build the store from a dataframe of blackout events.
+
+        Parameters
+        ----------
+        df_blackout_events
+            The dataframe containing the blackout events. It is not modified.
+            Expected schema: {"id": int, "start_date": datetime, "end_date": datetime, ...}.
+            Events without a start date are skipped, and the other columns are discarded.
+        target_tzinfo
+            The timezone of the dates. Defaults to the timezone of the start dates,
+            which must then be TZ-aware (see `parse_blackout_events`).
+
+        Returns
+        -------
+        The store.
+        """
+        if target_tzinfo is None:
+            target_tzinfo = df_blackout_events["start_date"].dt.tz
+        starts = parse_datetime_column(df_blackout_events["start_date"], target_tzinfo).array.asi8
+        ends = parse_datetime_column(df_blackout_events["end_date"], target_tzinfo).array.asi8
+        order = np.argsort(starts, kind="stable")
+        order = order[starts[order] != NAT_INT64]
+
+        records = np.empty(len(order), dtype=EVENT_RECORD_DTYPE)
+        records["id"] = (
+            df_blackout_events["id"]
+            .to_numpy(dtype=np.int64, na_value=MISSING_ID)[order]
+        )
+        records["start"] = starts[order]
+        records["end"] = ends[order]
+        return cls(records, target_tzinfo)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __getitem__(self, rows: slice) -> "EventStore":
+        """Get a range of the events, as a store that shares the memory with this one."""
+        return EventStore(self.records[rows], self.tzinfo)
+
+    @property
+    def ids(self) -> np.ndarray:
+        """The event IDs, with `MISSING_ID` for the missing ones (a read-only view)."""
+        return self.records["id"]
+
+    @property
+    def starts(self) -> np.ndarray:
+        """The starts of the events, in int64 UTC nanoseconds (a read-only view)."""
+        return self.records["start"]
+
+    @property
+    def ends(self) -> np.ndarray:
+        """The ends of the events, with `NAT_INT64` for the ongoing ones (a read-only view)."""
+        return self.records["end"]
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Get a dataframe view of the events, in the order of their starts.
+
+        The IDs and the dates share the memory with the store. Only the null mask of the IDs
+        and the durations are computed.
+
+        Returns
+        -------
+        Dataframe with the schema of `validate_blackout_events`, with the dates
+        in the timezone of the store.
+        """
+        return pd.DataFrame(
+            {
+                "id": pd.arrays.IntegerArray(self.ids, self.ids == MISSING_ID),
+                "start_date": self._to_datetime_series(self.starts),
+                "end_date": self._to_datetime_series(self.ends),
+                "duration": pd.Series(
+                    np.where(self.ends == NAT_INT64, NAT_INT64, self.ends - self.starts),
+                    copy=False,
+                ).astype("timedelta64[ns]", copy=False),
+            },
+            copy=False,
+        )
+
+    def _to_datetime_series(self, values: np.ndarray) -> pd.Series:
+        # Casting the int64 nanoseconds to a UTC dtype reinterprets them without copying.
+        utc_dates = pd.Series(values, copy=False).astype("datetime64[ns, UTC]", copy=False)
+        return pd.Series(utc_dates.array.tz_convert(self.tzinfo), copy=False)
@@ -2,6 +2,18 @@ from datetime import timedelta
 
 import pandas as pd
 
+from blackout_stats.event_index import EventIndex
+from blackout_stats.rolling import parse_rolling_quantile
+
+# The display names of the rolling statistics, see `compute_rolling_window_statistics`.
+ROLLING_AGGREGATION_LABELS = {
+    "sum": "Сума",
+    "mean": "Середнє",
+    "min": "Мінімум",
+    "max": "Максимум",
+    "median": "Медіана",
+}
+
 
 def format_human_readable_summary_stats_df(
     summary_stats: dict[str, float],
@@ -55,6 +67,159 @@ def format_human_readable_summary_stats_df(
     return df
 
 
+def format_period_summary_df(
+    summary_by_period: dict[str, dict[str, float]],
+    summary_last_year_by_period: dict[str, dict[str, float]],
+) -> pd.DataFrame:
+    """
+    Given the summaries of several periods, format them for display as a dataframe.
+
+    Parameters
+    ----------
+    summary_by_period
+        The summary of every period by its display name, see `DowntimePrefixSums.summarize`.
+    summary_last_year_by_period
+        The summary of the same periods one year earlier.
+
+    Returns
+    -------
+    The formatted dataframe, one row per period.
+    """
+    records = []
+    for period_name, summary in summary_by_period.items():
+        last_year_downtime = summary_last_year_by_period[period_name]["total_downtime"]
+        records.append({
+            "Період": period_name,
+            "Усього (годин)": summary["total_downtime"],
+            "В середньому за день (годин)": summary["avg_downtime"],
+            "Рік тому (годин)": last_year_downtime,
+            "Різниця (годин)": summary["total_downtime"] - last_year_downtime,
+        })
+    return pd.DataFrame.from_records(records)
+
+
+def format_location_ranking_df(
+    df_ranking: pd.DataFrame,
+    include_recent_n_days_stats: bool = True,
+) -> pd.DataFrame:
+    """
+    Given the computed location ranking, format it for display as a dataframe.
+
+    Parameters
+    ----------
+    df_ranking
+        The location ranking, as returned by `compute_location_ranking`.
+    include_recent_n_days_stats
+        Whether to include the stats for the most recent N days.
+        This makes sense only when displaying the current year.
+
+    Returns
+    -------
+    The formatted dataframe.
+    """
+    column_names = {
+        "total_downtime": "Усього (годин)",
+        "avg_downtime": "В середньому за день (годин)",
+    }
+    if include_recent_n_days_stats:
+        column_names.update({
+            "last_7_days_downtime": "За останні 7 днів (годин)",
+            "last_30_days_downtime": "За останні 30 днів (годин)",
+        })
+
+    df = df_ranking[list(column_names)].rename(columns=column_names)
+    df.index.name = "Локація"
+    return df
+
+
+# The display names of the distributions, see `compute_outage_distribution`.
+DISTRIBUTION_LABELS = {"outage": "Відключення", "gap": "Світло є"}
+
+# The display names of the distribution statistics, see `compute_distribution_statistics`.
+DISTRIBUTION_STATISTIC_LABELS = {
+    "count": "Кількість",
+    "mean": "Середнє (годин)",
+    "p50": "Медіана (годин)",
+    "max": "Найдовше (годин)",
+}
+
+
+def format_rolling_aggregation_label(aggregation: str) -> str:
+    """Format the name of a rolling statistic for display, e.g. "p90" as "90-й перцентиль"."""
+    if aggregation in ROLLING_AGGREGATION_LABELS:
+        return ROLLING_AGGREGATION_LABELS[aggregation]
+    quantile = parse_rolling_quantile(aggregation)
+    if quantile is None:
+        raise ValueError(f"Unsupported rolling aggregation: {aggregation}")
+    return f"{quantile * 100:g}-й перцентиль"
+
+
+def format_rolling_statistics_df(df_rolling_stats: pd.DataFrame, aggregation: str) -> pd.DataFrame:
+    """
+    Given the computed rolling statistics, select one aggregation for display as a chart.
+
+    Parameters
+    ----------
+    df_rolling_stats
+        The rolling statistics, as returned by `compute_rolling_window_statistics`.
+    aggregation
+        The aggregation to display, e.g. "mean".
+
+    Returns
+    -------
+    The formatted dataframe indexed by date, with one column per window, e.g. "7 днів".
+    """
+    prefix = f"{aggregation}_"
+    column_names = {
+        column: f"{column.removeprefix(prefix).removesuffix('d')} днів"
+        for column in df_rolling_stats.columns
+        if column.startswith(prefix)
+    }
+    return df_rolling_stats[list(column_names)].rename(columns=column_names)
+
+
+def format_outage_distribution_statistics_df(df_statistics: pd.DataFrame) -> pd.DataFrame:
+    """
+    Given the statistics of the outage distribution, format them for display as a dataframe.
+
+    Parameters
+    ----------
+    df_statistics
+        The statistics, as in `OutageDistribution.df_statistics`.
+
+    Returns
+    -------
+    The formatted dataframe, one row per statistic, with one column per distribution.
+    """
+    labels = [
+        DISTRIBUTION_STATISTIC_LABELS.get(statistic)
+        or f"{format_rolling_aggregation_label(statistic)} (годин)"
+        for statistic in df_statistics.index
+    ]
+    df = df_statistics.rename(columns=DISTRIBUTION_LABELS)
+    df.insert(0, "Показник", labels)
+    return df.reset_index(drop=True)
+
+
+def format_survival_curves_df(df_survival: pd.DataFrame) -> pd.DataFrame:
+    """
+    Given the survival curves of the outage distribution, format them for display as a chart.
+
+    Parameters
+    ----------
+    df_survival
+        The survival curves, as in `OutageDistribution.df_survival`.
+
+    Returns
+    -------
+    The formatted dataframe indexed by the hours, with the chance (%) of lasting longer
+    in one column per distribution.
+    """
+    df = df_survival.rename(columns=DISTRIBUTION_LABELS) * 100
+    df.index.name = "Годин"
+    return df
+
+
 def format_timedelta(delta: timedelta) -> str:
     """Format a duration (timedelta) object for display."""
     total_seconds = delta.total_seconds()
@@ -65,7 +230,7 @@ def format_timedelta(delta: timedelta) -> str:
 
 
 def format_last_n_blackouts_df(
-    df_blackout_events: pd.DataFrame,
+    blackout_events: pd.DataFrame | EventIndex,
     year: int | None = None,
     n: int = 5
 ) -> pd.DataFrame:
@@ -74,8 +239,9 @@ def format_last_n_blackouts_df(
 
     Parameters
     ----------
-    df_blackout_events
-        The dataframe containing the blackout events.
+    blackout_events
+        The dataframe containing the blackout events, or the index over them. It is not modified.
+        Pass the index when formatting repeatedly, so that the events are not scanned again.
     year
         If specified, will only consider the blackouts that occurred in this year.
     n
@@ -83,31 +249,25 @@ def format_last_n_blackouts_df(
 
     Returns
     -------
-    The formatted dataframe.
+    A new formatted dataframe.
     """
+    if not isinstance(blackout_events, EventIndex):
+        blackout_events = EventIndex(blackout_events)
+
     # Filter by specific year (if specified).
     if year is not None:
-        df_blackout_events = df_blackout_events[df_blackout_events["start_date"].dt.year == year]
-
-    df_last_n_blackouts = pd.DataFrame(df_blackout_events.tail(n))
+        df_last_n_blackouts = blackout_events.events_in_year(year).tail(n)
+    else:
+        df_last_n_blackouts = blackout_events.last_n(n)
 
-    # Leave only the time part in the duration.
-    df_last_n_blackouts["duration"] = df_last_n_blackouts["duration"].map(format_timedelta)
-
-    # Strip the timezone info from the dates.
-    df_last_n_blackouts["start_date"] = df_last_n_blackouts["start_date"].dt.tz_localize(None)
-    df_last_n_blackouts["end_date"] = df_last_n_blackouts["end_date"].dt.tz_localize(None)
-
-    # Rename the original columns to be human-readable.
-    df_last_n_blackouts.rename(
-        columns={
-            "id": "№",
-            "start_date": "Коли зникло",
-            "end_date": "Коли з’явилося",
-            "duration": "Тривалість",
+    # Build a new, human-readable frame instead of modifying the events, which may be shared.
+    return pd.DataFrame(
+        {
+            # Strip the timezone info from the dates.
+            "Коли зникло": df_last_n_blackouts["start_date"].dt.tz_localize(None).array,
+            "Коли з’явилося": df_last_n_blackouts["end_date"].dt.tz_localize(None).array,
+            # Leave only the time part in the duration.
+            "Тривалість": df_last_n_blackouts["duration"].map(format_timedelta).array,
         },
-        inplace=True,
+        index=pd.Index(df_last_n_blackouts["id"], name="№"),
     )
-    df_last_n_blackouts.set_index("№", inplace=True)
-
-    return df_last_n_blackouts
@@ -0,0 +1,284 @@
+import os
+import pickle
+import tempfile
+from dataclasses import dataclass
+from datetime import date
+from datetime import datetime
+from datetime import timedelta
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pandas as pd
+
+from blackout_stats.stats import NAT_INT64
+from blackout_stats.stats import parse_blackout_events
+from blackout_stats.stats import transform_events_to_daily_records
+
+# Bump this whenever the layout of the persisted state changes.
+STATE_FORMAT_VERSION = 1
+
+
+@dataclass
+class DailyDowntimeState:
+    """Daily downtime records persisted between runs, plus what is needed to update them."""
+
+    format_version: int
+    timezone_name: str
+    # UTC nanoseconds. Days starting from this instant are recomputed on every update.
+    watermark: int
+    # Schema: {"date": datetime with TZ, "daily_downtime": float}.
+    df_daily_downtime: pd.DataFrame
+    # Schema: {"fingerprint": uint64, "start_date": int64 UTC ns, "end_date": int64 UTC ns}.
+    df_event_fingerprints: pd.DataFrame
+
+
+def compute_event_fingerprints(df_blackout_events: pd.DataFrame) -> pd.DataFrame:
+    """
+    Compute a cheap content fingerprint of every event.
+
+    Parameters
+    ----------
+    df_blackout_events
+        The dataframe containing the blackout events with parsed, TZ-aware dates.
+
+    Returns
+    -------
+    Fingerprint dataframe.
+        Schema: {"fingerprint": uint64, "start_date": int64 UTC ns, "end_date": int64 UTC ns}.
+        Missing dates are represented by NAT_INT64.
+    """
+    df_dates = pd.DataFrame({
+        "start_date": df_blackout_events["start_date"].to_numpy(dtype="datetime64[ns]").view("i8"),
+        "end_date": df_blackout_events["end_date"].to_numpy(dtype="datetime64[ns]").view("i8"),
+    })
+    fingerprints = pd.util.hash_pandas_object(df_dates, index=False).to_numpy()
+    return df_dates.assign(fingerprint=fingerprints)[["fingerprint", "start_date", "end_date"]]
+
+
+def compute_watermark(df_event_fingerprints: pd.DataFrame) -> int:
+    """
+    Find the instant after which the daily downtime can still change without any edits.
+
+    That is the end of the last closed event, or the start of the earliest open-ended event,
+    whichever comes first.
+    """
+    starts = df_event_fingerprints["start_date"].to_numpy()
+    ends = df_event_fingerprints["end_date"].to_numpy()
+    is_open = (ends == NAT_INT64) & (starts != NAT_INT64)
+
+    watermark = ends.max() if len(ends) else NAT_INT64
+    if is_open.any():
+        watermark = min(watermark, starts[is_open].min())
+    return int(watermark)
+
+
+def load_daily_downtime_state(state_path: str) -> DailyDowntimeState | None:
+    """Load the persisted state, or return None if it does not exist, is outdated or corrupted."""
+    if not os.path.exists(state_path):
+        return None
+    try:
+        state = pd.read_pickle(state_path)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, ValueError):
+        # E.g. a truncated file, or a state pickled by a version without the same classes.
+        return None
+    if not isinstance(state, DailyDowntimeState) or state.format_version != STATE_FORMAT_VERSION:
+        return None
+    return state
+
+
+def save_daily_downtime_state(state: DailyDowntimeState, state_path: str) -> None:
+    """
+    Persist the state atomically, so that a crash never leaves a half-written file.
+
+    Every writer uses its own temporary file next to the state, so that concurrent writers
+    never interleave; the last one to finish wins.
+    """
+    with tempfile.NamedTemporaryFile(
+        dir=os.path.dirname(os.path.abspath(state_path)),
+        prefix=f"{os.path.basename(state_path)}.",
+        suffix=".tmp",
+        delete=False,
+    ) as temp_file:
+        temp_path = temp_file.name
+        try:
+            pd.to_pickle(state, temp_file)
+        except BaseException:
+            temp_file.close()
+            os.remove(temp_path)
+            raise
+    os.replace(temp_path, state_path)
+
+
+def find_dirty_day_ranges(
+    state: DailyDowntimeState,
+    df_event_fingerprints: pd.DataFrame,
+    target_tzinfo: ZoneInfo,
+    max_date: date,
+) -> list[tuple[date, date]]:
+    """
+    Find the day ranges that have to be recomputed after the events have changed.
+
+    Parameters
+    ----------
+    state
+        The previously persisted state.
+    df_event_fingerprints
+        The fingerprints of the current events.
+    target_tzinfo
+        The timezone of the daily downtime report.
+    max_date
+        The last day of the report.
+
+    Returns
+    -------
+    Sorted, non-overlapping list of inclusive (first day, last day) ranges.
+    """
+    # Events whose fingerprint occurs a different number of times were added, edited or removed.
+    # Both the old and the new version of an edited event make their days dirty.
+    old_counts = state.df_event_fingerprints["fingerprint"].value_counts()
+    new_counts = df_event_fingerprints["fingerprint"].value_counts()
+    count_diff = new_counts.sub(old_counts, fill_value=0)
+    changed_fingerprints = count_diff.index[count_diff != 0]
+
+    df_changed_events = pd.concat([
+        state.df_event_fingerprints[
+            state.df_event_fingerprints["fingerprint"].isin(changed_fingerprints)
+        ],
+        df_event_fingerprints[df_event_fingerprints["fingerprint"].isin(changed_fingerprints)],
+    ])
+
+    # Events without a start date do not contribute to any day.
+    # Events without an end date affect everything till the end of the report.
+    df_changed_events = df_changed_events[df_changed_events["start_date"] != NAT_INT64]
+    starts = df_changed_events["start_date"].to_numpy()
+    ends = df_changed_events["end_date"].to_numpy()
+
+    def to_local_days(instants: np.ndarray) -> np.ndarray:
+        return pd.DatetimeIndex(instants, tz="UTC").tz_convert(target_tzinfo).date
+
+    day_ranges = [
+        (first_day, max_date if end == NAT_INT64 else last_day)
+        for first_day, last_day, end in zip(to_local_days(starts), to_local_days(ends), ends)
+    ]
+
+    # Everything after the watermark could have changed even without any edits.
+    # The days after the end of the stored report have never been computed, e.g. if the previous
+    # report ended before the watermark, so they are recomputed as well.
+    open_range_start = to_local_days(np.array([state.watermark]))[0]
+    stored_dates = state.df_daily_downtime["date"]
+    if len(stored_dates):
+        open_range_start = min(open_range_start, stored_dates.max().date() + timedelta(days=1))
+    day_ranges.append((open_range_start, max_date))
+
+    # The report may have to be extended backwards if an earlier event has been added,
+    # or computed from scratch if the stored report has no days at all.
+    valid_starts = df_event_fingerprints["start_date"]
+    valid_starts = valid_starts[valid_starts != NAT_INT64]
+    if len(valid_starts):
+        first_event_day = to_local_days(np.array([valid_starts.min()]))[0]
+        if not len(stored_dates):
+            day_ranges.append((first_event_day, max_date))
+        elif first_event_day < stored_dates.min().date():
+            day_ranges.append((first_event_day, stored_dates.min().date()))
+
+    # Merge the overlapping and adjacent ranges.
+    merged_ranges: list[tuple[date, date]] = []
+    for first_day, last_day in sorted(day_ranges):
+        if merged_ranges and first_day.toordinal() <= merged_ranges[-1][1].toordinal() + 1:
+            merged_ranges[-1] = (merged_ranges[-1][0], max(merged_ranges[-1][1], last_day))
+        else:
+            merged_ranges.append((first_day, last_day))
+    return merged_ranges
+
+
+def transform_events_to_daily_records_incrementally(
+    df_blackout_events: pd.DataFrame,
+    target_tzinfo: ZoneInfo,
+    state_path: str,
+    max_output_date: datetime | None = None,
+) -> pd.DataFrame:
+    """
+    Generate a daily downtime dataframe, recomputing only the days touched by changed events.
+
+    The daily records computed by the previous call are persisted in a local file, together with
+    a content fingerprint of every event and a watermark. On the next call, only the days
+    touched by new, edited or removed events, and the days after the watermark, are recomputed.
+    The result is the same as the one of `transform_events_to_daily_records`.
+
+    Parameters
+    ----------
+    df_blackout_events
+        The dataframe containing the blackout events. It is not modified.
+        Expected schema: {"id": int, "start_date": datetime with TZ, "end_date": datetime with TZ}.
+    target_tzinfo
+        The timezone to use for generating the daily downtime report.
+    state_path
+        The path to the file that holds the persisted state.
+        It is created if it does not exist, and discarded if it was computed for another timezone.
+    max_output_date
+        If specified, excludes any daily downtime records after this date.
+
+    Returns
+    -------
+    Daily downtime dataframe.
+        Schema: {"date": datetime with TZ, "daily_downtime": float}.
+    """
+    df = parse_blackout_events(df_blackout_events, target_tzinfo)
+    max_date = max_output_date or datetime.now(tz=target_tzinfo)
+    df_event_fingerprints = compute_event_fingerprints(df)
+
+    state = load_daily_downtime_state(state_path)
+    is_state_usable = (
+        state is not None
+        and state.timezone_name == str(target_tzinfo)
+        and state.watermark != NAT_INT64
+        and df["start_date"].notnull().any()
+    )
+    if state is None or not is_state_usable:
+        df_daily_downtime = transform_events_to_daily_records(
+            df_blackout_events=df,
+            target_tzinfo=target_tzinfo,
+            max_output_date=max_date,
+        )
+    else:
+        dirty_day_ranges = find_dirty_day_ranges(
+            state=state,
+            df_event_fingerprints=df_event_fingerprints,
+            target_tzinfo=target_tzinfo,
+            max_date=max_date.date(),
+        )
+        stored_days = state.df_daily_downtime["date"].dt.date
+        is_dirty = np.zeros(len(stored_days), dtype=bool)
+        recomputed_parts = []
+        for first_day, last_day in dirty_day_ranges:
+            is_dirty |= (stored_days >= first_day).to_numpy() & (stored_days <= last_day).to_numpy()
+            recomputed_parts.append(
+                transform_events_to_daily_records(
+                    df_blackout_events=df,
+                    target_tzinfo=target_tzinfo,
+                    min_output_date=datetime.combine(first_day, datetime.min.time()),
+                    max_output_date=datetime.combine(last_day, datetime.min.time()),
+                )
+            )
+
+        # Trim the report to the current first event and the last requested day.
+        df_daily_downtime = pd.concat([state.df_daily_downtime[~is_dirty], *recomputed_parts])
+        report_days = df_daily_downtime["date"].dt.date
+        is_in_report = (
+            (report_days >= df["start_date"].min().date())
+            & (report_days <= max_date.date())
+        )
+        df_daily_downtime = (
+            df_daily_downtime[is_in_report].sort_values(by="date").reset_index(drop=True)
+        )
+
+    new_state = DailyDowntimeState(
+        format_version=STATE_FORMAT_VERSION,
+        timezone_name=str(target_tzinfo),
+        watermark=compute_watermark(df_event_fingerprints),
+        df_daily_downtime=df_daily_downtime,
+        df_event_fingerprints=df_event_fingerprints,
+    )
+    save_daily_downtime_state(new_state, state_path)
+
+    return df_daily_downtime
@@ -0,0 +1,175 @@
+import json
+import os
+import time
+import uuid
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict
+from dataclasses import dataclass
+from datetime import datetime
+from datetime import timezone
+from typing import Any
+from typing import TypeVar
+
+import pandas as pd
+
+T = TypeVar("T")
+
+# The stage being measured in the current thread, so that cached functions can report misses.
+_current_stage_record: ContextVar["StageRecord | None"] = ContextVar(
+    "current_stage_record",
+    default=None,
+)
+
+
+@dataclass
+class StageRecord:
+    """Measurements of a single pipeline stage during a single app run."""
+
+    run_id: str
+    stage: str
+    # ISO 8601, UTC.
+    started_at: str
+    wall_seconds: float = 0.0
+    # The number of rows the stage produced, if it produced a dataframe.
+    rows: int | None = None
+    # None if the stage is not cached.
+    cache_hit: bool | None = None
+    # The change of the resident set size of the process. None if it cannot be measured.
+    memory_delta_bytes: int | None = None
+
+
+def get_current_rss_bytes() -> int | None:
+    """Get the resident set size of the current process, or None if it is not available."""
+    try:
+        with open("/proc/self/statm") as statm_file:
+            resident_pages = int(statm_file.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return resident_pages * os.sysconf("SC_PAGE_SIZE")
+
+
+def count_rows(result: Any) -> int | None:
+    """Count the rows of a stage result: a dataframe, or a tuple that starts with one."""
+    if isinstance(result, tuple) and result:
+        result = result[0]
+    if isinstance(result, pd.DataFrame | pd.Series):
+        return len(result)
+    return None
+
+
+def mark_cache_miss() -> None:
+    """
+    Report that the cached function being called has to compute its result.
+
+    Call this from the body of a cached function: the body only runs on a cache miss.
+    Does nothing if no cached stage is being measured.
+    """
+    record = _current_stage_record.get()
+    if record is not None and record.cache_hit is not None:
+        record.cache_hit = False
+
+
+class StageRecorder:
+    """Collects the measurements of the pipeline stages of a single app run."""
+
+    def __init__(self, run_id: str | None = None):
+        self.run_id = run_id or uuid.uuid4().hex[:12]
+        self.records: list[StageRecord] = []
+
+    @contextmanager
+    def measure(self, stage: str, cached: bool = False) -> Iterator[StageRecord]:
+        """
+        Measure the wall time and the memory delta of the code block.
+
+        Parameters
+        ----------
+        stage
+            The name of the stage.
+        cached
+            Whether the stage calls a cached function. If so, the stage counts as a cache hit
+            unless the function calls `mark_cache_miss`.
+
+        Returns
+        -------
+        The record of the stage, where the block can fill in the row count.
+        """
+        record = StageRecord(
+            run_id=self.run_id,
+            stage=stage,
+            started_at=datetime.now(tz=timezone.utc).isoformat(),
+            cache_hit=True if cached else None,
+        )
+        self.records.append(record)
+        token = _current_stage_record.set(record)
+        rss_before = get_current_rss_bytes()
+        start_time = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record.wall_seconds = time.perf_counter() - start_time
+            rss_after = get_current_rss_bytes()
+            if rss_before is not None and rss_after is not None:
+                record.memory_delta_bytes = rss_after - rss_before
+            _current_stage_record.reset(token)
+
+    def call(
+        self,
+        stage: str,
+        func: Callable[..., T],
+        *args: Any,
+        cached: bool = False,
+        **kwargs: Any,
+    ) -> T:
+        """Call the function as a measured stage, counting the rows of its result."""
+        with self.measure(stage, cached=cached) as record:
+            result = func(*args, **kwargs)
+            record.rows = count_rows(result)
+        return result
+
+    def to_json_lines(self) -> str:
+        """Serialize the records as JSON lines, one record per line."""
+        return "".join(
+            json.dumps(asdict(record), ensure_ascii=False) + "\n" for record in self.records
+        )
+
+    def append_to_file(self, path: str) -> None:
+        """Append the records to a JSON lines file, e.g. to collect them across reruns."""
+        with open(path, "a", encoding="utf-8") as log_file:
+            log_file.write(self.to_json_lines())
+
+
+def summarize_stage_timings(records: Iterable[StageRecord]) -> pd.DataFrame:
+    """
+    Summarize the stage measurements collected across multiple runs.
+
+    Parameters
+    ----------
+    records
+        The stage records of any number of runs.
+
+    Returns
+    -------
+    Dataframe indexed by the stage, in the order of the first occurrence, with the columns:
+    "runs", "p50_ms", "p95_ms", "max_ms", "cache_hit_rate", "last_rows".
+    """
+    df_records = pd.DataFrame([asdict(record) for record in records])
+    if df_records.empty:
+        return pd.DataFrame(
+            columns=["runs", "p50_ms", "p95_ms", "max_ms", "cache_hit_rate", "last_rows"],
+        )
+
+    df_records["wall_ms"] = df_records["wall_seconds"] * 1000
+    df_records["cache_hit"] = df_records["cache_hit"].astype(float)
+    grouped = df_records.groupby("stage", sort=False)
+    return pd.DataFrame({
+        "runs": grouped["run_id"].nunique(),
+        "p50_ms": grouped["wall_ms"].median(),
+        "p95_ms": grouped["wall_ms"].quantile(0.95),
+        "max_ms": grouped["wall_ms"].max(),
+        "cache_hit_rate": grouped["cache_hit"].mean(),
+        "last_rows": grouped["rows"].last(),
+    })
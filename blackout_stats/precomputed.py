@@ -0,0 +1,334 @@
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from collections.abc import Hashable
+from concurrent.futures import Future
+from dataclasses import dataclass
+from datetime import datetime
+from datetime import timezone
+from typing import Generic
+from typing import TypeVar
+from zoneinfo import ZoneInfo
+
+import pandas as pd
+
+from blackout_stats.aggregates import DowntimeCube
+from blackout_stats.aggregates import build_downtime_cube
+from blackout_stats.aggregates import split_rows_by_year
+from blackout_stats.distribution import OutageDistribution
+from blackout_stats.distribution import compute_outage_distribution
+from blackout_stats.event_index import EventIndex
+from blackout_stats.event_store import EventStore
+from blackout_stats.incremental import transform_events_to_daily_records_incrementally
+from blackout_stats.rolling import compute_rolling_window_statistics
+from blackout_stats.stats import compute_hour_of_day_downtime_profile
+from blackout_stats.stats import parse_blackout_events
+from blackout_stats.stats import transform_events_to_bucket_records
+from blackout_stats.stats import transform_events_to_daily_records
+from blackout_stats.summary import DowntimePrefixSums
+from blackout_stats.timeline import OutageTimeline
+from blackout_stats.timeline import build_outage_timeline
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class PrecomputedResults:
+    """
+    Everything the dashboard shows, computed once per data version.
+
+    The results are shared by all sessions, so they must never be modified. The per-year
+    frames are views over the whole ones, and the events are a view over the read-only store.
+    """
+
+    data_version: str
+    timezone_name: str
+    built_at: datetime
+    # The valid events, sorted by the start date, in a compact read-only store.
+    event_store: EventStore
+    # The dataframe view of the store, with the dates in the target timezone.
+    df_blackout_events: pd.DataFrame
+    df_rejected_events: pd.DataFrame
+    # The index over the valid events, for the time range queries.
+    event_index: EventIndex
+    # The power state over time, including the blackout that is still going on, if any.
+    outage_timeline: OutageTimeline
+    # Schema: {"date": datetime with TZ, "daily_downtime": float}.
+    df_daily_downtime: pd.DataFrame
+    cube: DowntimeCube
+    # To summarize any range of days, e.g. the one the viewer picks.
+    downtime_prefix_sums: DowntimePrefixSums
+    # See `compute_rolling_window_statistics`. The windows span the previous years as well.
+    df_rolling_stats: pd.DataFrame
+    rolling_stats_by_year: dict[int, pd.DataFrame]
+    # See `compute_hour_of_day_downtime_profile`.
+    hour_of_day_profile_by_year: dict[int, pd.DataFrame]
+    # The outages that started in each year, see `compute_outage_distribution`.
+    outage_distribution_by_year: dict[int, OutageDistribution]
+
+
+def precompute_results(
+    df_blackout_events: pd.DataFrame,
+    df_rejected_events: pd.DataFrame,
+    data_version: str,
+    target_tzinfo: ZoneInfo,
+    daily_downtime_state_path: str | None = None,
+) -> PrecomputedResults:
+    """
+    Run the whole dashboard pipeline for all years at once.
+
+    Parameters
+    ----------
+    df_blackout_events
+        The valid blackout events, see `validate_blackout_events`.
+    df_rejected_events
+        The rejected rows, see `validate_blackout_events`.
+    data_version
+        The version of the events, see `compute_data_version`.
+    target_tzinfo
+        The timezone to use for the daily and hourly reports.
+    daily_downtime_state_path
+        If specified, the daily downtime is updated incrementally,
+        see `transform_events_to_daily_records_incrementally`.
+
+    Returns
+    -------
+    The precomputed results.
+    """
+    df_blackout_events = parse_blackout_events(df_blackout_events, target_tzinfo)
+    if daily_downtime_state_path:
+        df_daily_downtime = transform_events_to_daily_records_incrementally(
+            df_blackout_events=df_blackout_events,
+            target_tzinfo=target_tzinfo,
+            state_path=daily_downtime_state_path,
+        )
+    else:
+        df_daily_downtime = transform_events_to_daily_records(
+            df_blackout_events=df_blackout_events,
+            target_tzinfo=target_tzinfo,
+        )
+
+    return precompute_results_from_daily_downtime(
+        df_blackout_events=df_blackout_events,
+        df_rejected_events=df_rejected_events,
+        df_daily_downtime=df_daily_downtime,
+        data_version=data_version,
+        target_tzinfo=target_tzinfo,
+    )
+
+
+def precompute_results_from_daily_downtime(
+    df_blackout_events: pd.DataFrame,
+    df_rejected_events: pd.DataFrame,
+    df_daily_downtime: pd.DataFrame,
+    data_version: str,
+    target_tzinfo: ZoneInfo,
+) -> PrecomputedResults:
+    """
+    Run the rest of the dashboard pipeline on the daily downtime that is already computed.
+
+    Parameters
+    ----------
+    df_blackout_events
+        The valid blackout events, see `validate_blackout_events`.
+    df_rejected_events
+        The rejected rows, see `validate_blackout_events`.
+    df_daily_downtime
+        The daily downtime computed from the same events, e.g. by `OutageLogStream`.
+    data_version
+        The version of the events.
+    target_tzinfo
+        The timezone of the daily downtime report.
+
+    Returns
+    -------
+    The precomputed results.
+    """
+    # The events are held once, in the compact store, and the dataframe is its view.
+    return _precompute_results_from_store(
+        event_store=EventStore.from_dataframe(df_blackout_events, target_tzinfo),
+        df_rejected_events=df_rejected_events,
+        df_daily_downtime=df_daily_downtime,
+        data_version=data_version,
+        previous_results=None,
+    )
+
+
+def update_precomputed_results(
+    previous_results: PrecomputedResults,
+    df_blackout_events: pd.DataFrame,
+    df_rejected_events: pd.DataFrame,
+    df_daily_downtime: pd.DataFrame,
+    data_version: str,
+) -> PrecomputedResults:
+    """
+    Run the pipeline like `precompute_results_from_daily_downtime`, reusing the unchanged years.
+
+    The hourly profile and the outage distribution of a year are the costliest results,
+    so they are only computed again for the years whose events or daily downtime differ
+    from the previous results, e.g. only the current year when new events are appended.
+
+    Parameters
+    ----------
+    previous_results
+        The results to reuse, in the timezone of the new ones. They are not modified.
+    df_blackout_events
+        The valid blackout events, see `validate_blackout_events`.
+    df_rejected_events
+        The rejected rows, see `validate_blackout_events`.
+    df_daily_downtime
+        The daily downtime computed from the same events, e.g. by `OutageLogStream`.
+    data_version
+        The version of the events.
+
+    Returns
+    -------
+    The precomputed results.
+    """
+    target_tzinfo = ZoneInfo(previous_results.timezone_name)
+    return _precompute_results_from_store(
+        event_store=EventStore.from_dataframe(df_blackout_events, target_tzinfo),
+        df_rejected_events=df_rejected_events,
+        df_daily_downtime=df_daily_downtime,
+        data_version=data_version,
+        previous_results=previous_results,
+    )
+
+
+def _precompute_results_from_store(
+    event_store: EventStore,
+    df_rejected_events: pd.DataFrame,
+    df_daily_downtime: pd.DataFrame,
+    data_version: str,
+    previous_results: PrecomputedResults | None,
+) -> PrecomputedResults:
+    target_tzinfo = event_store.tzinfo
+    event_index = EventIndex(event_store)
+    df_blackout_events = event_index.df_blackout_events
+    cube = build_downtime_cube(df_blackout_events, df_daily_downtime, event_index)
+    df_rolling_stats = compute_rolling_window_statistics(df_daily_downtime)
+    rolling_stats_by_year = split_rows_by_year(
+        df_rolling_stats,
+        df_rolling_stats.index.year.to_numpy(),
+    )
+
+    hour_of_day_profile_by_year = {}
+    for year, df_year in cube.daily_downtime_by_year.items():
+        # Only the events that overlap the year contribute to its hourly report,
+        # including the ones that started in the previous year.
+        year_start = df_year["date"].min()
+        year_end = df_year["date"].max() + pd.DateOffset(days=1)
+        df_year_events = event_index.events_overlapping(year_start, year_end)
+        if (
+            previous_results is not None
+            and year in previous_results.hour_of_day_profile_by_year
+            and df_year.equals(previous_results.cube.daily_downtime_by_year.get(year))
+            and df_year_events.equals(
+                previous_results.event_index.events_overlapping(year_start, year_end)
+            )
+        ):
+            hour_of_day_profile_by_year[year] = previous_results.hour_of_day_profile_by_year[year]
+            continue
+        hour_of_day_profile_by_year[year] = compute_hour_of_day_downtime_profile(
+            transform_events_to_bucket_records(
+                df_blackout_events=df_year_events,
+                target_tzinfo=target_tzinfo,
+                freq="1h",
+                min_output_date=year_start,
+                max_output_date=df_year["date"].max(),
+            )
+        )
+
+    outage_distribution_by_year = {}
+    for year, df_year_events in cube.events_by_year.items():
+        if (
+            previous_results is not None
+            and year in previous_results.outage_distribution_by_year
+            and df_year_events.equals(previous_results.cube.events_by_year.get(year))
+        ):
+            outage_distribution_by_year[year] = previous_results.outage_distribution_by_year[year]
+            continue
+        outage_distribution_by_year[year] = compute_outage_distribution(df_year_events)
+
+    return PrecomputedResults(
+        data_version=data_version,
+        timezone_name=str(target_tzinfo),
+        built_at=datetime.now(tz=timezone.utc),
+        event_store=event_store,
+        df_blackout_events=df_blackout_events,
+        df_rejected_events=df_rejected_events,
+        event_index=event_index,
+        outage_timeline=build_outage_timeline(df_blackout_events, df_rejected_events),
+        df_daily_downtime=df_daily_downtime,
+        cube=cube,
+        downtime_prefix_sums=DowntimePrefixSums(df_daily_downtime),
+        df_rolling_stats=df_rolling_stats,
+        rolling_stats_by_year=rolling_stats_by_year,
+        hour_of_day_profile_by_year=hour_of_day_profile_by_year,
+        outage_distribution_by_year=outage_distribution_by_year,
+    )
+
+
+class SharedResultStore(Generic[T]):
+    """
+    A thread-safe store of results that are built once per key and shared by all callers.
+
+    Builds are single-flight: while a result is being built, the other callers that ask
+    for the same key wait for it instead of building it again. A failed build is not stored,
+    and its error is raised to every caller that waited for it.
+    """
+
+    def __init__(self, max_entries: int = 2):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._results: OrderedDict[Hashable, T] = OrderedDict()
+        self._builds_in_flight: dict[Hashable, Future[T]] = {}
+
+    def get_or_build(self, key: Hashable, build: Callable[[], T]) -> T:
+        """
+        Get the result for the key, building it if it is not stored yet.
+
+        Parameters
+        ----------
+        key
+            The key of the result, e.g. the data version and the timezone.
+        build
+            The function that builds the result. It is called at most once at a time per key.
+
+        Returns
+        -------
+        The shared result.
+        """
+        with self._lock:
+            if key in self._results:
+                self._results.move_to_end(key)
+                return self._results[key]
+            build_future = self._builds_in_flight.get(key)
+            is_builder = build_future is None
+            if build_future is None:
+                build_future = Future()
+                self._builds_in_flight[key] = build_future
+
+        if not is_builder:
+            return build_future.result()
+
+        try:
+            result = build()
+        except BaseException as e:
+            with self._lock:
+                del self._builds_in_flight[key]
+            build_future.set_exception(e)
+            raise
+
+        with self._lock:
+            self._results[key] = result
+            while len(self._results) > self.max_entries:
+                self._results.popitem(last=False)
+            del self._builds_in_flight[key]
+        build_future.set_result(result)
+        return result
+
+    def get_latest(self) -> T | None:
+        """Get the most recently built or requested result, or None if there is none yet."""
+        with self._lock:
+            return next(reversed(self._results.values()), None)
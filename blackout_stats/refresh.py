@@ -0,0 +1,139 @@
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from dataclasses import replace
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from typing import Generic
+from typing import TypeVar
+from typing import cast
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class RefreshStatus:
+    """The state of the background refresh, as shown to the viewers."""
+
+    # When the current snapshot was loaded. None if no refresh has succeeded yet.
+    last_success_at: datetime | None = None
+    # When the last refresh started, whether it succeeded or not.
+    last_attempt_at: datetime | None = None
+    is_refreshing: bool = False
+    # The error of the last refresh, if it failed. The previous snapshot is still served.
+    last_error: str | None = None
+
+
+class BackgroundRefresher(Generic[T]):
+    """
+    Keeps a snapshot of the data fresh on a background thread (stale-while-revalidate).
+
+    The snapshot is reloaded on a schedule, or right away when `request_refresh` is called.
+    Readers always get the last good snapshot immediately; they only wait when there is none
+    yet. A failed refresh keeps the previous snapshot and is retried on schedule.
+    """
+
+    def __init__(
+        self,
+        refresh: Callable[[], T],
+        interval: timedelta,
+        name: str = "background-refresh",
+    ):
+        self.interval = interval
+        self._refresh = refresh
+        self._condition = threading.Condition()
+        self._snapshot: T | None = None
+        self._has_snapshot = False
+        self._status = RefreshStatus()
+        self._wake_up = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+
+    @property
+    def status(self) -> RefreshStatus:
+        with self._condition:
+            return self._status
+
+    def start(self) -> None:
+        """Start refreshing on the background thread, beginning with an immediate refresh."""
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop the background thread after the refresh in progress, if any."""
+        self._stopped.set()
+        self._wake_up.set()
+        self._thread.join(timeout)
+
+    def request_refresh(self) -> None:
+        """Refresh as soon as possible, without waiting for the schedule."""
+        self._wake_up.set()
+
+    def get_snapshot(self, timeout: float | None = None) -> T:
+        """
+        Get the last good snapshot, waiting only if none has been loaded yet.
+
+        Parameters
+        ----------
+        timeout
+            How long to wait for the first snapshot, in seconds. By default, waits indefinitely.
+
+        Returns
+        -------
+        The last good snapshot.
+
+        Raises
+        ------
+        RuntimeError
+            If there is no snapshot yet and the last refresh has failed.
+        TimeoutError
+            If there is no snapshot yet and the first refresh has not finished in time.
+        """
+        with self._condition:
+            is_settled = self._condition.wait_for(
+                lambda: self._has_snapshot or self._status.last_error is not None,
+                timeout=timeout,
+            )
+            if not is_settled:
+                raise TimeoutError("The data has not been loaded yet")
+            if not self._has_snapshot:
+                raise RuntimeError(f"Could not load the data: {self._status.last_error}")
+            return cast(T, self._snapshot)
+
+    def refresh_now(self) -> None:
+        """Reload the snapshot on the calling thread. Errors are recorded in the status."""
+        with self._condition:
+            self._status = replace(
+                self._status,
+                is_refreshing=True,
+                last_attempt_at=datetime.now(tz=timezone.utc),
+            )
+
+        try:
+            snapshot = self._refresh()
+        except Exception as e:
+            with self._condition:
+                self._status = replace(
+                    self._status,
+                    is_refreshing=False,
+                    last_error=f"{type(e).__name__}: {e}",
+                )
+                self._condition.notify_all()
+            return
+
+        with self._condition:
+            self._snapshot = snapshot
+            self._has_snapshot = True
+            self._status = replace(
+                self._status,
+                is_refreshing=False,
+                last_success_at=datetime.now(tz=timezone.utc),
+                last_error=None,
+            )
+            self._condition.notify_all()
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            self.refresh_now()
+            self._wake_up.wait(self.interval.total_seconds())
+            self._wake_up.clear()
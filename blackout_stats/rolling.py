@@ -0,0 +1,204 @@
+import re
+from collections.abc import Sequence
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+# The window lengths (in days) the dashboard shows side by side.
+DEFAULT_ROLLING_WINDOWS = (7, 30, 90)
+
+# The aggregations the dashboard shows for every window.
+DEFAULT_ROLLING_AGGREGATIONS = ("mean", "median", "max", "p90")
+
+# The aggregations computed from the prefix sums, in O(1) per day.
+PREFIX_SUM_AGGREGATIONS = ("sum", "mean")
+
+# The aggregations computed from the running extremes of the window blocks, in O(1) per day.
+EXTREME_AGGREGATIONS: dict[str, np.ufunc] = {"max": np.maximum, "min": np.minimum}
+
+# How many window values the order statistics sort at a time, to bound the memory use.
+ORDER_STATISTICS_CHUNK_SIZE = 2**20
+
+
+def parse_rolling_quantile(aggregation: str) -> float | None:
+    """
+    Parse the quantile of an order statistic aggregation.
+
+    Parameters
+    ----------
+    aggregation
+        The aggregation name, e.g. "median" or "p90" (the 90th percentile).
+
+    Returns
+    -------
+    The quantile (0..1), or None if the aggregation is not an order statistic.
+    """
+    if aggregation == "median":
+        return 0.5
+    match = re.fullmatch(r"p(\d{1,2}(\.\d+)?|100)", aggregation)
+    return float(match.group(1)) / 100 if match else None
+
+
+def get_rolling_column_name(aggregation: str, window_days: int) -> str:
+    """Return the column of a rolling statistic, e.g. "mean_7d"."""
+    return f"{aggregation}_{window_days}d"
+
+
+def compute_rolling_sums(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Compute the sums of the trailing windows from the prefix sums of the values.
+
+    The first `window - 1` windows are partial and contain all the values so far.
+    """
+    prefix_sums = np.concatenate([[0.0], np.cumsum(values, dtype=float)])
+    window_starts = np.maximum(np.arange(len(values)) + 1 - window, 0)
+    # The prefix sums cancel out only approximately, which must not make a sum negative.
+    return np.maximum(prefix_sums[1:] - prefix_sums[window_starts], 0.0)
+
+
+def compute_rolling_extremes(values: np.ndarray, window: int, ufunc: np.ufunc) -> np.ndarray:
+    """
+    Compute the maxima (or minima) of the trailing windows.
+
+    The values are split into blocks of the window length, and every window is covered
+    by the tail of one block and the head of the next one. The running extremes of the heads
+    and of the tails are computed for all blocks at once, so each window takes O(1).
+
+    Parameters
+    ----------
+    values
+        The values, shape (N,).
+    window
+        The window length. The first `window - 1` windows are partial.
+    ufunc
+        `np.maximum` or `np.minimum`.
+
+    Returns
+    -------
+    The extreme of every trailing window, shape (N,).
+    """
+    neutral_value = -np.inf if ufunc is np.maximum else np.inf
+    block_count = -(-(len(values) + window - 1) // window)
+    blocks = np.full(block_count * window, neutral_value)
+    blocks[window - 1:window - 1 + len(values)] = values
+    blocks = blocks.reshape(block_count, window)
+    head_extremes = ufunc.accumulate(blocks, axis=1).ravel()
+    tail_extremes = ufunc.accumulate(blocks[:, ::-1], axis=1)[:, ::-1].ravel()
+    window_starts = np.arange(len(values))
+    return ufunc(tail_extremes[window_starts], head_extremes[window_starts + window - 1])
+
+
+def compute_rolling_quantiles(
+    values: np.ndarray,
+    window: int,
+    quantiles: Sequence[float],
+) -> np.ndarray:
+    """
+    Compute the quantiles of the trailing windows, with linear interpolation.
+
+    The windows are sorted once, in chunks to bound the memory use,
+    and all quantiles are interpolated from the same sorted windows.
+
+    Parameters
+    ----------
+    values
+        The values, shape (N,).
+    window
+        The window length. The first `window - 1` windows are partial.
+    quantiles
+        The quantiles to compute (0..1).
+
+    Returns
+    -------
+    The quantiles of every trailing window, shape (len(quantiles), N).
+    """
+    if len(values) == 0:
+        return np.empty((len(quantiles), 0))
+    # The partial windows are padded with NaN, which sorts after all the values.
+    padded_values = np.concatenate([np.full(window - 1, np.nan), np.asarray(values, dtype=float)])
+    windows = sliding_window_view(padded_values, window)
+    window_lengths = np.minimum(np.arange(1, len(values) + 1), window)
+    positions = np.outer(quantiles, window_lengths - 1)
+    lower_positions = np.floor(positions).astype(np.int64)
+    upper_positions = np.ceil(positions).astype(np.int64)
+    fractions = positions - lower_positions
+
+    result = np.empty((len(quantiles), len(values)))
+    chunk_size = max(ORDER_STATISTICS_CHUNK_SIZE // window, 1)
+    for chunk_start in range(0, len(values), chunk_size):
+        chunk = slice(chunk_start, chunk_start + chunk_size)
+        sorted_windows = np.sort(windows[chunk], axis=1)
+        lower_values = np.take_along_axis(sorted_windows, lower_positions[:, chunk].T, axis=1).T
+        upper_values = np.take_along_axis(sorted_windows, upper_positions[:, chunk].T, axis=1).T
+        result[:, chunk] = lower_values + fractions[:, chunk] * (upper_values - lower_values)
+    return result
+
+
+def compute_rolling_window_statistics(
+    df_daily_downtime: pd.DataFrame,
+    windows: Sequence[int] = DEFAULT_ROLLING_WINDOWS,
+    aggregations: Sequence[str] = DEFAULT_ROLLING_AGGREGATIONS,
+) -> pd.DataFrame:
+    """
+    Compute many rolling statistics of the daily downtime side by side.
+
+    The windows are counted in days (rows), so a window always spans the same number
+    of calendar days, regardless of the DST transitions. The windows at the start
+    of the report are partial and contain all the days so far.
+
+    Parameters
+    ----------
+    df_daily_downtime
+        The dataframe of daily downtime durations, one row per day, sorted by date.
+        Expected schema: {"date": datetime with TZ, "daily_downtime": float}.
+    windows
+        The window lengths, in days.
+    aggregations
+        The aggregations to compute for every window:
+        "sum", "mean", "min", "max", "median", or a percentile, e.g. "p90".
+
+    Returns
+    -------
+    Dataframe indexed by date, with one column per aggregation and window,
+    e.g. "mean_7d" (see `get_rolling_column_name`).
+    """
+    quantiles_by_aggregation = {}
+    for aggregation in aggregations:
+        quantile = parse_rolling_quantile(aggregation)
+        if quantile is not None:
+            quantiles_by_aggregation[aggregation] = quantile
+        elif aggregation not in PREFIX_SUM_AGGREGATIONS and aggregation not in EXTREME_AGGREGATIONS:
+            raise ValueError(f"Unsupported rolling aggregation: {aggregation}")
+    if any(window < 1 for window in windows):
+        raise ValueError(f"Rolling windows must be at least 1 day long: {windows}")
+
+    values = df_daily_downtime["daily_downtime"].to_numpy(dtype=float)
+    statistics_by_window = {}
+    for window in windows:
+        statistics = {}
+        if any(aggregation in PREFIX_SUM_AGGREGATIONS for aggregation in aggregations):
+            statistics["sum"] = compute_rolling_sums(values, window)
+            day_counts = np.minimum(np.arange(1, len(values) + 1), window)
+            statistics["mean"] = statistics["sum"] / day_counts
+        for aggregation, ufunc in EXTREME_AGGREGATIONS.items():
+            if aggregation in aggregations:
+                statistics[aggregation] = compute_rolling_extremes(values, window, ufunc)
+        if quantiles_by_aggregation:
+            quantiles = compute_rolling_quantiles(
+                values,
+                window,
+                list(quantiles_by_aggregation.values()),
+            )
+            statistics.update(zip(quantiles_by_aggregation, quantiles))
+        statistics_by_window[window] = statistics
+
+    # Group the columns by aggregation, so that the windows of each one are side by side.
+    return pd.DataFrame(
+        {
+            get_rolling_column_name(aggregation, window): statistics_by_window[window][aggregation]
+            for aggregation in aggregations
+            for window in windows
+        },
+        index=pd.DatetimeIndex(df_daily_downtime["date"], name="date"),
+    )
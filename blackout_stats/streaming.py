@@ -0,0 +1,314 @@
+import io
+import json
+import os
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from datetime import time
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pandas as pd
+
+from blackout_stats.event_store import EVENT_RECORD_DTYPE
+from blackout_stats.event_store import EventStore
+from blackout_stats.stats import transform_intervals_to_daily_records
+from blackout_stats.timeline import ONGOING_BLACKOUT_REJECTION_REASON
+
+# The columns of the outage log records.
+OUTAGE_RECORD_COLUMNS = ["timestamp", "event"]
+
+# The values of the "event" column: the power went off, or came back.
+OUTAGE_START = "start"
+OUTAGE_STOP = "stop"
+
+
+@dataclass(frozen=True)
+class OutageLogSnapshot:
+    """Everything read from an outage log so far."""
+
+    # Changes whenever anything new has been read from the log.
+    data_version: str
+    # The valid events, see `validate_blackout_events`.
+    df_blackout_events: pd.DataFrame
+    # The records that could not be paired, plus the blackout that is still going on, if any,
+    # with the reason "missing end date".
+    df_rejected_events: pd.DataFrame
+    # Schema: {"date": datetime with TZ, "daily_downtime": float}.
+    df_daily_downtime: pd.DataFrame
+
+
+def parse_outage_log_lines(lines: list[str], header: str | None = None) -> pd.DataFrame:
+    """
+    Parse the complete lines of an outage log.
+
+    Parameters
+    ----------
+    lines
+        The lines of the log, without the line breaks.
+    header
+        The header row of a CSV log. If not specified, the lines are parsed as JSON objects.
+
+    Returns
+    -------
+    Dataframe of the raw records, with the columns "timestamp" and "event" as they were logged.
+        Lines that cannot be parsed have missing values, and are rejected when pairing.
+    """
+    if header is not None:
+        df_records = pd.read_csv(
+            io.StringIO("\n".join([header, *lines])),
+            dtype=str,
+            skip_blank_lines=False,
+            on_bad_lines="skip",
+        )
+    else:
+        records = []
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                record = None
+            if not isinstance(record, dict):
+                record = {}
+            records.append([record.get(column) for column in OUTAGE_RECORD_COLUMNS])
+        df_records = pd.DataFrame(records, columns=OUTAGE_RECORD_COLUMNS)
+    return df_records.reindex(columns=OUTAGE_RECORD_COLUMNS)
+
+
+def pair_outage_records(
+    df_records: pd.DataFrame,
+    open_start: pd.Timestamp | None = None,
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.Timestamp | None]:
+    """
+    Pair the start and stop records of an outage log into blackout events.
+
+    Parameters
+    ----------
+    df_records
+        The records in the order they were logged, see `parse_outage_log_lines`.
+    open_start
+        The start of the blackout that was still going on after the previous records.
+
+    Returns
+    -------
+    Tuple of:
+        1. The paired events. Schema: {"start_date": datetime64 UTC, "end_date": datetime64 UTC}.
+        2. The records that could not be paired, as is, plus a "reason" column.
+           A repeated start while the power is already off is rejected, and the blackout
+           lasts from the first one. A stop while the power is already on is rejected too.
+        3. The start of the blackout that is still going on, or None.
+    """
+    timestamps = pd.to_datetime(df_records["timestamp"], utc=True, errors="coerce", format="mixed")
+    event_types = df_records["event"].astype(str).str.strip().str.lower()
+
+    starts = []
+    ends = []
+    rejected_positions = []
+    reasons = []
+    for position, (timestamp, event_type) in enumerate(zip(timestamps, event_types)):
+        if pd.isnull(timestamp) or event_type not in (OUTAGE_START, OUTAGE_STOP):
+            reason = "invalid record"
+        elif event_type == OUTAGE_START and open_start is not None:
+            reason = "duplicate start"
+        elif event_type == OUTAGE_STOP and open_start is None:
+            reason = "stop without start"
+        elif event_type == OUTAGE_STOP and open_start is not None and timestamp < open_start:
+            reason = "stop before start"
+        elif event_type == OUTAGE_START:
+            open_start = timestamp
+            continue
+        else:
+            starts.append(open_start)
+            ends.append(timestamp)
+            open_start = None
+            continue
+        rejected_positions.append(position)
+        reasons.append(reason)
+
+    df_events = pd.DataFrame({
+        "start_date": pd.to_datetime(pd.Series(starts, dtype=object), utc=True),
+        "end_date": pd.to_datetime(pd.Series(ends, dtype=object), utc=True),
+    })
+    df_rejected = df_records.iloc[rejected_positions].assign(reason=reasons)
+    return df_events, df_rejected, open_start
+
+
+class OutageLogStream:
+    """
+    Blackout events read from a local append-only log of outage start and stop records.
+
+    The log is either JSON lines, e.g. `{"timestamp": "2024-01-01T10:00:00+02:00",
+    "event": "start"}`, or a CSV file with the header "timestamp,event".
+    Naive timestamps are assumed to be in UTC.
+
+    Every poll reads only the lines appended since the previous one, pairs them into events,
+    and recomputes the daily downtime from the first day the new events touch. The history
+    that has already been read is never parsed or aggregated again, unless the log is
+    truncated or replaced, in which case it is read from the beginning.
+    The events are appended to a growing array, and every snapshot is a view of its filled part.
+    The stream is thread-safe, so a single instance can be shared by all sessions.
+    """
+
+    def __init__(self, path: str, target_tzinfo: ZoneInfo):
+        self.path = path
+        self.target_tzinfo = target_tzinfo
+        self._lock = threading.Lock()
+        # Incremented whenever the log has to be read again from the beginning.
+        self._generation = 0
+        self._reset()
+
+    def _reset(self) -> None:
+        self._file_id: tuple[int, int] | None = None
+        self._offset = 0
+        self._header: str | None = None
+        self._open_start: pd.Timestamp | None = None
+        # The events read so far, in the order they were logged, with room for more.
+        # The filled rows are never modified, so the snapshots can share them.
+        self._records = np.empty(0, dtype=EVENT_RECORD_DTYPE)
+        self._num_events = 0
+        self._df_rejected_events = pd.DataFrame(columns=[*OUTAGE_RECORD_COLUMNS, "reason"])
+        self._df_daily_downtime: pd.DataFrame | None = None
+        self._snapshot: OutageLogSnapshot | None = None
+
+    def _read_new_lines(self) -> list[str]:
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return []
+
+        # A log that has been replaced or truncated is read again from the beginning.
+        file_id = (stat.st_dev, stat.st_ino)
+        if self._file_id is not None and (file_id != self._file_id or stat.st_size < self._offset):
+            self._reset()
+            self._generation += 1
+        self._file_id = file_id
+        if stat.st_size == self._offset:
+            return []
+
+        with open(self.path, "rb") as log_file:
+            log_file.seek(self._offset)
+            data = log_file.read(stat.st_size - self._offset)
+
+        # A line that is still being written is left for the next poll.
+        complete_size = data.rfind(b"\n") + 1
+        self._offset += complete_size
+        lines = data[:complete_size].decode("utf-8").splitlines()
+        if self.path.endswith(".csv") and self._header is None and lines:
+            self._header, lines = lines[0], lines[1:]
+        return [line for line in lines if line.strip()]
+
+    def _append_events(self, df_new_events: pd.DataFrame) -> None:
+        num_events = self._num_events + len(df_new_events)
+        if num_events > len(self._records):
+            # Doubling the capacity keeps the appends amortized O(1) per event.
+            records = np.empty(max(num_events, 2 * len(self._records)), dtype=EVENT_RECORD_DTYPE)
+            records[:self._num_events] = self._records[:self._num_events]
+            self._records = records
+        new_records = self._records[self._num_events:num_events]
+        new_records["id"] = np.arange(self._num_events + 1, num_events + 1)
+        new_records["start"] = df_new_events["start_date"].array.asi8
+        new_records["end"] = df_new_events["end_date"].array.asi8
+        self._num_events = num_events
+
+    def _update_daily_downtime(self, df_new_events: pd.DataFrame, max_date: datetime) -> None:
+        starts = self._records["start"][:self._num_events]
+        ends = self._records["end"][:self._num_events]
+        df_daily_downtime = self._df_daily_downtime
+        if df_daily_downtime is None or df_daily_downtime.empty:
+            self._df_daily_downtime = transform_intervals_to_daily_records(
+                intervals=np.column_stack([starts, ends]),
+                target_tzinfo=self.target_tzinfo,
+                max_output_date=max_date,
+            )
+            return
+
+        # Only the days from the first new event (or the last stored day) onwards can change.
+        first_dirty_day = df_daily_downtime["date"].iloc[-1].date()
+        if not df_new_events.empty:
+            first_new_start = df_new_events["start_date"].min()
+            first_dirty_day = min(
+                first_dirty_day,
+                first_new_start.tz_convert(self.target_tzinfo).date(),
+            )
+        first_dirty_date = datetime.combine(first_dirty_day, time.min)
+        is_dirty = ends > pd.Timestamp(first_dirty_date, tz=self.target_tzinfo).value
+        df_recomputed = transform_intervals_to_daily_records(
+            intervals=np.column_stack([starts[is_dirty], ends[is_dirty]]),
+            target_tzinfo=self.target_tzinfo,
+            min_output_date=first_dirty_date,
+            max_output_date=max_date,
+        )
+        is_kept = (df_daily_downtime["date"].dt.date < first_dirty_day).to_numpy()
+        self._df_daily_downtime = pd.concat(
+            [df_daily_downtime[is_kept], df_recomputed],
+            ignore_index=True,
+        )
+
+    def _build_snapshot(self) -> OutageLogSnapshot:
+        # The dataframe view shares the filled rows of the growing array, without copying them.
+        event_store = EventStore(self._records[:self._num_events], ZoneInfo("UTC"))
+        df_blackout_events = event_store.to_dataframe()
+
+        df_rejected_events = self._df_rejected_events
+        if self._open_start is not None:
+            df_ongoing = pd.DataFrame({
+                "id": [self._num_events + 1],
+                "start_date": [self._open_start.isoformat()],
+                "end_date": [None],
+                "duration": [None],
+                "reason": [ONGOING_BLACKOUT_REJECTION_REASON],
+            })
+            df_rejected_events = (
+                pd.concat([df_rejected_events, df_ongoing], ignore_index=True)
+                if not df_rejected_events.empty
+                else df_ongoing
+            )
+
+        return OutageLogSnapshot(
+            data_version=f"log-{self._generation}-{self._offset}",
+            df_blackout_events=df_blackout_events,
+            df_rejected_events=df_rejected_events,
+            df_daily_downtime=self._df_daily_downtime,
+        )
+
+    def poll(self, max_output_date: datetime | None = None) -> OutageLogSnapshot:
+        """
+        Read the records appended since the previous poll.
+
+        Parameters
+        ----------
+        max_output_date
+            The last day of the daily downtime report. Defaults to today.
+
+        Returns
+        -------
+        Everything read from the log so far. The snapshot is shared, so it must not be modified.
+        """
+        max_date = max_output_date or datetime.now(tz=self.target_tzinfo)
+        with self._lock:
+            lines = self._read_new_lines()
+            is_new_day = (
+                self._df_daily_downtime is not None
+                and not self._df_daily_downtime.empty
+                and self._df_daily_downtime["date"].iloc[-1].date() < max_date.date()
+            )
+            if self._snapshot is not None and not lines and not is_new_day:
+                return self._snapshot
+
+            df_records = parse_outage_log_lines(lines, self._header)
+            df_new_events, df_rejected, self._open_start = pair_outage_records(
+                df_records,
+                open_start=self._open_start,
+            )
+            self._append_events(df_new_events)
+            if not df_rejected.empty and self._df_rejected_events.empty:
+                self._df_rejected_events = df_rejected.reset_index(drop=True)
+            elif not df_rejected.empty:
+                # Only the rejected records are concatenated again, and there are few of them.
+                self._df_rejected_events = pd.concat(
+                    [self._df_rejected_events, df_rejected],
+                    ignore_index=True,
+                )
+            self._update_daily_downtime(df_new_events, max_date)
+            self._snapshot = self._build_snapshot()
+            return self._snapshot
@@ -0,0 +1,150 @@
+from datetime import date
+from datetime import datetime
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+
+# The first day the day numbers are counted from.
+EPOCH_DATE = date(1970, 1, 1)
+
+NANOSECONDS_PER_DAY = 24 * 60 * 60 * 10**9
+
+
+class DowntimePrefixSums:
+    """
+    The cumulative daily downtime, to sum up any range of days in O(1).
+
+    The days are laid out densely from the first to the last day of the report, and the days
+    that are missing from it count as days without downtime. The downtime of a range of days
+    is then the difference of the prefix sums at its bounds, found by the day numbers.
+    """
+
+    def __init__(self, df_daily_downtime: pd.DataFrame):
+        """
+        Build the prefix sums.
+
+        Parameters
+        ----------
+        df_daily_downtime
+            The dataframe of daily downtime durations, in any order. It is not modified.
+            Expected schema: {"date": datetime with TZ, "daily_downtime": float}.
+        """
+        dates = pd.DatetimeIndex(df_daily_downtime["date"])
+        if dates.tz is not None:
+            # The local dates, regardless of the length of the days.
+            dates = dates.tz_localize(None)
+        day_numbers = dates.asi8 // NANOSECONDS_PER_DAY
+
+        self.first_day_number = int(day_numbers.min()) if len(day_numbers) else 0
+        day_count = int(day_numbers.max()) + 1 - self.first_day_number if len(day_numbers) else 0
+        daily_downtime = np.zeros(day_count)
+        np.add.at(
+            daily_downtime,
+            day_numbers - self.first_day_number,
+            df_daily_downtime["daily_downtime"].to_numpy(dtype=float),
+        )
+        self.prefix_sums = np.concatenate([[0.0], np.cumsum(daily_downtime)])
+
+    def __len__(self) -> int:
+        return len(self.prefix_sums) - 1
+
+    @property
+    def start_date(self) -> date:
+        """The first day of the report."""
+        return EPOCH_DATE + timedelta(days=self.first_day_number)
+
+    @property
+    def end_date(self) -> date:
+        """The day after the last day of the report."""
+        return self.start_date + timedelta(days=len(self))
+
+    def _to_position(self, day: date) -> int:
+        if isinstance(day, datetime):
+            day = day.date()
+        position = (day - EPOCH_DATE).days - self.first_day_number
+        return min(max(position, 0), len(self))
+
+    def total_downtime(self, start: date, end: date) -> float:
+        """
+        Get the total downtime of a range of days.
+
+        Parameters
+        ----------
+        start
+            The first day of the range. Datetimes are taken by their (local) date.
+        end
+            The day after the last day of the range (exclusive).
+
+        Returns
+        -------
+        The total downtime, in hours. The days outside the report count as zero.
+        """
+        start_position = self._to_position(start)
+        end_position = max(self._to_position(end), start_position)
+        # The prefix sums cancel out only approximately, which must not make a sum negative.
+        return max(float(self.prefix_sums[end_position] - self.prefix_sums[start_position]), 0.0)
+
+    def covered_day_count(self, start: date, end: date) -> int:
+        """Get the number of days of the range [start, end) within the report."""
+        return max(self._to_position(end) - self._to_position(start), 0)
+
+    def summarize(self, start: date, end: date) -> dict[str, float]:
+        """
+        Compute the summary statistics of a range of days.
+
+        Parameters
+        ----------
+        start
+            The first day of the range.
+        end
+            The day after the last day of the range (exclusive).
+
+        Returns
+        -------
+        A dictionary of summary statistics:
+            "total_downtime": the total downtime, in hours,
+            "avg_downtime": the average daily downtime over the days within the report
+            (NaN if there are none),
+            "day_count": the number of days within the report.
+        """
+        total_downtime = self.total_downtime(start, end)
+        day_count = self.covered_day_count(start, end)
+        return {
+            "total_downtime": total_downtime,
+            "avg_downtime": total_downtime / day_count if day_count else np.nan,
+            "day_count": day_count,
+        }
+
+
+def get_week_to_date_range(today: date) -> tuple[date, date]:
+    """Get the range of days from the Monday of the current week till today (inclusive)."""
+    return today - timedelta(days=today.weekday()), today + timedelta(days=1)
+
+
+def get_month_to_date_range(today: date) -> tuple[date, date]:
+    """Get the range of days from the first day of the current month till today (inclusive)."""
+    return today.replace(day=1), today + timedelta(days=1)
+
+
+def get_year_to_date_range(today: date) -> tuple[date, date]:
+    """Get the range of days from the first day of the current year till today (inclusive)."""
+    return today.replace(month=1, day=1), today + timedelta(days=1)
+
+
+def get_same_period_last_year(start: date, end: date) -> tuple[date, date]:
+    """
+    Get the same range of days one year earlier.
+
+    February 29 is moved to February 28, so a range that spans it may differ in length by a day.
+    """
+    return get_same_day_last_year(start), get_same_day_last_year(end)
+
+
+def get_same_day_last_year(day: date) -> date:
+    """Get the same day one year earlier, or February 28 for February 29."""
+    try:
+        return day.replace(year=day.year - 1)
+    except ValueError:
+        # February 29 of a leap year.
+        return day.replace(year=day.year - 1, day=28)
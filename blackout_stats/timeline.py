@@ -0,0 +1,206 @@
+from dataclasses import dataclass
+from datetime import datetime
+from datetime import timedelta
+from datetime import tzinfo
+
+import numpy as np
+import pandas as pd
+
+from blackout_stats.stats import NAT_INT64
+from blackout_stats.stats import get_event_intervals
+
+# The rejection reason of the rows that may be the blackout that is still going on.
+ONGOING_BLACKOUT_REJECTION_REASON = "missing end date"
+
+
+@dataclass(frozen=True)
+class OutageState:
+    """The power state at a point in time."""
+
+    is_down: bool
+    # When the current state began. None if it has not changed since before the first record.
+    since: datetime | None
+    at: datetime
+
+    @property
+    def duration(self) -> timedelta | None:
+        """How long the state has lasted, or None if it is not known."""
+        return self.at - self.since if self.since is not None else None
+
+
+class OutageTimeline:
+    """
+    The power state over time, as a sorted array of the moments when it changed.
+
+    The overlapping blackouts are merged, so the change points alternate: the even ones are
+    the moments when the power went off, and the odd ones when it came back. An odd number
+    of change points means that the last blackout is still going on.
+    A point-in-time query is a single binary search.
+    """
+
+    def __init__(self, change_points: np.ndarray, target_tzinfo: tzinfo | None = None):
+        """
+        Wrap the change points, see `build_outage_timeline`.
+
+        Parameters
+        ----------
+        change_points
+            Sorted array of the moments when the power state changed, in UTC nanoseconds.
+        target_tzinfo
+            The timezone of the dates returned by the queries.
+        """
+        self.change_points = change_points
+        self.target_tzinfo = target_tzinfo
+
+    @classmethod
+    def from_intervals(
+        cls,
+        intervals: np.ndarray,
+        target_tzinfo: tzinfo | None = None,
+    ) -> "OutageTimeline":
+        """
+        Merge the blackout intervals into a timeline.
+
+        Parameters
+        ----------
+        intervals
+            Array of shape (N, 2) with the start and the end of every blackout, in UTC
+            nanoseconds, as returned by `get_event_intervals`. Ongoing blackouts have
+            NAT_INT64 as the end.
+        target_tzinfo
+            The timezone of the dates returned by the queries.
+
+        Returns
+        -------
+        The timeline.
+        """
+        intervals = intervals[np.argsort(intervals[:, 0], kind="stable")]
+        starts = intervals[:, 0]
+        ends = np.where(intervals[:, 1] == NAT_INT64, np.iinfo(np.int64).max, intervals[:, 1])
+        ends = np.maximum(ends, starts)
+
+        # A blackout starts a new outage unless an earlier one is still going on at its start.
+        running_max_ends = np.maximum.accumulate(ends)
+        is_new_outage = np.ones(len(starts), dtype=bool)
+        is_new_outage[1:] = starts[1:] > running_max_ends[:-1]
+        outage_starts = starts[is_new_outage]
+        # The end of each outage is the running maximum right before the next outage starts.
+        outage_ends = running_max_ends[np.flatnonzero(is_new_outage)[1:] - 1]
+        if len(starts):
+            outage_ends = np.append(outage_ends, running_max_ends[-1])
+
+        change_points = np.column_stack([outage_starts, outage_ends]).ravel()
+        if len(change_points) and change_points[-1] == np.iinfo(np.int64).max:
+            change_points = change_points[:-1]
+        return cls(change_points, target_tzinfo)
+
+    def __len__(self) -> int:
+        return len(self.change_points)
+
+    @property
+    def is_ongoing(self) -> bool:
+        """Whether the last blackout has no end."""
+        return len(self.change_points) % 2 == 1
+
+    def _to_timestamp(self, value: int) -> pd.Timestamp:
+        return pd.Timestamp(value, tz="UTC").tz_convert(self.target_tzinfo)
+
+    def state_at(self, at: datetime) -> OutageState:
+        """
+        Get the power state at a point in time, in O(log n).
+
+        Parameters
+        ----------
+        at
+            The point in time. Must be TZ-aware.
+
+        Returns
+        -------
+        Whether the power was off at that moment, and since when.
+        """
+        at_value = pd.Timestamp(at).as_unit("ns").value
+        change_count = int(np.searchsorted(self.change_points, at_value, side="right"))
+        return OutageState(
+            is_down=change_count % 2 == 1,
+            since=(
+                self._to_timestamp(self.change_points[change_count - 1])
+                if change_count
+                else None
+            ),
+            at=at,
+        )
+
+
+def find_ongoing_blackout_starts(
+    df_blackout_events: pd.DataFrame,
+    df_rejected_events: pd.DataFrame,
+) -> pd.Series:
+    """
+    Find the start of the blackout that is still going on among the rejected rows.
+
+    A blackout that is still going on is recorded without an end date, so it is rejected
+    by `validate_blackout_events`. Only a row that starts after every valid blackout has
+    ended is treated as ongoing; older rows without an end date are data entry errors.
+
+    Parameters
+    ----------
+    df_blackout_events
+        The valid blackout events, with TZ-aware dates.
+    df_rejected_events
+        The rejected raw rows, with the "reason" column.
+
+    Returns
+    -------
+    The UTC start dates of the ongoing blackout (at most one), as a series.
+    """
+    if not {"reason", "start_date"}.issubset(df_rejected_events.columns):
+        return pd.Series(dtype="datetime64[ns, UTC]")
+    df_missing_end = df_rejected_events[
+        df_rejected_events["reason"] == ONGOING_BLACKOUT_REJECTION_REASON
+    ]
+    start_dates = pd.to_datetime(
+        df_missing_end["start_date"],
+        utc=True,
+        errors="coerce",
+        format="mixed",
+    ).dropna()
+    if df_blackout_events["end_date"].notnull().any():
+        start_dates = start_dates[start_dates >= df_blackout_events["end_date"].max()]
+    return start_dates.sort_values().tail(1).dt.as_unit("ns")
+
+
+def build_outage_timeline(
+    df_blackout_events: pd.DataFrame,
+    df_rejected_events: pd.DataFrame | None = None,
+) -> OutageTimeline:
+    """
+    Build the power state timeline from the blackout events.
+
+    Parameters
+    ----------
+    df_blackout_events
+        The dataframe containing the blackout events with parsed, TZ-aware dates.
+        Events without an end date are treated as ongoing.
+    df_rejected_events
+        If specified, the rejected rows are checked for the blackout that is still going on,
+        see `find_ongoing_blackout_starts`.
+
+    Returns
+    -------
+    The timeline, in the timezone of the events.
+    """
+    intervals = get_event_intervals(
+        start_dates=df_blackout_events["start_date"],
+        end_dates=df_blackout_events["end_date"],
+        open_end=NAT_INT64,
+    )
+    if df_rejected_events is not None:
+        ongoing_starts = find_ongoing_blackout_starts(df_blackout_events, df_rejected_events)
+        intervals = np.concatenate([
+            intervals,
+            np.column_stack([
+                ongoing_starts.array.asi8,
+                np.full(len(ongoing_starts), NAT_INT64),
+            ]),
+        ])
+    return OutageTimeline.from_intervals(intervals, df_blackout_events["start_date"].dt.tz)
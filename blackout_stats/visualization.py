@@ -1,44 +1,139 @@
 import calendar
-from datetime import datetime
+import json
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 from typing import Iterable
 
 import numpy as np
 import pandas as pd
+from bokeh.embed import json_item
 from bokeh.layouts import gridplot
 from bokeh.models import CategoricalAxis
 from bokeh.models import CategoricalScale
 from bokeh.models import ColumnDataSource
 from bokeh.models import FactorRange
 from bokeh.models import HoverTool
+from bokeh.models import LinearScale
 from bokeh.models import Plot
+from bokeh.models import Range1d
 from bokeh.models import Rect
 from bokeh.models import Text
 from bokeh.palettes import Oranges
 
+# Calendar rows x calendar columns.
+CALENDAR_LAYOUT = (3, 4)
+
+DAY_NAMES = list(calendar.day_abbr)
+
+# The size of a month in the compact calendar, in cells: 7 days + a gap horizontally,
+# and a title + day names + up to 6 weeks vertically.
+COMPACT_MONTH_WIDTH = 8
+COMPACT_MONTH_HEIGHT = 8
+# The months of a year + the year title.
+COMPACT_YEAR_HEIGHT = CALENDAR_LAYOUT[1] * COMPACT_MONTH_HEIGHT + 1
+COMPACT_CELL_SIZE_PX = 28
+
+# Looking up colors in an array lets us color a whole month at once.
+DAY_BACKGROUND_PALETTE = np.array(Oranges[256])
+
+
+@dataclass(frozen=True)
+class MonthCalendarLayout:
+    """The positions of the days of a month in a calendar grid. Depends only on the month."""
+
+    year: int
+    month: int
+    week_count: int
+    # One item per grid cell, row by row. The cells before the 1st and after the last day
+    # of the month are padding.
+    day_names: np.ndarray
+    week_numbers: np.ndarray
+    # Day of the year (1-based) for every cell, or 0 for the padding cells.
+    days_of_year: np.ndarray
+    datetime_labels: list[str | None]
+
+
+@dataclass
+class CalendarHeatmap:
+    """A year calendar heatmap plot that can be updated with new data without being rebuilt."""
+
+    year: int
+    plot: Plot
+    # One data source per month, January first.
+    month_sources: list[ColumnDataSource]
+
 
 def generate_year_calendar_heatmap_plot(df_daily_downtime: pd.DataFrame) -> Plot:
     """Given a dataframe of daily blackout durations, generate a calendar heatmap plot."""
-    # Calendar rows x calendar columns.
-    calendar_layout = (3, 4)
-    year = np.max(df_daily_downtime["date"].dt.year)
-
-    # Plot individual months.
-    monthly_calendar_plots = [
-        [
-            generate_single_month_calendar_plot(
-                df_daily_downtime=df_daily_downtime,
-                year=year,
-                month=3 * calendar_row + calendar_col + 1,
-            )
-            for calendar_col in range(calendar_layout[0])
-        ]
-        for calendar_row in range(calendar_layout[1])
-    ]
+    year = int(np.max(df_daily_downtime["date"].dt.year))
+    heatmap = create_year_calendar_heatmap(year)
+    update_year_calendar_heatmap(heatmap, df_daily_downtime)
+    return heatmap.plot
+
+
+def create_year_calendar_heatmap(year: int) -> CalendarHeatmap:
+    """
+    Build the calendar heatmap plot of a year, without any data yet.
+
+    Building the plot is the expensive part, so reuse the result for the same year and only
+    call `update_year_calendar_heatmap` when the data changes.
+
+    Parameters
+    ----------
+    year
+        The year to plot.
+
+    Returns
+    -------
+    The calendar heatmap whose data can be filled with `update_year_calendar_heatmap`.
+    """
+    month_plots = []
+    month_sources = []
+    for layout in compute_year_calendar_layout(year):
+        plot, source = create_single_month_calendar_plot(layout)
+        month_plots.append(plot)
+        month_sources.append(source)
 
     # Arrange months in a grid.
-    grid_plot = gridplot(toolbar_location=None, children=monthly_calendar_plots)
-    return grid_plot
+    grid_plot = gridplot(
+        toolbar_location=None,
+        children=[
+            month_plots[row_start:row_start + CALENDAR_LAYOUT[0]]
+            for row_start in range(0, len(month_plots), CALENDAR_LAYOUT[0])
+        ],
+    )
+    return CalendarHeatmap(year=year, plot=grid_plot, month_sources=month_sources)
+
+
+def update_year_calendar_heatmap(
+    heatmap: CalendarHeatmap,
+    df_daily_downtime: pd.DataFrame,
+    min_day_value: float = 0.0,
+    max_day_value: float = 24.0,
+) -> None:
+    """
+    Replace the data shown by a calendar heatmap plot, keeping the plot itself.
+
+    Parameters
+    ----------
+    heatmap
+        The heatmap, as returned by `create_year_calendar_heatmap`.
+    df_daily_downtime
+        The dataframe of daily downtime durations. Only the days of the heatmap year are shown.
+    min_day_value
+        The daily downtime that corresponds to the lightest color.
+    max_day_value
+        The daily downtime that corresponds to the darkest color.
+    """
+    day_of_year_values = align_daily_downtime_to_days_of_year(df_daily_downtime, heatmap.year)
+    for layout, source in zip(compute_year_calendar_layout(heatmap.year), heatmap.month_sources):
+        source.data = compute_month_calendar_data(
+            layout=layout,
+            day_of_year_values=day_of_year_values,
+            min_day_value=min_day_value,
+            max_day_value=max_day_value,
+        )
 
 
 def align_data_to_calendar_grid(
@@ -56,81 +151,164 @@ def align_data_to_calendar_grid(
     return result
 
 
-def generate_single_month_calendar_plot(
-    df_daily_downtime: pd.DataFrame,
-    year: int,
-    month: int,
-    min_day_value: float = 0.0,
-    max_day_value: float = 24.0,
-) -> Plot:
-    """Generate a calendar heatmap plot for a single month."""
+@lru_cache(maxsize=None)
+def compute_month_calendar_layout(year: int, month: int) -> MonthCalendarLayout:
+    """Compute the calendar grid of a month. The result is memoized and must not be modified."""
     calendar_obj = calendar.Calendar(firstweekday=0)
+    days_of_month = np.array(list(calendar_obj.itermonthdays(year, month)))
+    week_count = len(days_of_month) // 7
 
-    tzinfo = df_daily_downtime["date"].dt.tz
-    month_start_date = datetime(year, month, 1, tzinfo=tzinfo)
-    month_end_date = datetime(year, month, calendar.monthrange(year, month)[1], tzinfo=tzinfo)
+    first_day_of_year = pd.Timestamp(year, month, 1).dayofyear
+    days_of_year = np.where(days_of_month > 0, days_of_month + first_day_of_year - 1, 0)
 
-    datetime_labels = [
-        f"{year:04d}-{month:02d}-{day:02d}"
-        for day in range(month_start_date.day, month_end_date.day + 1)
-    ]
-    datetime_labels_calendar_aligned = align_data_to_calendar_grid(
-        data=datetime_labels,
+    datetime_labels = align_data_to_calendar_grid(
+        data=(
+            f"{year:04d}-{month:02d}-{day:02d}"
+            for day in range(1, calendar.monthrange(year, month)[1] + 1)
+        ),
         calendar_obj=calendar_obj,
         year=year,
         month=month,
     )
-    month_week_count = len(datetime_labels_calendar_aligned) // 7
-
-    df_month = pd.DataFrame(df_daily_downtime[
-        (df_daily_downtime["date"] >= month_start_date)
-        & (df_daily_downtime["date"] <= month_end_date)
-    ])
-
-    # Allocate zeros for each day, then replace each day with actual data from the dataframe.
-    daily_downtime_values = np.zeros(month_end_date.day, dtype=float)
-    for _, row in df_month.iterrows():
-        daily_downtime_values[row["date"].day - 1] = row["daily_downtime"]
 
-    daily_downtime_values_calendar_aligned = align_data_to_calendar_grid(
-        data=daily_downtime_values,
-        calendar_obj=calendar_obj,
+    layout = MonthCalendarLayout(
         year=year,
         month=month,
+        week_count=week_count,
+        day_names=np.tile(DAY_NAMES, week_count),
+        week_numbers=np.arange(week_count).reshape(1, -1).repeat(7).astype(str),
+        days_of_year=days_of_year,
+        datetime_labels=datetime_labels,
     )
-    daily_downtime_labels_calendar_aligned = [
-        str(int(np.round(val))) if val is not None else None
-        for val in daily_downtime_values_calendar_aligned
-    ]
+    for array in (layout.day_names, layout.week_numbers, layout.days_of_year):
+        array.flags.writeable = False
+    return layout
 
-    # Rescale 0..24 to 0..255
-    daily_downtime_values = (daily_downtime_values - min_day_value) / max_day_value * 255
-    daily_downtime_values = daily_downtime_values.astype(int)
 
-    day_backgrounds = [
-        "white" if value <= 0 else Oranges[256][255 - value]
-        for value in daily_downtime_values
-    ]
-    day_backgrounds_calendar_aligned = align_data_to_calendar_grid(
-        data=day_backgrounds,
-        calendar_obj=calendar_obj,
-        year=year,
-        month=month,
+@lru_cache(maxsize=None)
+def compute_year_calendar_layout(year: int) -> tuple[MonthCalendarLayout, ...]:
+    """Compute the calendar grids of all months of a year, January first."""
+    return tuple(compute_month_calendar_layout(year, month) for month in range(1, 13))
+
+
+def align_daily_downtime_to_days_of_year(
+    df_daily_downtime: pd.DataFrame,
+    year: int,
+) -> np.ndarray:
+    """
+    Look up the daily downtime of every day of a year.
+
+    Parameters
+    ----------
+    df_daily_downtime
+        The dataframe of daily downtime durations.
+    year
+        The year to look up.
+
+    Returns
+    -------
+    Array indexed by the day of the year (1-based), so that `days_of_year` of a
+    `MonthCalendarLayout` can index it directly. Item 0 and the days without records are 0.
+    """
+    dates = df_daily_downtime["date"].dt
+    is_in_year = (dates.year == year).to_numpy()
+    days_in_year = pd.Timestamp(year, 12, 31).dayofyear
+
+    daily_downtime = pd.Series(
+        df_daily_downtime["daily_downtime"].to_numpy()[is_in_year],
+        index=dates.dayofyear.to_numpy()[is_in_year],
+    )
+    # If a day occurs more than once, the last record wins.
+    daily_downtime = daily_downtime[~daily_downtime.index.duplicated(keep="last")]
+    return daily_downtime.reindex(range(days_in_year + 1), fill_value=0.0).to_numpy(dtype=float)
+
+
+def compute_month_calendar_data(
+    layout: MonthCalendarLayout,
+    day_of_year_values: np.ndarray,
+    min_day_value: float = 0.0,
+    max_day_value: float = 24.0,
+) -> dict[str, Any]:
+    """
+    Compute the data source columns of a month calendar plot.
+
+    Parameters
+    ----------
+    layout
+        The calendar grid of the month.
+    day_of_year_values
+        The daily downtime per day of the year, see `align_daily_downtime_to_days_of_year`.
+    min_day_value
+        The daily downtime that corresponds to the lightest color.
+    max_day_value
+        The daily downtime that corresponds to the darkest color.
+
+    Returns
+    -------
+    The columns for the `ColumnDataSource` of the month plot.
+    The padding cells of the grid are None in every data column.
+    """
+    is_day = layout.days_of_year > 0
+    values = day_of_year_values[layout.days_of_year]
+
+    # Rescale 0..24 to 0..255
+    color_indices = ((values - min_day_value) / max_day_value * 255).astype(int)
+    day_backgrounds = np.where(
+        color_indices <= 0,
+        "white",
+        DAY_BACKGROUND_PALETTE[255 - np.maximum(color_indices, 0)],
     )
+    daily_downtime_labels = np.round(values).astype(int).astype(str)
+
+    def pad(column: np.ndarray) -> list[Any]:
+        padded_column = column.astype(object)
+        padded_column[~is_day] = None
+        return padded_column.tolist()
 
-    day_names = list(calendar.day_abbr)
-    source_data = {
-        "day_names": np.tile(day_names, month_week_count),
-        "week_numbers": np.arange(month_week_count).reshape(1, -1).repeat(7).astype(str),
-        "datetime_labels": datetime_labels_calendar_aligned,
-        "daily_downtime_labels": daily_downtime_labels_calendar_aligned,
-        "daily_downtime_values": daily_downtime_values_calendar_aligned,
-        "day_backgrounds": day_backgrounds_calendar_aligned,
+    return {
+        "day_names": layout.day_names,
+        "week_numbers": layout.week_numbers,
+        "datetime_labels": layout.datetime_labels,
+        "daily_downtime_labels": pad(daily_downtime_labels),
+        "daily_downtime_values": pad(values),
+        "day_backgrounds": pad(day_backgrounds),
     }
-    source = ColumnDataSource(data=source_data)
 
-    x_range = FactorRange(factors=day_names)
-    y_range = FactorRange(factors=np.flip(np.arange(month_week_count).astype(str)))
+
+def generate_single_month_calendar_plot(
+    df_daily_downtime: pd.DataFrame,
+    year: int,
+    month: int,
+    min_day_value: float = 0.0,
+    max_day_value: float = 24.0,
+) -> Plot:
+    """Generate a calendar heatmap plot for a single month."""
+    layout = compute_month_calendar_layout(year, month)
+    plot, source = create_single_month_calendar_plot(layout)
+    source.data = compute_month_calendar_data(
+        layout=layout,
+        day_of_year_values=align_daily_downtime_to_days_of_year(df_daily_downtime, year),
+        min_day_value=min_day_value,
+        max_day_value=max_day_value,
+    )
+    return plot
+
+
+def create_single_month_calendar_plot(
+    layout: MonthCalendarLayout,
+) -> tuple[Plot, ColumnDataSource]:
+    """Build the calendar heatmap plot of a single month, with an empty data source."""
+    source = ColumnDataSource(data={
+        "day_names": [],
+        "week_numbers": [],
+        "datetime_labels": [],
+        "daily_downtime_labels": [],
+        "daily_downtime_values": [],
+        "day_backgrounds": [],
+    })
+
+    x_range = FactorRange(factors=DAY_NAMES)
+    y_range = FactorRange(factors=np.flip(np.arange(layout.week_count).astype(str)))
     x_scale = CategoricalScale()
     y_scale = CategoricalScale()
 
@@ -144,7 +322,7 @@ def generate_single_month_calendar_plot(
         outline_line_color=None,
     )
 
-    plot.title.text = calendar.month_name[month]
+    plot.title.text = calendar.month_name[layout.month]
     plot.title.text_font_size = "16px"
     plot.title.text_color = "lightslategray"
     plot.title.offset = 0
@@ -188,4 +366,307 @@ def generate_single_month_calendar_plot(
     )
     plot.tools.append(hover_tool)
 
+    return plot, source
+
+
+def generate_compact_calendar_heatmap_plot(
+    df_daily_downtime: pd.DataFrame,
+    years: Iterable[int] | None = None,
+    min_day_value: float = 0.0,
+    max_day_value: float = 24.0,
+) -> Plot:
+    """
+    Generate a calendar heatmap of one or more years as a single plot with a single data source.
+
+    Looks the same as `generate_year_calendar_heatmap_plot`, but the months are drawn at
+    computed offsets in one plot instead of 12 separate plots. This makes the serialized plot
+    several times smaller and faster to render in the browser.
+
+    Parameters
+    ----------
+    df_daily_downtime
+        The dataframe of daily downtime durations.
+    years
+        The years to plot, top to bottom. By default, all years present in the data.
+    min_day_value
+        The daily downtime that corresponds to the lightest color.
+    max_day_value
+        The daily downtime that corresponds to the darkest color.
+
+    Returns
+    -------
+    The calendar heatmap plot.
+    """
+    if years is None:
+        years = sorted(df_daily_downtime["date"].dt.year.unique())
+    years = [int(year) for year in years]
+
+    source = ColumnDataSource(data=compute_compact_calendar_data(
+        df_daily_downtime=df_daily_downtime,
+        years=years,
+        min_day_value=min_day_value,
+        max_day_value=max_day_value,
+    ))
+
+    width_in_cells = CALENDAR_LAYOUT[0] * COMPACT_MONTH_WIDTH - 1
+    height_in_cells = len(years) * COMPACT_YEAR_HEIGHT
+    plot = Plot(
+        x_range=Range1d(-0.5, width_in_cells - 0.5),
+        y_range=Range1d(-height_in_cells + 0.5, 0.5),
+        x_scale=LinearScale(),
+        y_scale=LinearScale(),
+        width=width_in_cells * COMPACT_CELL_SIZE_PX,
+        height=height_in_cells * COMPACT_CELL_SIZE_PX,
+        outline_line_color=None,
+        toolbar_location=None,
+        min_border=0,
+    )
+
+    # The labels share the data source with the day cells, but their cells have zero size,
+    # so that they are not drawn and cannot be hovered.
+    rect = Rect(
+        x="x",
+        y="y",
+        width="cell_sizes",
+        height="cell_sizes",
+        fill_color="day_backgrounds",
+        line_color="silver",
+    )
+    rect_renderer = plot.add_glyph(source, rect)
+
+    text = Text(
+        x="x",
+        y="y",
+        text="labels",
+        text_font_size="label_font_sizes",
+        text_color="label_colors",
+        text_align="center",
+        text_baseline="middle",
+    )
+    plot.add_glyph(source, text)
+
+    hover_tool = HoverTool(
+        renderers=[rect_renderer],
+        tooltips=[
+            ("Дата", "@datetime_labels"),
+            ("Тривалість відключень (год.)", "@daily_downtime_values{0.0}"),
+        ],
+    )
+    plot.tools.append(hover_tool)
+
+    return plot
+
+
+def compute_compact_calendar_data(
+    df_daily_downtime: pd.DataFrame,
+    years: list[int],
+    min_day_value: float = 0.0,
+    max_day_value: float = 24.0,
+) -> dict[str, Any]:
+    """
+    Compute the data source columns of the compact calendar heatmap.
+
+    Every day is a cell, and every year title, month title and day name is a label.
+    The cells and the labels are positioned in the same coordinate system: one unit per cell,
+    with y growing upwards, so that the top left corner of the first year is (0, 0).
+
+    Parameters
+    ----------
+    df_daily_downtime
+        The dataframe of daily downtime durations.
+    years
+        The years to include, top to bottom.
+    min_day_value
+        The daily downtime that corresponds to the lightest color.
+    max_day_value
+        The daily downtime that corresponds to the darkest color.
+
+    Returns
+    -------
+    The columns for the `ColumnDataSource` of the compact calendar plot.
+    """
+    cell_columns = []
+    label_columns = []
+    center_x = (CALENDAR_LAYOUT[0] * COMPACT_MONTH_WIDTH - 1) // 2
+    for year_index, year in enumerate(years):
+        year_top = year_index * COMPACT_YEAR_HEIGHT
+        label_columns.append((center_x, year_top, str(year), "18px", "dimgray"))
+
+        day_of_year_values = align_daily_downtime_to_days_of_year(df_daily_downtime, year)
+        for layout in compute_year_calendar_layout(year):
+            month_left = (layout.month - 1) % CALENDAR_LAYOUT[0] * COMPACT_MONTH_WIDTH
+            month_top = (
+                year_top + 1 + (layout.month - 1) // CALENDAR_LAYOUT[0] * COMPACT_MONTH_HEIGHT
+            )
+            label_columns.append((
+                month_left + 3,
+                month_top,
+                calendar.month_name[layout.month],
+                "16px",
+                "lightslategray",
+            ))
+            label_columns.extend(
+                (month_left + weekday, month_top + 1, day_name, "9px", "#444")
+                for weekday, day_name in enumerate(DAY_NAMES)
+            )
+
+            # Gather the days of the month; the padding cells of the grid are not drawn.
+            month_data = compute_month_calendar_data(
+                layout=layout,
+                day_of_year_values=day_of_year_values,
+                min_day_value=min_day_value,
+                max_day_value=max_day_value,
+            )
+            is_day = layout.days_of_year > 0
+            cell_indices = np.flatnonzero(is_day)
+            cell_columns.append({
+                "x": month_left + cell_indices % 7,
+                "y": month_top + 2 + cell_indices // 7,
+                **{
+                    key: np.asarray(month_data[key], dtype=object)[is_day]
+                    for key in (
+                        "datetime_labels",
+                        "daily_downtime_labels",
+                        "daily_downtime_values",
+                        "day_backgrounds",
+                    )
+                },
+            })
+
+    label_x, label_y, label_texts, label_font_sizes, label_colors = zip(*label_columns)
+    label_count = len(label_columns)
+    cell_count = sum(len(columns["x"]) for columns in cell_columns)
+
+    def concat(key: str) -> np.ndarray:
+        return np.concatenate([columns[key] for columns in cell_columns])
+
+    return {
+        "x": np.concatenate([concat("x"), label_x]).tolist(),
+        # Flip the rows so that the first year is at the top.
+        "y": (-np.concatenate([concat("y"), label_y])).tolist(),
+        "cell_sizes": [0.9] * cell_count + [0.0] * label_count,
+        "labels": [*concat("daily_downtime_labels"), *label_texts],
+        "label_font_sizes": ["12px"] * cell_count + list(label_font_sizes),
+        "label_colors": ["#444"] * cell_count + list(label_colors),
+        "datetime_labels": [*concat("datetime_labels"), *[None] * label_count],
+        "daily_downtime_values": [*concat("daily_downtime_values"), *[None] * label_count],
+        "day_backgrounds": [*concat("day_backgrounds"), *[None] * label_count],
+    }
+
+
+def generate_hour_of_day_heatmap_plot(df_hour_of_day_profile: pd.DataFrame) -> Plot:
+    """
+    Generate a heatmap of the share of time without power by the hour of the day and weekday.
+
+    Parameters
+    ----------
+    df_hour_of_day_profile
+        The downtime profile, see `compute_hour_of_day_downtime_profile`.
+
+    Returns
+    -------
+    The heatmap plot, with the weekdays as columns and the hours as rows, midnight at the top.
+    """
+    source = ColumnDataSource(data=compute_hour_of_day_heatmap_data(df_hour_of_day_profile))
+    hour_labels = [f"{hour:02d}:00" for hour in range(24)]
+
+    plot = Plot(
+        x_range=FactorRange(factors=DAY_NAMES),
+        y_range=FactorRange(factors=hour_labels[::-1]),
+        x_scale=CategoricalScale(),
+        y_scale=CategoricalScale(),
+        width=7 * COMPACT_CELL_SIZE_PX + 50,
+        height=24 * COMPACT_CELL_SIZE_PX + 30,
+        outline_line_color=None,
+        toolbar_location=None,
+        min_border=0,
+    )
+
+    rect = Rect(
+        x="day_names",
+        y="hour_labels",
+        width=0.9,
+        height=0.9,
+        fill_color="cell_backgrounds",
+        line_color="silver",
+    )
+    rect_renderer = plot.add_glyph(source, rect)
+
+    text = Text(
+        x="day_names",
+        y="hour_labels",
+        text="downtime_share_labels",
+        text_font_size="10px",
+        text_color="#444",
+        text_align="center",
+        text_baseline="middle",
+    )
+    plot.add_glyph(source, text)
+
+    xaxis = CategoricalAxis()
+    xaxis.major_label_text_font_size = "9px"
+    xaxis.major_label_standoff = 0
+    xaxis.major_tick_line_color = None
+    xaxis.axis_line_color = None
+    plot.add_layout(xaxis, "above")
+
+    yaxis = CategoricalAxis()
+    yaxis.major_label_text_font_size = "9px"
+    yaxis.major_tick_line_color = None
+    yaxis.axis_line_color = None
+    plot.add_layout(yaxis, "left")
+
+    hover_tool = HoverTool(
+        renderers=[rect_renderer],
+        tooltips=[
+            ("День тижня", "@day_names"),
+            ("Година", "@hour_labels"),
+            ("Частка часу без світла (%)", "@downtime_share_values{0.0}"),
+        ],
+    )
+    plot.tools.append(hover_tool)
+
     return plot
+
+
+def compute_hour_of_day_heatmap_data(df_hour_of_day_profile: pd.DataFrame) -> dict[str, Any]:
+    """
+    Compute the data source columns of the hour of day heatmap.
+
+    Parameters
+    ----------
+    df_hour_of_day_profile
+        The downtime profile, see `compute_hour_of_day_downtime_profile`.
+
+    Returns
+    -------
+    The columns for the `ColumnDataSource` of the heatmap, one row per hour and weekday.
+    The hours without any data are white, without a label.
+    """
+    df_profile = df_hour_of_day_profile.reindex(index=range(24), columns=range(7))
+    # Row by row: the 7 weekdays of hour 0, then of hour 1, and so on.
+    percentages = df_profile.to_numpy(dtype=float).ravel() * 100
+    has_data = ~np.isnan(percentages)
+    percentages = np.where(has_data, percentages, 0.0)
+
+    # Rescale 0..100% to 0..255
+    color_indices = (percentages / 100 * 255).astype(int)
+    cell_backgrounds = np.where(
+        color_indices <= 0,
+        "white",
+        DAY_BACKGROUND_PALETTE[255 - np.clip(color_indices, 0, 255)],
+    )
+    labels = np.where(has_data, np.round(percentages).astype(int).astype(str), "")
+
+    return {
+        "day_names": DAY_NAMES * 24,
+        "hour_labels": [f"{hour:02d}:00" for hour in range(24) for _ in range(7)],
+        "downtime_share_labels": labels.tolist(),
+        "downtime_share_values": np.where(has_data, percentages, np.nan).tolist(),
+        "cell_backgrounds": cell_backgrounds.tolist(),
+    }
+
+
+def compute_plot_payload_size(plot: Plot) -> int:
+    """Compute the size of the JSON that is sent to the browser to render the plot, in bytes."""
+    return len(json.dumps(json_item(plot)).encode("utf-8"))
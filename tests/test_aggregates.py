@@ -0,0 +1,124 @@
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pandas as pd
+
+from blackout_stats import aggregates as sut
+from blackout_stats.data_sources import validate_blackout_events
+from blackout_stats.stats import compute_summary_statistics
+from blackout_stats.stats import transform_events_to_daily_records
+
+
+def test_build_downtime_cube_matches_filtering_by_year():
+    # GIVEN events and daily downtime records spanning a new year
+    tzinfo = ZoneInfo("Europe/Kyiv")
+    df_blackout_events = pd.DataFrame({
+        "id": [1, 2, 3],
+        "start_date": pd.to_datetime(
+            ["2023-12-30 10:00", "2023-12-31 23:00", "2024-02-10 08:00"]
+        ).tz_localize(tzinfo),
+        "end_date": pd.to_datetime(
+            ["2023-12-30 14:00", "2024-01-01 02:00", "2024-02-10 09:30"]
+        ).tz_localize(tzinfo),
+    })
+    df_daily_downtime = transform_events_to_daily_records(
+        df_blackout_events,
+        target_tzinfo=tzinfo,
+        max_output_date=datetime(2024, 2, 11),
+    )
+
+    # WHEN building the cube
+    cube = sut.build_downtime_cube(df_blackout_events, df_daily_downtime)
+
+    # THEN every year should hold the same data as filtering the inputs by that year
+    assert cube.years == [2023, 2024]
+    for year in cube.years:
+        df_expected_events = df_blackout_events[df_blackout_events["start_date"].dt.year == year]
+        df_expected_daily = df_daily_downtime[df_daily_downtime["date"].dt.year == year]
+        pd.testing.assert_frame_equal(cube.events_by_year[year], df_expected_events)
+        pd.testing.assert_frame_equal(cube.daily_downtime_by_year[year], df_expected_daily)
+        assert cube.summary_stats_by_year[year] == compute_summary_statistics(df_expected_daily)
+
+    # AND the monthly totals should be laid out as year x month
+    expected_monthly_df = pd.DataFrame(
+        [
+            [np.nan] * 11 + [5.0],
+            [2.0, 1.5] + [np.nan] * 10,
+        ],
+        index=pd.Index([2023, 2024], name="year", dtype="int32"),
+        columns=pd.RangeIndex(1, 13, name="month"),
+    )
+    pd.testing.assert_frame_equal(
+        cube.df_monthly_downtime,
+        expected_monthly_df,
+        check_index_type=False,
+        check_column_type=False,
+    )
+
+
+def test_split_rows_by_year_returns_slices():
+    # GIVEN rows sorted by year
+    df = pd.DataFrame({"value": np.arange(5.0)}, index=[10, 11, 12, 13, 14])
+    years = np.array([2022, 2022, 2024, 2024, 2024])
+
+    # WHEN splitting them by year
+    actual = sut.split_rows_by_year(df, years)
+
+    # THEN every year should be a slice that shares the memory with the dataframe
+    assert list(actual) == [2022, 2024]
+    pd.testing.assert_frame_equal(actual[2022], df.iloc[:2])
+    pd.testing.assert_frame_equal(actual[2024], df.iloc[2:])
+    assert all(np.shares_memory(df_year["value"], df["value"]) for df_year in actual.values())
+    assert sut.split_rows_by_year(df.iloc[:0], years[:0]) == {}
+
+
+def test_split_rows_by_year_with_unsorted_years():
+    # GIVEN rows that are not sorted by year
+    df = pd.DataFrame({"value": np.arange(3.0)})
+    years = np.array([2024, 2023, 2024])
+
+    # WHEN splitting them by year THEN the rows of every year should be kept in their order
+    actual = sut.split_rows_by_year(df, years)
+    assert list(actual) == [2023, 2024]
+    pd.testing.assert_frame_equal(actual[2024], df.iloc[[0, 2]])
+
+
+def test_compute_data_version(df_blackout_events):
+    # GIVEN a dataframe of blackout events
+    version = sut.compute_data_version(df_blackout_events)
+
+    # WHEN the content is unchanged THEN the version should be stable
+    assert sut.compute_data_version(df_blackout_events.copy()) == version
+
+    # WHEN an event is edited THEN the version should change
+    df_edited = df_blackout_events.copy()
+    df_edited.loc[0, "end_date"] = df_edited.loc[0, "end_date"] + pd.Timedelta(minutes=1)
+    assert sut.compute_data_version(df_edited) != version
+
+    # WHEN an event is removed THEN the version should change
+    assert sut.compute_data_version(df_blackout_events.iloc[1:]) != version
+
+
+def test_compute_data_version_changes_with_an_ongoing_outage():
+    # GIVEN the events of a sheet
+    df_raw_events = pd.DataFrame({
+        "id": [1, 2],
+        "start_date": ["2024-01-01 10:00:00", "2024-01-02 10:00:00"],
+        "end_date": ["2024-01-01 12:00:00", "2024-01-02 11:00:00"],
+    })
+    version = sut.compute_data_version(*validate_blackout_events(df_raw_events))
+
+    # WHEN an outage that is still going on is appended
+    df_appended = pd.concat(
+        [df_raw_events, pd.DataFrame({"id": [3], "start_date": ["2024-01-03 09:00:00"]})],
+        ignore_index=True,
+    )
+    df_valid, df_rejected = validate_blackout_events(df_appended)
+
+    # THEN the valid events should be the same, but the version should change
+    pd.testing.assert_frame_equal(df_valid, validate_blackout_events(df_raw_events)[0])
+    assert sut.compute_data_version(df_valid, df_rejected) != version
+    assert sut.compute_data_version(df_valid) == sut.compute_data_version(
+        validate_blackout_events(df_raw_events)[0]
+    )
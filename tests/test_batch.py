@@ -0,0 +1,85 @@
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import pandas as pd
+import pytest
+
+from blackout_stats import batch as sut
+from blackout_stats.stats import transform_events_to_daily_records
+
+
+@pytest.fixture
+def events_by_location():
+    # Blackouts that span the new year and the DST transitions, one of them still going on.
+    tzinfo = ZoneInfo("Europe/Kyiv")
+    return {
+        "Home": pd.DataFrame({
+            "id": [1, 2, 3, 4],
+            "start_date": pd.to_datetime([
+                "2022-12-31 20:00", "2023-03-26 02:30", "2023-12-30 22:00", "2024-10-27 01:00",
+            ]).tz_localize(tzinfo),
+            "end_date": pd.to_datetime([
+                "2023-01-01 04:00", "2023-03-26 05:00", "2024-01-02 03:00", "2024-10-27 05:00",
+            ]).tz_localize(tzinfo, ambiguous=True),
+        }),
+        "Office": pd.DataFrame({
+            "id": [1, 2],
+            "start_date": pd.to_datetime(
+                ["2023-06-01 10:00", "2024-02-10 08:00"],
+            ).tz_localize(tzinfo),
+            "end_date": pd.to_datetime(["2023-06-01 12:00", None]).tz_localize(tzinfo),
+        }),
+        "Empty": pd.DataFrame({
+            "id": pd.Series(dtype=int),
+            "start_date": pd.Series(dtype=pd.DatetimeTZDtype(tz=tzinfo)),
+            "end_date": pd.Series(dtype=pd.DatetimeTZDtype(tz=tzinfo)),
+        }),
+    }
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_transform_events_to_daily_records_by_location_matches_the_serial_path(
+    events_by_location,
+    max_workers,
+):
+    # GIVEN the events of multiple locations spanning multiple years
+    tzinfo = ZoneInfo("Europe/Kyiv")
+    max_output_date = datetime(2024, 11, 30)
+
+    # WHEN computing the daily downtime partitioned by location and year
+    daily_downtime_by_location = sut.transform_events_to_daily_records_by_location(
+        events_by_location,
+        target_tzinfo=tzinfo,
+        max_output_date=max_output_date,
+        max_workers=max_workers,
+    )
+
+    # THEN it should be identical to computing it for every location at once
+    assert list(daily_downtime_by_location) == ["Home", "Office", "Empty"]
+    for location_name, df_blackout_events in events_by_location.items():
+        df_expected = transform_events_to_daily_records(
+            df_blackout_events,
+            target_tzinfo=tzinfo,
+            max_output_date=max_output_date,
+        )
+        pd.testing.assert_frame_equal(daily_downtime_by_location[location_name], df_expected)
+
+
+def test_partition_daily_downtime_report_splits_by_year(events_by_location):
+    # WHEN partitioning the report of a location
+    day_boundaries, partitions = sut.partition_daily_downtime_report(
+        location_name="Home",
+        df_blackout_events=events_by_location["Home"],
+        target_tzinfo=ZoneInfo("Europe/Kyiv"),
+        max_output_date=datetime(2024, 11, 30),
+    )
+
+    # THEN there should be one partition per year, sharing the day boundaries
+    assert [partition.year for partition in partitions] == [2022, 2023, 2024]
+    assert day_boundaries is not None
+    assert sum(len(partition.boundaries) - 1 for partition in partitions) == len(day_boundaries) - 1
+
+    # AND the blackouts that span the new year should be passed to both years
+    assert len(partitions[0].intervals) == 1
+    assert len(partitions[1].intervals) == 3  # noqa: PLR2004
+    assert len(partitions[2].intervals) == 2  # noqa: PLR2004
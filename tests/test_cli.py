@@ -0,0 +1,76 @@
+import json
+import subprocess
+import sys
+
+import pandas as pd
+import pytest
+
+from blackout_stats import cli as sut
+
+
+@pytest.fixture
+def events_csv_path(df_blackout_events, tmp_path):
+    path = tmp_path / "events.csv"
+    df_raw_blackout_events = df_blackout_events.assign(
+        start_date=df_blackout_events["start_date"].dt.strftime("%Y-%m-%d %H:%M:%S"),
+        end_date=df_blackout_events["end_date"].dt.strftime("%Y-%m-%d %H:%M:%S"),
+    )
+    df_raw_blackout_events.to_csv(path, index=False)
+    return str(path)
+
+
+@pytest.mark.parametrize("table_format", sut.TABLE_FORMATS)
+def test_main_writes_the_report(events_csv_path, tmp_path, table_format, capsys):
+    # GIVEN a CSV file of blackout events
+    output_dir = tmp_path / "report"
+
+    # WHEN running the batch reporter
+    exit_code = sut.main(
+        [events_csv_path, "--output-dir", str(output_dir), "--format", table_format],
+    )
+
+    # THEN the tables and the calendar heatmap should be written
+    assert exit_code == 0
+    expected_filenames = [
+        f"daily_downtime.{table_format}",
+        f"rolling_downtime.{table_format}",
+        f"summary.{table_format}",
+        "calendar_heatmap.html",
+    ]
+    assert sorted(path.name for path in output_dir.iterdir()) == sorted(expected_filenames)
+    assert capsys.readouterr().out.split() == [
+        str(output_dir / filename) for filename in expected_filenames
+    ]
+    assert "<html" in (output_dir / "calendar_heatmap.html").read_text(encoding="utf-8")
+
+    # AND the summary should start with the first year of the events
+    summary_path = output_dir / f"summary.{table_format}"
+    if table_format == "parquet":
+        df_summary = pd.read_parquet(summary_path)
+    elif table_format == "csv":
+        df_summary = pd.read_csv(summary_path)
+    else:
+        df_summary = pd.DataFrame(json.loads(summary_path.read_text(encoding="utf-8")))
+    assert df_summary.loc[0, "year"] == 2024  # noqa: PLR2004
+    assert df_summary.loc[0, "total_downtime"] > 0
+
+
+def test_cli_does_not_import_streamlit():
+    # WHEN importing the batch reporter in a fresh interpreter
+    code = "import sys, blackout_stats.cli; print('streamlit' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    # THEN Streamlit should not be imported
+    assert result.stdout.strip() == "False"
+
+
+def test_open_event_source_rejects_unknown_sources():
+    with pytest.raises(ValueError, match="Unsupported event source"):
+        sut.open_event_source("events.xlsx")
+    with pytest.raises(ValueError, match="service account"):
+        sut.open_event_source("https://docs.google.com/spreadsheets/d/abc/edit")
@@ -0,0 +1,250 @@
+import sqlite3
+import subprocess
+import sys
+import threading
+from datetime import timedelta
+
+import pandas as pd
+import pytest
+
+from blackout_stats import data_access as sut
+
+
+class RecordingConnection:
+    """A local stand-in for the Google Sheets connection that records the queries it runs."""
+
+    def __init__(self, rows):
+        self.queries = []
+        self.connection = sqlite3.connect(":memory:")
+        self.connection.execute(
+            'CREATE TABLE "sheet" (id PRIMARY KEY, start_date, end_date, duration)'
+        )
+        self.insert_rows(rows)
+
+    def insert_rows(self, rows):
+        self.connection.executemany('INSERT OR REPLACE INTO "sheet" VALUES (?, ?, ?, ?)', rows)
+
+    def cursor(self):
+        return RecordingCursor(self.connection.cursor(), self.queries)
+
+
+class RecordingCursor:
+    """A DB-API cursor that records the queries it runs."""
+
+    def __init__(self, cursor, queries):
+        self.cursor = cursor
+        self.queries = queries
+
+    def execute(self, query):
+        self.queries.append(query)
+        self.cursor.execute(query)
+
+    @property
+    def description(self):
+        return self.cursor.description
+
+    def fetchmany(self, size):
+        return self.cursor.fetchmany(size)
+
+    def close(self):
+        self.cursor.close()
+
+
+@pytest.fixture
+def sheet_rows():
+    return [
+        (1, "2024-01-01 00:00:00", "2024-01-02 00:00:00", "24:00:00"),
+        (2, "2024-01-02 22:30:00", "2024-01-03 01:00:00", "02:30:00"),
+        (3, "2024-01-05 01:00:00", None, None),
+    ]
+
+
+def test_read_blackout_events_through_local_cache_cold_start(sheet_rows, tmp_path):
+    # GIVEN no local cache
+    connection = RecordingConnection(sheet_rows)
+    cache_path = str(tmp_path / "sheet.arrow")
+
+    # WHEN reading the events
+    actual_df = sut.read_blackout_events_through_local_cache(connection, "sheet", cache_path)
+
+    # THEN the entire table should be fetched and cached
+    assert connection.queries == ['SELECT * FROM "sheet"']
+    assert actual_df["id"].tolist() == [1, 2, 3]
+    cached_df, _ = sut.read_cached_events(cache_path, "sheet")
+    pd.testing.assert_frame_equal(cached_df, actual_df)
+
+
+def test_read_blackout_events_through_local_cache_refresh(sheet_rows, tmp_path):
+    # GIVEN a local cache with an incomplete last row
+    connection = RecordingConnection(sheet_rows)
+    cache_path = str(tmp_path / "sheet.arrow")
+    sut.read_blackout_events_through_local_cache(connection, "sheet", cache_path)
+
+    # AND the incomplete row has been filled in, and a new row has been added
+    connection.insert_rows([
+        (3, "2024-01-05 01:00:00", "2024-01-05 02:00:00", "01:00:00"),
+        (4, "2024-01-05 03:00:00", "2024-01-05 04:30:00", "01:30:00"),
+    ])
+    connection.queries.clear()
+
+    # WHEN reading the events again
+    actual_df = sut.read_blackout_events_through_local_cache(connection, "sheet", cache_path)
+
+    # THEN only the incomplete and the new rows should be fetched
+    assert connection.queries == ['SELECT * FROM "sheet" WHERE id >= 3']
+    assert actual_df["id"].tolist() == [1, 2, 3, 4]
+    assert actual_df["end_date"].notnull().all()
+
+
+def test_read_blackout_events_through_local_cache_rows_without_id(sheet_rows, tmp_path):
+    # GIVEN a local cache with a blank row without an id
+    connection = RecordingConnection([*sheet_rows, (None, None, None, None)])
+    cache_path = str(tmp_path / "sheet.arrow")
+    sut.read_blackout_events_through_local_cache(connection, "sheet", cache_path)
+    connection.queries.clear()
+
+    # WHEN reading the events again
+    actual_df = sut.read_blackout_events_through_local_cache(connection, "sheet", cache_path)
+
+    # THEN only the incomplete row should be refetched, and the blank row should be kept
+    assert connection.queries == ['SELECT * FROM "sheet" WHERE id >= 3']
+    assert actual_df["id"].isnull().sum() == 1
+    assert actual_df["id"].dropna().tolist() == [1, 2, 3]
+
+
+def test_read_blackout_events_through_local_cache_old_incomplete_rows(tmp_path):
+    # GIVEN a local cache with a row without a start date, and an old row without an end date
+    connection = RecordingConnection([
+        (1, None, "2024-01-01 02:00:00", None),
+        (2, "2024-01-02 22:30:00", None, None),
+        (3, "2024-01-05 01:00:00", "2024-01-05 02:00:00", "01:00:00"),
+        (4, "2024-01-05 03:00:00", "2024-01-05 04:30:00", "01:30:00"),
+    ])
+    cache_path = str(tmp_path / "sheet.arrow")
+    sut.read_blackout_events_through_local_cache(connection, "sheet", cache_path)
+    connection.queries.clear()
+
+    # WHEN reading the events again, looking back only 2 rows for the ongoing blackouts
+    sut.read_blackout_events_through_local_cache(
+        connection,
+        "sheet",
+        cache_path,
+        max_refetched_rows=2,
+    )
+
+    # THEN only the new rows should be fetched
+    assert connection.queries == ['SELECT * FROM "sheet" WHERE id >= 5']
+
+
+def test_read_blackout_events_through_local_cache_full_refresh(sheet_rows, tmp_path):
+    # GIVEN a local cache
+    connection = RecordingConnection(sheet_rows)
+    cache_path = str(tmp_path / "sheet.arrow")
+    sut.read_blackout_events_through_local_cache(connection, "sheet", cache_path)
+    connection.queries.clear()
+
+    # WHEN reading the events after the full refresh interval has passed
+    sut.read_blackout_events_through_local_cache(
+        connection,
+        "sheet",
+        cache_path,
+        full_refresh_interval=timedelta(seconds=0),
+    )
+
+    # THEN the entire table should be fetched again
+    assert connection.queries == ['SELECT * FROM "sheet"']
+
+
+def test_read_cached_events_another_table(sheet_rows, tmp_path):
+    # GIVEN a local cache of one table
+    connection = RecordingConnection(sheet_rows)
+    cache_path = str(tmp_path / "sheet.arrow")
+    sut.read_blackout_events_through_local_cache(connection, "sheet", cache_path)
+
+    # WHEN reading the cache for another table
+    # THEN the cache should be ignored
+    assert sut.read_cached_events(cache_path, "another_sheet") is None
+
+
+def test_read_blackout_events_through_local_cache_corrupted_cache(sheet_rows, tmp_path):
+    # GIVEN a local cache that has been cut off
+    connection = RecordingConnection(sheet_rows)
+    cache_path = str(tmp_path / "sheet.arrow")
+    sut.read_blackout_events_through_local_cache(connection, "sheet", cache_path)
+    with open(cache_path, "r+b") as cache_file:
+        cache_file.truncate(100)
+
+    # WHEN reading the cache THEN it should be ignored
+    assert sut.read_cached_events(cache_path, "sheet") is None
+
+    # WHEN reading the events through the cache
+    connection.queries.clear()
+    actual_df = sut.read_blackout_events_through_local_cache(connection, "sheet", cache_path)
+
+    # THEN the entire table should be fetched again, and the cache should be rewritten
+    assert connection.queries == ['SELECT * FROM "sheet"']
+    assert actual_df["id"].tolist() == [1, 2, 3]
+    cached_df, _ = sut.read_cached_events(cache_path, "sheet")
+    assert len(cached_df) == len(sheet_rows)
+
+    # AND no temporary files should be left behind
+    assert [path.name for path in tmp_path.iterdir()] == ["sheet.arrow"]
+
+
+def test_read_blackout_events_concurrently_isolates_failures():
+    # GIVEN one location that succeeds, one that fails, and one that never responds
+    df_events = pd.DataFrame({"id": [1]})
+    df_rejected = pd.DataFrame({"id": []})
+    release_slow_location = threading.Event()
+
+    def fetch_ok():
+        return df_events, df_rejected
+
+    def fetch_failing():
+        raise ConnectionError("sheet unavailable")
+
+    def fetch_slow():
+        release_slow_location.wait(timeout=5)
+        return df_events, df_rejected
+
+    # WHEN reading all locations concurrently with a short timeout
+    try:
+        results = sut.read_blackout_events_concurrently(
+            fetchers={"ok": fetch_ok, "failing": fetch_failing, "slow": fetch_slow},
+            timeout_seconds=0.2,
+        )
+    finally:
+        release_slow_location.set()
+
+    # THEN the results keep the order of the locations
+    assert list(results) == ["ok", "failing", "slow"]
+
+    # AND the healthy location returns its data
+    assert results["ok"].error is None
+    assert results["ok"].df_blackout_events is df_events
+    assert results["ok"].df_rejected_events is df_rejected
+
+    # AND the failing location reports its error without the data
+    assert results["failing"].error == "ConnectionError: sheet unavailable"
+    assert results["failing"].df_blackout_events is None
+
+    # AND the unresponsive location is reported as timed out
+    assert results["slow"].error == "Timed out after 0 s"
+    assert results["slow"].df_blackout_events is None
+
+
+def test_data_access_defers_slow_imports():
+    # WHEN importing the data access module in a fresh interpreter
+    code = (
+        "import sys, blackout_stats.data_access; "
+        "print(sorted({'shillelagh', 'sqlalchemy', 'pyarrow.parquet'} & set(sys.modules)))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    # THEN the Google Sheets and Parquet dependencies should not be imported yet
+    assert result.stdout.strip() == "[]"
@@ -0,0 +1,131 @@
+import sqlite3
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import pandas as pd
+import pytest
+
+from blackout_stats import data_sources as sut
+from blackout_stats.stats import transform_event_chunks_to_daily_records
+from blackout_stats.stats import transform_events_to_daily_records
+
+
+@pytest.fixture
+def df_raw_blackout_events():
+    return pd.DataFrame.from_records([
+        {"id": 1, "start_date": "2024-01-01 00:00:00", "end_date": "2024-01-02 00:00:00"},
+        {"id": 2, "start_date": "2024-01-02 22:30:00", "end_date": "2024-01-03 01:00:00"},
+        {"id": 3, "start_date": "2024-01-05 03:00:00+02:00", "end_date": None},
+        {"id": 4, "start_date": "not a date", "end_date": "2024-01-05 04:30:00"},
+        {"id": 5, "start_date": "2024-01-07 23:00:00", "end_date": "2024-01-09 02:30:00"},
+    ])
+
+
+def test_validate_blackout_events(df_raw_blackout_events):
+    # GIVEN raw blackout events with strings and invalid rows
+    # WHEN validating the events
+    actual_valid_df, actual_rejected_df = sut.validate_blackout_events(df_raw_blackout_events)
+
+    # THEN the valid rows should be typed
+    expected_valid_df = pd.DataFrame(
+        {
+            "id": pd.array([1, 2, 5], dtype="Int64"),
+            "start_date": pd.to_datetime(
+                ["2024-01-01 00:00:00", "2024-01-02 22:30:00", "2024-01-07 23:00:00"],
+                utc=True,
+            ),
+            "end_date": pd.to_datetime(
+                ["2024-01-02 00:00:00", "2024-01-03 01:00:00", "2024-01-09 02:30:00"],
+                utc=True,
+            ),
+            "duration": pd.to_timedelta(["24:00:00", "02:30:00", "27:30:00"]),
+        },
+        index=[0, 1, 4],
+    )
+    pd.testing.assert_frame_equal(actual_valid_df, expected_valid_df)
+
+    # AND the invalid rows should be reported with the reason
+    expected_rejected_df = df_raw_blackout_events.loc[[2, 3]].assign(
+        reason=["missing end date", "invalid start date"],
+    )
+    pd.testing.assert_frame_equal(actual_rejected_df, expected_rejected_df)
+
+
+class StrictDBAPIConnection:
+    """A DB-API connection with only the PEP 249 methods, unlike the sqlite3 one."""
+
+    def __init__(self, connection):
+        self._connection = connection
+
+    def cursor(self):
+        return self._connection.cursor()
+
+    def close(self):
+        self._connection.close()
+
+
+@pytest.fixture(params=["csv", "parquet", "sqlite", "dbapi"])
+def event_source(request, df_raw_blackout_events, tmp_path):
+    if request.param == "csv":
+        filename = str(tmp_path / "events.csv")
+        df_raw_blackout_events.to_csv(filename, index=False)
+        return sut.CSVEventSource(filename)
+    if request.param == "parquet":
+        filename = str(tmp_path / "events.parquet")
+        df_raw_blackout_events.to_parquet(filename, index=False)
+        return sut.ParquetEventSource(filename)
+
+    filename = str(tmp_path / "events.db")
+    with sqlite3.connect(filename) as connection:
+        df_raw_blackout_events.to_sql("blackout_events", connection, index=False)
+    if request.param == "sqlite":
+        return sut.SQLiteEventSource(filename)
+    return sut.DBAPIEventSource(
+        StrictDBAPIConnection(sqlite3.connect(filename)),
+        'SELECT * FROM "blackout_events"',
+    )
+
+
+def test_event_source_iter_chunks(event_source, df_raw_blackout_events):
+    # GIVEN a data source with five raw events
+    # WHEN reading the events in chunks of two
+    chunk_size = 2
+    chunks = list(event_source.iter_chunks(chunk_size=chunk_size))
+
+    # THEN every chunk should be typed and contain only the valid events
+    assert all(len(chunk) <= chunk_size for chunk in chunks)
+    assert all(chunk["start_date"].dtype == "datetime64[ns, UTC]" for chunk in chunks)
+    actual_df = pd.concat(chunks, ignore_index=True)
+    expected_df, _ = sut.validate_blackout_events(df_raw_blackout_events)
+    pd.testing.assert_frame_equal(actual_df, expected_df.reset_index(drop=True))
+
+
+def test_event_source_read_all(event_source):
+    # GIVEN a data source with three valid and two invalid raw events
+    # WHEN reading all events
+    df_valid, df_rejected = event_source.read_all()
+
+    # THEN both the valid and the rejected events should be returned
+    assert df_valid["id"].tolist() == [1, 2, 5]
+    assert df_rejected["id"].tolist() == [3, 4]
+
+
+def test_transform_event_chunks_to_daily_records(event_source):
+    # GIVEN a data source
+    # WHEN transforming its chunks to daily records
+    kyiv_tzinfo = ZoneInfo("Europe/Kyiv")
+    max_output_date = datetime(2024, 1, 10, tzinfo=kyiv_tzinfo)
+    actual_df = transform_event_chunks_to_daily_records(
+        event_source.iter_chunks(chunk_size=2),
+        target_tzinfo=kyiv_tzinfo,
+        max_output_date=max_output_date,
+    )
+
+    # THEN the result should be the same as transforming the entire dataframe
+    df_blackout_events, _ = event_source.read_all()
+    expected_df = transform_events_to_daily_records(
+        df_blackout_events,
+        target_tzinfo=kyiv_tzinfo,
+        max_output_date=max_output_date,
+    )
+    pd.testing.assert_frame_equal(actual_df, expected_df)
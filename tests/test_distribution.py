@@ -0,0 +1,137 @@
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pandas as pd
+
+from blackout_stats import distribution as sut
+from blackout_stats.stats import parse_blackout_events
+
+
+def make_blackout_events(intervals):
+    tzinfo = ZoneInfo("Europe/Kyiv")
+    df_blackout_events = pd.DataFrame({
+        "id": range(len(intervals)),
+        "start_date": pd.to_datetime([start for start, _ in intervals]).tz_localize(tzinfo),
+        "end_date": pd.to_datetime([end for _, end in intervals]).tz_localize(tzinfo),
+    })
+    return parse_blackout_events(df_blackout_events, tzinfo)
+
+
+def test_compute_outage_distribution():
+    # GIVEN blackout events out of order, with two overlapping ones and an ongoing one
+    df_blackout_events = make_blackout_events([
+        (datetime(2024, 1, 1, 18, 0), datetime(2024, 1, 1, 20, 0)),
+        (datetime(2024, 1, 1, 10, 0), datetime(2024, 1, 1, 11, 0)),
+        (datetime(2024, 1, 1, 10, 30), datetime(2024, 1, 1, 13, 30)),
+        (datetime(2024, 1, 2, 8, 0), None),
+    ])
+
+    # WHEN computing the distribution of the outages
+    distribution = sut.compute_outage_distribution(df_blackout_events)
+
+    # THEN only the finished outages should have durations, the overlapping ones merged
+    np.testing.assert_array_equal(distribution.outage_durations, [3.5, 2.0])
+    # AND the overlapping outages should leave no gap between them
+    np.testing.assert_array_equal(distribution.uptime_gaps, [4.5, 12.0])
+    assert distribution.df_outage_histogram["count"].tolist() == [0, 0, 1, 1, 0, 0, 0, 0, 0]
+    assert distribution.df_gap_histogram["count"].tolist() == [0, 0, 0, 1, 0, 1, 0, 0, 0, 0]
+    assert distribution.df_statistics.loc["count"].tolist() == [2.0, 2.0]
+    assert distribution.df_statistics.loc["p50"].tolist() == [2.75, 8.25]
+    assert distribution.df_survival.loc[2.0].tolist() == [0.5, 1.0]
+
+
+def test_compute_outage_distribution_overlapping_rows():
+    # GIVEN an outage recorded as a nested row, an adjacent row and an overlapping row,
+    # and an ongoing outage that overlaps the last finished one
+    df_blackout_events = make_blackout_events([
+        (datetime(2024, 1, 1, 8, 0), datetime(2024, 1, 1, 12, 0)),
+        (datetime(2024, 1, 1, 9, 0), datetime(2024, 1, 1, 10, 0)),
+        (datetime(2024, 1, 1, 12, 0), datetime(2024, 1, 1, 13, 0)),
+        (datetime(2024, 1, 1, 12, 30), datetime(2024, 1, 1, 14, 0)),
+        (datetime(2024, 1, 1, 20, 0), datetime(2024, 1, 1, 22, 0)),
+        (datetime(2024, 1, 2, 6, 0), datetime(2024, 1, 2, 7, 0)),
+        (datetime(2024, 1, 2, 6, 30), None),
+    ])
+
+    # WHEN computing the distribution of the outages
+    distribution = sut.compute_outage_distribution(df_blackout_events)
+
+    # THEN the rows of the same outage should be counted as a single outage
+    np.testing.assert_array_equal(distribution.outage_durations, [6.0, 2.0])
+    # AND the gaps should be measured between the same merged outages
+    np.testing.assert_array_equal(distribution.uptime_gaps, [6.0, 8.0])
+    # AND the outage that is still going on should have neither a duration nor a gap after it
+    assert distribution.df_statistics.loc["count"].tolist() == [2.0, 2.0]
+
+
+def test_merge_outage_intervals():
+    # GIVEN sorted outages, two of them adjacent, and the last one ongoing
+    starts = np.array([0, 5, 10, 20, 25])
+    ends = np.array([5, 8, 15, 30, sut.OPEN_END_INT64])
+
+    # WHEN merging them
+    run_starts, run_ends = sut.merge_outage_intervals(starts, ends)
+
+    # THEN the adjacent and the overlapping outages should form single runs
+    np.testing.assert_array_equal(run_starts, [0, 10, 20])
+    np.testing.assert_array_equal(run_ends, [8, 15, sut.OPEN_END_INT64])
+
+
+def test_compute_outage_distribution_without_events():
+    # GIVEN no blackout events
+    df_blackout_events = make_blackout_events([])
+
+    # WHEN computing the distribution of the outages
+    distribution = sut.compute_outage_distribution(df_blackout_events)
+
+    # THEN there should be no values, and empty bins
+    assert len(distribution.outage_durations) == 0
+    assert len(distribution.uptime_gaps) == 0
+    assert distribution.df_outage_histogram["count"].sum() == 0
+    assert distribution.df_statistics.loc["count"].tolist() == [0.0, 0.0]
+    assert distribution.df_statistics.drop(index="count").isna().all().all()
+    assert distribution.df_survival.isna().all().all()
+
+
+def test_compute_histogram():
+    # GIVEN values on the bin edges and outside of the bins
+    values = np.array([-1.0, 0.0, 0.5, 1.0, 2.0, 5.0, 100.0])
+
+    # WHEN counting them in the histogram bins
+    actual_df = sut.compute_histogram(values, bin_edges=[0.0, 1.0, 2.0, np.inf])
+
+    # THEN every bin should include its start and exclude its end
+    expected_df = pd.DataFrame(
+        {
+            "bin_end": [1.0, 2.0, np.inf],
+            "count": [2, 1, 3],
+            "share": [2 / 6, 1 / 6, 3 / 6],
+        },
+        index=pd.Index([0.0, 1.0, 2.0], name="bin_start"),
+    )
+    pd.testing.assert_frame_equal(actual_df, expected_df)
+
+
+def test_compute_distribution_statistics():
+    # GIVEN some outage durations
+    values = np.array([4.0, 1.0, 3.0, 2.0])
+
+    # WHEN computing the statistics of their distribution
+    actual = sut.compute_distribution_statistics(values, quantiles=[0.5, 0.9])
+
+    # THEN there should be the count, the mean, the quantiles and the maximum
+    expected = pd.Series({"count": 4.0, "mean": 2.5, "p50": 2.5, "p90": 3.7, "max": 4.0})
+    pd.testing.assert_series_equal(actual, expected)
+
+
+def test_compute_survival_curve():
+    # GIVEN some outage durations
+    values = np.array([0.5, 1.0, 1.0, 3.0])
+
+    # WHEN computing the share of the outages that last longer than every threshold
+    actual = sut.compute_survival_curve(values, thresholds=np.array([0.0, 1.0, 2.0, 3.0]))
+
+    # THEN the outages that last exactly as long as the threshold should not count
+    expected = pd.Series([1.0, 0.25, 0.25, 0.0], index=pd.Index([0.0, 1.0, 2.0, 3.0], name="hours"))
+    pd.testing.assert_series_equal(actual, expected)
@@ -0,0 +1,85 @@
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from blackout_stats import event_index as sut
+from blackout_stats.stats import parse_blackout_events
+
+
+@pytest.fixture
+def df_random_events():
+    # Unsorted events of random lengths, some of them overlapping or spanning the new year.
+    rng = np.random.default_rng(seed=7)
+    start_dates = pd.Timestamp("2023-06-01", tz="UTC") + pd.to_timedelta(
+        rng.integers(0, 400 * 24 * 60, size=300), unit="min"
+    )
+    end_dates = start_dates + pd.to_timedelta(rng.integers(10, 3 * 24 * 60, size=300), unit="min")
+    df_blackout_events = pd.DataFrame({
+        "id": range(300),
+        "start_date": start_dates,
+        "end_date": end_dates,
+    })
+    return parse_blackout_events(df_blackout_events, ZoneInfo("Europe/Kyiv"))
+
+
+def test_event_index_queries_match_scanning_the_events(df_random_events):
+    # GIVEN an index over unsorted events
+    index = sut.EventIndex(df_random_events)
+    df_sorted_events = df_random_events.sort_values("start_date", kind="stable")
+    tzinfo = ZoneInfo("Europe/Kyiv")
+
+    # WHEN querying the events overlapping a range THEN it should match a full scan
+    for start, end in [
+        (datetime(2023, 12, 31, 22), datetime(2024, 1, 1, 3)),
+        (datetime(2024, 3, 1), datetime(2024, 4, 1)),
+        (datetime(2020, 1, 1), datetime(2021, 1, 1)),
+        (datetime(2024, 5, 1, 12, 30), datetime(2024, 5, 1, 12, 31)),
+    ]:
+        start_date = pd.Timestamp(start, tz=tzinfo)
+        end_date = pd.Timestamp(end, tz=tzinfo)
+        df_expected = df_sorted_events[
+            (df_sorted_events["end_date"] > start_date)
+            & (df_sorted_events["start_date"] < end_date)
+        ]
+        pd.testing.assert_frame_equal(index.events_overlapping(start, end), df_expected)
+
+    # WHEN querying the events of a year THEN it should match filtering by the local year
+    assert index.years() == [2023, 2024]
+    for year in [2022, 2023, 2024]:
+        df_expected = df_sorted_events[df_sorted_events["start_date"].dt.year == year]
+        pd.testing.assert_frame_equal(index.events_in_year(year), df_expected)
+
+    # WHEN querying the last N events THEN they should be the latest ones before the date
+    before = datetime(2024, 2, 1)
+    df_expected = df_sorted_events[
+        df_sorted_events["start_date"] < pd.Timestamp(before, tz=tzinfo)
+    ].tail(5)
+    pd.testing.assert_frame_equal(index.last_n(5, before=before), df_expected)
+    pd.testing.assert_frame_equal(index.last_n(5), df_sorted_events.tail(5))
+
+
+def test_event_index_with_long_and_ongoing_events():
+    # GIVEN a long blackout that covers shorter ones, and an ongoing one
+    df_blackout_events = pd.DataFrame({
+        "id": [1, 2, 3, 4],
+        "start_date": pd.to_datetime(
+            ["2024-01-01 00:00", "2024-01-02 10:00", "2024-01-20 08:00", "2024-01-25 08:00"]
+        ).tz_localize("UTC"),
+        "end_date": pd.to_datetime(
+            ["2024-01-15 00:00", "2024-01-02 12:00", "2024-01-20 09:00", None]
+        ).tz_localize("UTC"),
+    })
+    index = sut.EventIndex(df_blackout_events)
+
+    # WHEN querying a range that is only covered by the long blackout
+    df_overlapping = index.events_overlapping(datetime(2024, 1, 5), datetime(2024, 1, 6))
+
+    # THEN only the long blackout should be returned
+    assert df_overlapping["id"].tolist() == [1]
+
+    # WHEN querying a range long after the last start THEN the ongoing blackout should match
+    df_overlapping = index.events_overlapping(datetime(2025, 1, 1), datetime(2025, 1, 2))
+    assert df_overlapping["id"].tolist() == [4]
@@ -0,0 +1,108 @@
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from blackout_stats import event_store as sut
+from blackout_stats.data_sources import validate_blackout_events
+from blackout_stats.event_index import EventIndex
+from blackout_stats.stats import parse_blackout_events
+
+
+@pytest.fixture
+def df_raw_events():
+    # Unsorted events, one of them without an ID. The ongoing one is rejected by the validation.
+    return pd.DataFrame({
+        "id": [3, None, 1, 4],
+        "start_date": [
+            "2024-01-05 01:00:00",
+            "2024-01-02 22:30:00",
+            "2024-01-01 00:00:00",
+            "2024-01-07 23:00:00",
+        ],
+        "end_date": [
+            "2024-01-05 02:00:00",
+            "2024-01-03 01:00:00",
+            "2024-01-02 00:00:00",
+            None,
+        ],
+    })
+
+
+def test_event_store_round_trip(df_raw_events):
+    # GIVEN the valid events with parsed dates
+    df_blackout_events, _ = validate_blackout_events(df_raw_events)
+    df_blackout_events = parse_blackout_events(df_blackout_events, ZoneInfo("Europe/Kyiv"))
+
+    # WHEN storing the events and viewing them as a dataframe
+    store = sut.EventStore.from_dataframe(df_blackout_events)
+    actual_df = store.to_dataframe()
+
+    # THEN the view should be the same events, sorted by the start date
+    expected_df = (
+        df_blackout_events
+        .sort_values("start_date", kind="stable")
+        .reset_index(drop=True)
+    )
+    pd.testing.assert_frame_equal(actual_df, expected_df)
+    assert actual_df["id"].isna().tolist() == [False, True, False]
+    assert store.records.nbytes == 3 * sut.EVENT_RECORD_DTYPE.itemsize
+
+
+def test_event_store_shares_memory_and_is_read_only(df_raw_events):
+    # GIVEN a store of the events
+    df_blackout_events, _ = validate_blackout_events(df_raw_events)
+    store = sut.EventStore.from_dataframe(df_blackout_events, ZoneInfo("Europe/Kyiv"))
+
+    # WHEN viewing and slicing the store
+    df_view = store.to_dataframe()
+    store_slice = store[1:3]
+
+    # THEN the views should share the memory with the records, which cannot be modified
+    assert np.shares_memory(df_view["start_date"].array.asi8, store.records)
+    assert np.shares_memory(df_view["end_date"].array.asi8, store.records)
+    assert np.shares_memory(df_view["id"].array._data, store.records)
+    assert np.shares_memory(store_slice.records, store.records)
+    assert len(store_slice) == 2  # noqa: PLR2004
+    with pytest.raises(ValueError, match="read-only"):
+        store.starts[0] = 0
+    with pytest.raises(ValueError, match="read-only"):
+        store_slice.records["end"] = 0
+
+
+def test_event_store_skips_events_without_start_date():
+    # GIVEN events with TZ-aware dates, one of them without a start date
+    df_blackout_events = pd.DataFrame({
+        "id": pd.array([1, 2], dtype="Int64"),
+        "start_date": pd.to_datetime([None, "2024-01-01 00:00:00"], utc=True),
+        "end_date": pd.to_datetime(["2024-01-01 00:00:00", "2024-01-01 01:00:00"], utc=True),
+    })
+
+    # WHEN storing the events
+    store = sut.EventStore.from_dataframe(df_blackout_events)
+
+    # THEN only the event with a start date should be kept, in the timezone of the dates
+    assert store.ids.tolist() == [2]
+    assert str(store.tzinfo) == "UTC"
+
+
+def test_event_index_over_store_matches_index_over_dataframe(df_raw_events):
+    # GIVEN the same events as a dataframe and as a store
+    df_blackout_events, _ = validate_blackout_events(df_raw_events)
+    df_blackout_events = parse_blackout_events(df_blackout_events, ZoneInfo("Europe/Kyiv"))
+    store = sut.EventStore.from_dataframe(df_blackout_events)
+
+    # WHEN indexing both
+    store_index = EventIndex(store)
+    dataframe_index = EventIndex(df_blackout_events)
+
+    # THEN the queries should return the same events, without copying the store
+    np.testing.assert_array_equal(store_index.starts, dataframe_index.starts)
+    np.testing.assert_array_equal(store_index.ends, dataframe_index.ends)
+    assert store_index.years() == dataframe_index.years()
+    pd.testing.assert_frame_equal(
+        store_index.last_n(2).reset_index(drop=True),
+        dataframe_index.last_n(2).reset_index(drop=True),
+    )
+    assert np.shares_memory(store_index.starts, store.records)
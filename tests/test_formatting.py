@@ -5,6 +5,7 @@ import pandas as pd
 import pytest
 
 from blackout_stats import formatting as sut
+from blackout_stats.event_index import EventIndex
 
 
 def test_format_human_readable_summary_stats_df_with_recent_stats():
@@ -64,6 +65,70 @@ def test_format_human_readable_summary_stats_df_without_recent_stats():
     pd.testing.assert_frame_equal(actual_df, expected_df)
 
 
+def test_format_period_summary_df():
+    # GIVEN the summaries of a period and of the same period last year
+    summary_by_period = {"Цей місяць": {"total_downtime": 10.0, "avg_downtime": 2.0}}
+    summary_last_year_by_period = {"Цей місяць": {"total_downtime": 14.0, "avg_downtime": 2.8}}
+
+    # WHEN formatting them for display
+    actual_df = sut.format_period_summary_df(summary_by_period, summary_last_year_by_period)
+
+    # THEN there should be one row per period, with the difference from last year
+    expected_df = pd.DataFrame.from_records([
+        {
+            "Період": "Цей місяць",
+            "Усього (годин)": 10.0,
+            "В середньому за день (годин)": 2.0,
+            "Рік тому (годин)": 14.0,
+            "Різниця (годин)": -4.0,
+        },
+    ])
+    pd.testing.assert_frame_equal(actual_df, expected_df)
+
+
+def test_format_outage_distribution_statistics_df():
+    # GIVEN the statistics of the outage durations and of the gaps between them
+    df_statistics = pd.DataFrame(
+        {"outage": [3.0, 2.0, 4.5], "gap": [2.0, 8.0, 12.0]},
+        index=["count", "p50", "p90"],
+    )
+
+    # WHEN formatting them for display
+    actual_df = sut.format_outage_distribution_statistics_df(df_statistics)
+
+    # THEN every statistic should have a human-readable name
+    expected_df = pd.DataFrame({
+        "Показник": ["Кількість", "Медіана (годин)", "90-й перцентиль (годин)"],
+        "Відключення": [3.0, 2.0, 4.5],
+        "Світло є": [2.0, 8.0, 12.0],
+    })
+    pd.testing.assert_frame_equal(actual_df, expected_df)
+
+
+def test_format_rolling_statistics_df():
+    # GIVEN the rolling statistics of two windows
+    index = pd.date_range("2024-01-01", periods=2, freq="D", tz="Europe/Kyiv", name="date")
+    df_rolling_stats = pd.DataFrame(
+        {"mean_7d": [1.0, 2.0], "mean_30d": [3.0, 4.0], "max_7d": [5.0, 6.0]},
+        index=index,
+    )
+
+    # WHEN formatting one aggregation for display
+    actual_df = sut.format_rolling_statistics_df(df_rolling_stats, "mean")
+
+    # THEN only its windows should be kept, with human-readable names
+    expected_df = pd.DataFrame({"7 днів": [1.0, 2.0], "30 днів": [3.0, 4.0]}, index=index)
+    pd.testing.assert_frame_equal(actual_df, expected_df)
+
+
+@pytest.mark.parametrize(
+    "aggregation, expected_label",
+    [("mean", "Середнє"), ("median", "Медіана"), ("p90", "90-й перцентиль")],
+)
+def test_format_rolling_aggregation_label(aggregation, expected_label):
+    assert sut.format_rolling_aggregation_label(aggregation) == expected_label
+
+
 @pytest.mark.parametrize(
     "delta, expected_formatted",
     [
@@ -101,3 +166,31 @@ def test_format_last_n_blackouts(df_blackout_events):
 def test_format_last_n_blackouts_specific_year(df_blackout_events):
     actual_df = sut.format_last_n_blackouts_df(df_blackout_events, year=2023, n=2)
     assert len(actual_df) == 0
+
+
+def test_format_last_n_blackouts_from_event_index(df_blackout_events):
+    # GIVEN an index over the events
+    index = EventIndex(df_blackout_events)
+
+    # WHEN formatting the last blackouts of a year from the index
+    actual_df = sut.format_last_n_blackouts_df(index, year=2024, n=3)
+
+    # THEN it should be the same as formatting them from the dataframe
+    expected_df = sut.format_last_n_blackouts_df(df_blackout_events, year=2024, n=3)
+    pd.testing.assert_frame_equal(actual_df, expected_df)
+    assert actual_df.index.tolist() == [5, 6, 7]
+
+
+def test_format_last_n_blackouts_does_not_modify_events(df_blackout_events):
+    # GIVEN an index over the events
+    index = EventIndex(df_blackout_events)
+    df_original = index.df_blackout_events.copy()
+
+    # WHEN formatting the last blackouts, under copy-on-write as in the app, and without it
+    with pd.option_context("mode.copy_on_write", True):
+        cow_df = sut.format_last_n_blackouts_df(index, n=3)
+    actual_df = sut.format_last_n_blackouts_df(index, n=3)
+
+    # THEN the events should stay intact, and the results should be the same
+    pd.testing.assert_frame_equal(index.df_blackout_events, df_original)
+    pd.testing.assert_frame_equal(actual_df, cow_df)
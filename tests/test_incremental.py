@@ -0,0 +1,158 @@
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import pandas as pd
+
+from blackout_stats import incremental as sut
+from blackout_stats.stats import transform_events_to_daily_records
+
+
+def test_transform_events_to_daily_records_incrementally_first_run(df_blackout_events, tmp_path):
+    # GIVEN no persisted state
+    utc_tzinfo = ZoneInfo("UTC")
+    state_path = str(tmp_path / "state.pkl")
+    max_output_date = datetime.fromisoformat("2024-01-10T00:00:00Z")
+
+    # WHEN transforming the events incrementally
+    actual_df = sut.transform_events_to_daily_records_incrementally(
+        df_blackout_events,
+        target_tzinfo=utc_tzinfo,
+        state_path=state_path,
+        max_output_date=max_output_date,
+    )
+
+    # THEN the result should be the same as the full transform, and the state should be persisted
+    expected_df = transform_events_to_daily_records(
+        df_blackout_events.copy(),
+        target_tzinfo=utc_tzinfo,
+        max_output_date=max_output_date,
+    )
+    pd.testing.assert_frame_equal(actual_df, expected_df)
+    assert sut.load_daily_downtime_state(state_path) is not None
+
+
+def test_transform_events_to_daily_records_incrementally_after_edits(
+    df_blackout_events,
+    tmp_path,
+    monkeypatch,
+):
+    # GIVEN a persisted state
+    kyiv_tzinfo = ZoneInfo("Europe/Kyiv")
+    state_path = str(tmp_path / "state.pkl")
+    sut.transform_events_to_daily_records_incrementally(
+        df_blackout_events.copy(),
+        target_tzinfo=kyiv_tzinfo,
+        state_path=state_path,
+        max_output_date=datetime(2024, 1, 10, tzinfo=kyiv_tzinfo),
+    )
+
+    # AND a retroactive edit of an old event plus a new event
+    df_edited_events = df_blackout_events.copy()
+    df_edited_events.loc[2, "end_date"] = datetime.fromisoformat("2024-01-05T02:30:00Z")
+    df_edited_events.loc[len(df_edited_events)] = {
+        "id": 8,
+        "start_date": datetime.fromisoformat("2024-01-11T10:00:00Z"),
+        "end_date": datetime.fromisoformat("2024-01-11T12:00:00Z"),
+        "duration": pd.Timedelta(hours=2),
+    }
+
+    recomputed_ranges = []
+
+    def spy_transform(**kwargs):
+        recomputed_ranges.append((kwargs["min_output_date"].day, kwargs["max_output_date"].day))
+        return transform_events_to_daily_records(**kwargs)
+
+    monkeypatch.setattr(sut, "transform_events_to_daily_records", spy_transform)
+
+    # WHEN transforming the events incrementally again
+    max_output_date = datetime(2024, 1, 12, tzinfo=kyiv_tzinfo)
+    actual_df = sut.transform_events_to_daily_records_incrementally(
+        df_edited_events.copy(),
+        target_tzinfo=kyiv_tzinfo,
+        state_path=state_path,
+        max_output_date=max_output_date,
+    )
+
+    # THEN only the edited day and the days after the watermark should be recomputed
+    assert recomputed_ranges == [(5, 5), (10, 12)]
+
+    # AND the result should be the same as the full transform
+    expected_df = transform_events_to_daily_records(
+        df_edited_events.copy(),
+        target_tzinfo=kyiv_tzinfo,
+        max_output_date=max_output_date,
+    )
+    pd.testing.assert_frame_equal(actual_df, expected_df)
+
+
+def test_transform_events_to_daily_records_incrementally_growing_max_output_date(tmp_path):
+    # GIVEN a persisted report that ended before the end of the last event
+    utc_tzinfo = ZoneInfo("UTC")
+    state_path = str(tmp_path / "state.pkl")
+    df_blackout_events = pd.DataFrame({
+        "id": [1, 2],
+        "start_date": pd.to_datetime(["2024-01-01 10:00", "2024-01-10 10:00"], utc=True),
+        "end_date": pd.to_datetime(["2024-01-01 12:00", "2024-01-10 11:00"], utc=True),
+    })
+    sut.transform_events_to_daily_records_incrementally(
+        df_blackout_events.copy(),
+        target_tzinfo=utc_tzinfo,
+        state_path=state_path,
+        max_output_date=datetime(2024, 1, 5, tzinfo=utc_tzinfo),
+    )
+
+    # WHEN extending the report past the watermark
+    max_output_date = datetime(2024, 1, 20, tzinfo=utc_tzinfo)
+    actual_df = sut.transform_events_to_daily_records_incrementally(
+        df_blackout_events.copy(),
+        target_tzinfo=utc_tzinfo,
+        state_path=state_path,
+        max_output_date=max_output_date,
+    )
+
+    # THEN the days between the end of the previous report and the watermark should be included
+    expected_df = transform_events_to_daily_records(
+        df_blackout_events.copy(),
+        target_tzinfo=utc_tzinfo,
+        max_output_date=max_output_date,
+    )
+    assert len(actual_df) == 20  # noqa: PLR2004
+    pd.testing.assert_frame_equal(actual_df, expected_df)
+
+
+def test_transform_events_to_daily_records_incrementally_corrupted_state(
+    df_blackout_events,
+    tmp_path,
+):
+    # GIVEN a persisted state that has been cut off
+    utc_tzinfo = ZoneInfo("UTC")
+    state_path = str(tmp_path / "state.pkl")
+    max_output_date = datetime.fromisoformat("2024-01-10T00:00:00Z")
+    sut.transform_events_to_daily_records_incrementally(
+        df_blackout_events,
+        target_tzinfo=utc_tzinfo,
+        state_path=state_path,
+        max_output_date=max_output_date,
+    )
+    with open(state_path, "r+b") as state_file:
+        state_file.truncate(100)
+
+    # WHEN transforming the events incrementally again
+    actual_df = sut.transform_events_to_daily_records_incrementally(
+        df_blackout_events,
+        target_tzinfo=utc_tzinfo,
+        state_path=state_path,
+        max_output_date=max_output_date,
+    )
+
+    # THEN the state should be ignored, and the result should be the same as the full transform
+    expected_df = transform_events_to_daily_records(
+        df_blackout_events.copy(),
+        target_tzinfo=utc_tzinfo,
+        max_output_date=max_output_date,
+    )
+    pd.testing.assert_frame_equal(actual_df, expected_df)
+
+    # AND the state should be rewritten, without any temporary files left behind
+    assert sut.load_daily_downtime_state(state_path) is not None
+    assert [path.name for path in tmp_path.iterdir()] == ["state.pkl"]
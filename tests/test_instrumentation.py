@@ -0,0 +1,110 @@
+import json
+
+import pandas as pd
+import pytest
+
+from blackout_stats import instrumentation as sut
+
+
+def test_stage_recorder_call_records_rows_and_cache_misses():
+    # GIVEN a recorder and a cached function that misses on the first call only
+    recorder = sut.StageRecorder(run_id="run")
+    cache = {}
+
+    def cached_read(key):
+        if key not in cache:
+            sut.mark_cache_miss()
+            cache[key] = (pd.DataFrame({"id": [1, 2, 3]}), pd.DataFrame())
+        return cache[key]
+
+    # WHEN calling it twice as a cached stage, and an uncached stage
+    recorder.call("fetch", cached_read, "sheet", cached=True)
+    recorder.call("fetch", cached_read, "sheet", cached=True)
+    recorder.call("transform", lambda: pd.Series([1.0, 2.0]))
+
+    # THEN the cache hits and misses, and the rows of the results should be recorded
+    assert [(r.stage, r.cache_hit, r.rows) for r in recorder.records] == [
+        ("fetch", False, 3),
+        ("fetch", True, 3),
+        ("transform", None, 2),
+    ]
+    assert all(record.wall_seconds >= 0 for record in recorder.records)
+
+
+def test_stage_recorder_measure_records_failed_stages():
+    # GIVEN a recorder
+    recorder = sut.StageRecorder(run_id="run")
+
+    # WHEN a measured stage fails
+    with pytest.raises(ValueError, match="bad data"), recorder.measure("parse"):
+        raise ValueError("bad data")
+
+    # THEN it should still be recorded
+    assert [record.stage for record in recorder.records] == ["parse"]
+
+    # AND a cache miss outside of any stage should be ignored
+    sut.mark_cache_miss()
+
+
+def test_stage_recorder_to_json_lines(tmp_path):
+    # GIVEN a recorder with two stages
+    recorder = sut.StageRecorder(run_id="run")
+    with recorder.measure("fetch", cached=True) as record:
+        record.rows = 10
+    with recorder.measure("parse"):
+        pass
+
+    # WHEN appending the records to a file twice
+    log_path = tmp_path / "timings.jsonl"
+    recorder.append_to_file(str(log_path))
+    recorder.append_to_file(str(log_path))
+
+    # THEN every line should be a JSON record
+    lines = log_path.read_text().splitlines()
+    records = [json.loads(line) for line in lines]
+    assert [record["stage"] for record in records] == ["fetch", "parse", "fetch", "parse"]
+    assert records[0]["run_id"] == "run"
+    assert records[0]["rows"] == recorder.records[0].rows
+    assert records[0]["cache_hit"] is True
+    assert set(records[0]) == {
+        "run_id",
+        "stage",
+        "started_at",
+        "wall_seconds",
+        "rows",
+        "cache_hit",
+        "memory_delta_bytes",
+    }
+
+
+def test_summarize_stage_timings():
+    # GIVEN stage records of several runs
+    records = [
+        sut.StageRecord(
+            run_id=f"run{idx}",
+            stage=stage,
+            started_at="",
+            wall_seconds=seconds,
+            rows=idx,
+            cache_hit=cache_hit,
+        )
+        for idx, (seconds, cache_hit) in enumerate([(0.01, False), (0.02, True), (0.03, True)])
+        for stage in ("fetch", "parse")
+    ]
+
+    # WHEN summarizing them
+    actual_df = sut.summarize_stage_timings(records)
+
+    # THEN the percentiles should be computed per stage, in the order of the stages
+    expected_df = pd.DataFrame(
+        {
+            "runs": [3, 3],
+            "p50_ms": [20.0, 20.0],
+            "p95_ms": [29.0, 29.0],
+            "max_ms": [30.0, 30.0],
+            "cache_hit_rate": [2 / 3, 2 / 3],
+            "last_rows": [2, 2],
+        },
+        index=pd.Index(["fetch", "parse"], name="stage"),
+    )
+    pd.testing.assert_frame_equal(actual_df, expected_df)
@@ -0,0 +1,219 @@
+import threading
+import time
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from blackout_stats import precomputed as sut
+from blackout_stats.distribution import compute_outage_distribution
+from blackout_stats.rolling import compute_rolling_window_statistics
+from blackout_stats.stats import compute_hour_of_day_downtime_profile
+from blackout_stats.stats import transform_events_to_bucket_records
+from blackout_stats.stats import transform_events_to_daily_records
+
+
+def test_precompute_results_matches_the_pipeline(df_blackout_events):
+    # GIVEN a dataframe of blackout events
+    tzinfo = ZoneInfo("Europe/Kyiv")
+
+    # WHEN precomputing the results
+    results = sut.precompute_results(
+        df_blackout_events=df_blackout_events,
+        df_rejected_events=pd.DataFrame(),
+        data_version="v1",
+        target_tzinfo=tzinfo,
+    )
+
+    # THEN they should be the same as running every stage separately
+    df_daily_downtime = transform_events_to_daily_records(df_blackout_events, tzinfo)
+    pd.testing.assert_frame_equal(results.df_daily_downtime, df_daily_downtime)
+    df_rolling_stats = compute_rolling_window_statistics(df_daily_downtime)
+    pd.testing.assert_frame_equal(results.df_rolling_stats, df_rolling_stats)
+    year = 2024
+    pd.testing.assert_frame_equal(
+        results.rolling_stats_by_year[year],
+        df_rolling_stats[df_rolling_stats.index.year == year],
+    )
+    df_daily_downtime = df_daily_downtime[df_daily_downtime["date"].dt.year == year]
+    df_hourly_downtime = transform_events_to_bucket_records(
+        df_blackout_events,
+        target_tzinfo=tzinfo,
+        freq="1h",
+        min_output_date=df_daily_downtime["date"].min(),
+        max_output_date=df_daily_downtime["date"].max(),
+    )
+    pd.testing.assert_frame_equal(
+        results.hour_of_day_profile_by_year[year],
+        compute_hour_of_day_downtime_profile(df_hourly_downtime),
+    )
+    distribution = compute_outage_distribution(results.cube.events_by_year[year])
+    pd.testing.assert_frame_equal(
+        results.outage_distribution_by_year[year].df_statistics,
+        distribution.df_statistics,
+    )
+    assert results.data_version == "v1"
+    assert results.timezone_name == "Europe/Kyiv"
+    assert results.built_at <= datetime.now(tz=ZoneInfo("UTC"))
+
+
+def test_precompute_results_does_not_modify_inputs_and_shares_memory(df_blackout_events):
+    # GIVEN a dataframe of blackout events
+    df_original = df_blackout_events.copy()
+    tzinfo = ZoneInfo("Europe/Kyiv")
+
+    # WHEN precomputing the results, under copy-on-write as in the app, and without it
+    with pd.option_context("mode.copy_on_write", True):
+        cow_results = sut.precompute_results(df_blackout_events, pd.DataFrame(), "v1", tzinfo)
+    results = sut.precompute_results(df_blackout_events, pd.DataFrame(), "v1", tzinfo)
+
+    # THEN the input should stay intact, and the results should be the same
+    pd.testing.assert_frame_equal(df_blackout_events, df_original)
+    pd.testing.assert_frame_equal(results.df_blackout_events, cow_results.df_blackout_events)
+    pd.testing.assert_frame_equal(results.df_rolling_stats, cow_results.df_rolling_stats)
+
+    # AND the per-year results should be views over the whole ones, instead of copies
+    year = 2024
+    assert np.shares_memory(
+        results.cube.daily_downtime_by_year[year]["daily_downtime"],
+        results.df_daily_downtime["daily_downtime"],
+    )
+    assert np.shares_memory(
+        results.rolling_stats_by_year[year]["mean_7d"],
+        results.df_rolling_stats["mean_7d"],
+    )
+    assert np.shares_memory(
+        results.cube.events_by_year[year]["start_date"].array.asi8,
+        results.event_store.records,
+    )
+
+
+def test_update_precomputed_results_reuses_the_unchanged_years():
+    # GIVEN results precomputed from the events of two years
+    tzinfo = ZoneInfo("Europe/Kyiv")
+    df_blackout_events = pd.DataFrame({
+        "id": pd.array([1, 2], dtype="Int64"),
+        "start_date": pd.to_datetime(["2023-06-01 10:00", "2024-02-01 08:00"], utc=True),
+        "end_date": pd.to_datetime(["2023-06-01 12:00", "2024-02-01 09:30"], utc=True),
+    })
+    max_output_date = datetime(2024, 3, 1)
+    previous_results = sut.precompute_results_from_daily_downtime(
+        df_blackout_events=df_blackout_events,
+        df_rejected_events=pd.DataFrame(),
+        df_daily_downtime=transform_events_to_daily_records(
+            df_blackout_events, tzinfo, max_output_date=max_output_date,
+        ),
+        data_version="v1",
+        target_tzinfo=tzinfo,
+    )
+
+    # WHEN an event is appended to the last year and the results are updated
+    df_blackout_events = pd.concat([
+        df_blackout_events,
+        pd.DataFrame({
+            "id": pd.array([3], dtype="Int64"),
+            "start_date": pd.to_datetime(["2024-02-20 18:00"], utc=True),
+            "end_date": pd.to_datetime(["2024-02-20 22:00"], utc=True),
+        }),
+    ], ignore_index=True)
+    df_daily_downtime = transform_events_to_daily_records(
+        df_blackout_events, tzinfo, max_output_date=max_output_date,
+    )
+    results = sut.update_precomputed_results(
+        previous_results=previous_results,
+        df_blackout_events=df_blackout_events,
+        df_rejected_events=pd.DataFrame(),
+        df_daily_downtime=df_daily_downtime,
+        data_version="v2",
+    )
+
+    # THEN the unchanged year should be reused as is
+    assert results.hour_of_day_profile_by_year[2023] is (
+        previous_results.hour_of_day_profile_by_year[2023]
+    )
+    assert results.outage_distribution_by_year[2023] is (
+        previous_results.outage_distribution_by_year[2023]
+    )
+
+    # AND the changed year should be the same as precomputing everything again
+    expected_results = sut.precompute_results_from_daily_downtime(
+        df_blackout_events=df_blackout_events,
+        df_rejected_events=pd.DataFrame(),
+        df_daily_downtime=df_daily_downtime,
+        data_version="v2",
+        target_tzinfo=tzinfo,
+    )
+    pd.testing.assert_frame_equal(
+        results.hour_of_day_profile_by_year[2024],
+        expected_results.hour_of_day_profile_by_year[2024],
+    )
+    pd.testing.assert_frame_equal(
+        results.outage_distribution_by_year[2024].df_statistics,
+        expected_results.outage_distribution_by_year[2024].df_statistics,
+    )
+    assert results.data_version == "v2"
+    assert results.timezone_name == "Europe/Kyiv"
+
+
+def test_shared_result_store_builds_once_for_concurrent_callers():
+    # GIVEN a store and a slow build
+    store = sut.SharedResultStore()
+    build_calls = []
+
+    def build():
+        build_calls.append(threading.get_ident())
+        time.sleep(0.1)
+        return object()
+
+    # WHEN many threads ask for the same key at the same time
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(store.get_or_build("v1", build)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # THEN the result should be built only once and shared by everyone
+    assert len(build_calls) == 1
+    assert len(results) == len(threads)
+    assert all(result is results[0] for result in results)
+
+    # AND the later callers should get the stored result
+    assert store.get_or_build("v1", build) is results[0]
+    assert store.get_latest() is results[0]
+    assert len(build_calls) == 1
+
+
+def test_shared_result_store_does_not_store_failures():
+    # GIVEN a store and a build that fails once
+    store = sut.SharedResultStore()
+
+    def failing_build():
+        raise RuntimeError("sheet is broken")
+
+    # WHEN the build fails
+    # THEN the error should be raised
+    with pytest.raises(RuntimeError, match="sheet is broken"):
+        store.get_or_build("v1", failing_build)
+
+    # AND the next caller should build it again
+    assert store.get_or_build("v1", lambda: "result") == "result"
+
+
+def test_shared_result_store_evicts_old_versions():
+    # GIVEN a store that keeps two results
+    store = sut.SharedResultStore(max_entries=2)
+
+    # WHEN building three versions
+    for version in ("v1", "v2", "v3"):
+        store.get_or_build(version, lambda version=version: f"result {version}")
+
+    # THEN the oldest one should be rebuilt on request
+    assert store.get_latest() == "result v3"
+    assert store.get_or_build("v1", lambda: "rebuilt v1") == "rebuilt v1"
+    assert store.get_or_build("v3", lambda: "rebuilt v3") == "result v3"
@@ -0,0 +1,76 @@
+import threading
+from datetime import timedelta
+
+import pytest
+
+from blackout_stats import refresh as sut
+
+
+def test_background_refresher_serves_the_last_good_snapshot():
+    # GIVEN a refresher whose second refresh fails and third one blocks
+    third_refresh_started = threading.Event()
+    release_third_refresh = threading.Event()
+    refresh_count = 0
+
+    def refresh():
+        nonlocal refresh_count
+        refresh_count += 1
+        if refresh_count == 2:  # noqa: PLR2004
+            raise ConnectionError("sheet unavailable")
+        if refresh_count == 3:  # noqa: PLR2004
+            third_refresh_started.set()
+            release_third_refresh.wait(timeout=5)
+        return f"snapshot {refresh_count}"
+
+    refresher = sut.BackgroundRefresher(refresh, interval=timedelta(hours=1))
+
+    # WHEN it is started
+    refresher.start()
+
+    # THEN the first snapshot should be served as soon as it is loaded
+    assert refresher.get_snapshot(timeout=5) == "snapshot 1"
+    assert refresher.status.last_success_at is not None
+
+    # WHEN a refresh fails
+    refresher.refresh_now()
+
+    # THEN the previous snapshot should still be served, and the error should be reported
+    assert refresher.get_snapshot() == "snapshot 1"
+    assert refresher.status.last_error == "ConnectionError: sheet unavailable"
+
+    # WHEN a refresh is requested and takes a while
+    refresher.request_refresh()
+    assert third_refresh_started.wait(timeout=5)
+
+    # THEN the previous snapshot should be served right away while it is in progress
+    assert refresher.get_snapshot(timeout=0) == "snapshot 1"
+    assert refresher.status.is_refreshing
+
+    # WHEN the refresh completes
+    release_third_refresh.set()
+    refresher.stop(timeout=5)
+
+    # THEN the new snapshot should be served and the error should be cleared
+    assert refresher.get_snapshot() == "snapshot 3"
+    assert not refresher.status.is_refreshing
+    assert refresher.status.last_error is None
+
+
+def test_background_refresher_without_any_snapshot():
+    # GIVEN a refresher that has not been started
+    refresher = sut.BackgroundRefresher(lambda: "snapshot", interval=timedelta(hours=1))
+
+    # WHEN asking for a snapshot THEN it should time out
+    with pytest.raises(TimeoutError):
+        refresher.get_snapshot(timeout=0.01)
+
+    # GIVEN a refresher whose first refresh fails
+    def refresh():
+        raise ConnectionError("sheet unavailable")
+
+    refresher = sut.BackgroundRefresher(refresh, interval=timedelta(hours=1))
+    refresher.refresh_now()
+
+    # WHEN asking for a snapshot THEN the error should be raised
+    with pytest.raises(RuntimeError, match="sheet unavailable"):
+        refresher.get_snapshot()
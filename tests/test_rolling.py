@@ -0,0 +1,125 @@
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from blackout_stats import rolling as sut
+
+
+def make_daily_downtime(daily_downtimes, start_date=datetime(2024, 1, 1)):
+    tzinfo = ZoneInfo("Europe/Kyiv")
+    return pd.DataFrame({
+        "date": pd.date_range(start_date, periods=len(daily_downtimes), freq="D", tz=tzinfo),
+        "daily_downtime": daily_downtimes,
+    })
+
+
+def test_compute_rolling_window_statistics():
+    # GIVEN a dataframe of daily downtime durations
+    df_daily_downtime = make_daily_downtime([0.0, 3.5, 2.5, 0.5, 0.0, 4.0, 20.0, 1.0, 0.0])
+
+    # WHEN computing several rolling statistics over two windows
+    actual_df = sut.compute_rolling_window_statistics(
+        df_daily_downtime,
+        windows=[2, 4],
+        aggregations=["mean", "max", "median"],
+    )
+
+    # THEN the windows of each aggregation should be side by side,
+    # AND the windows at the start should contain all the days so far
+    expected_df = pd.DataFrame(
+        {
+            "mean_2d": [0.0, 1.75, 3.0, 1.5, 0.25, 2.0, 12.0, 10.5, 0.5],
+            "mean_4d": [0.0, 1.75, 2.0, 1.625, 1.625, 1.75, 6.125, 6.25, 6.25],
+            "max_2d": [0.0, 3.5, 3.5, 2.5, 0.5, 4.0, 20.0, 20.0, 1.0],
+            "max_4d": [0.0, 3.5, 3.5, 3.5, 3.5, 4.0, 20.0, 20.0, 20.0],
+            "median_2d": [0.0, 1.75, 3.0, 1.5, 0.25, 2.0, 12.0, 10.5, 0.5],
+            "median_4d": [0.0, 1.75, 2.5, 1.5, 1.5, 1.5, 2.25, 2.5, 2.5],
+        },
+        index=pd.DatetimeIndex(df_daily_downtime["date"], name="date"),
+    )
+    pd.testing.assert_frame_equal(actual_df, expected_df)
+
+
+@pytest.mark.parametrize("day_count", [1, 5, 100, 1000])
+def test_compute_rolling_window_statistics_matches_pandas(day_count):
+    # GIVEN a long history of daily downtime durations with many days without blackouts
+    rng = np.random.default_rng(day_count)
+    daily_downtimes = rng.uniform(0, 24, day_count) * (rng.random(day_count) < 0.5)  # noqa: PLR2004
+    df_daily_downtime = make_daily_downtime(daily_downtimes)
+
+    # WHEN computing all the supported aggregations
+    aggregations = ["sum", "mean", "min", "max", "median", "p10", "p90", "p100"]
+    actual_df = sut.compute_rolling_window_statistics(
+        df_daily_downtime,
+        aggregations=aggregations,
+    )
+
+    # THEN they should be the same as the rolling statistics of pandas
+    for window in sut.DEFAULT_ROLLING_WINDOWS:
+        daily_downtime = pd.Series(daily_downtimes, index=actual_df.index)
+        rolling = daily_downtime.rolling(window, min_periods=1)
+        expected_columns = {
+            "sum": rolling.sum(),
+            "mean": rolling.mean(),
+            "min": rolling.min(),
+            "max": rolling.max(),
+            "median": rolling.median(),
+            "p10": rolling.quantile(0.1),
+            "p90": rolling.quantile(0.9),
+            "p100": rolling.max(),
+        }
+        for aggregation, expected_series in expected_columns.items():
+            pd.testing.assert_series_equal(
+                actual_df[f"{aggregation}_{window}d"],
+                expected_series,
+                check_names=False,
+                atol=1e-9,
+            )
+
+
+def test_compute_rolling_window_statistics_counts_days_across_dst():
+    # GIVEN the daily downtime around the spring DST transition, with one 23-hour day
+    df_daily_downtime = make_daily_downtime([1.0] * 10, start_date=datetime(2024, 3, 25))
+
+    # WHEN computing the weekly sums
+    actual_df = sut.compute_rolling_window_statistics(
+        df_daily_downtime,
+        windows=[7],
+        aggregations=["sum"],
+    )
+
+    # THEN every full window should contain exactly 7 days
+    assert actual_df["sum_7d"].tolist() == [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 7.0, 7.0, 7.0]
+
+
+def test_compute_rolling_window_statistics_without_days():
+    # GIVEN an empty daily downtime report
+    df_daily_downtime = make_daily_downtime([])
+
+    # WHEN computing the default rolling statistics
+    actual_df = sut.compute_rolling_window_statistics(df_daily_downtime)
+
+    # THEN there should be all the columns, without rows
+    assert actual_df.empty
+    assert list(actual_df.columns) == [
+        f"{aggregation}_{window}d"
+        for aggregation in sut.DEFAULT_ROLLING_AGGREGATIONS
+        for window in sut.DEFAULT_ROLLING_WINDOWS
+    ]
+
+
+@pytest.mark.parametrize("aggregation", ["std", "p101", "percentile"])
+def test_compute_rolling_window_statistics_rejects_unknown_aggregations(aggregation):
+    with pytest.raises(ValueError, match="Unsupported rolling aggregation"):
+        sut.compute_rolling_window_statistics(
+            make_daily_downtime([1.0]),
+            aggregations=[aggregation],
+        )
+
+
+def test_compute_rolling_window_statistics_rejects_empty_windows():
+    with pytest.raises(ValueError, match="at least 1 day long"):
+        sut.compute_rolling_window_statistics(make_daily_downtime([1.0]), windows=[0])
@@ -1,7 +1,9 @@
 from datetime import datetime
 from zoneinfo import ZoneInfo
 
+import numpy as np
 import pandas as pd
+import pytest
 
 from blackout_stats import stats as sut
 
@@ -58,6 +60,227 @@ def test_transform_events_to_daily_records_timezone_aware():
     pd.testing.assert_frame_equal(actual_df, expected_df)
 
 
+def test_transform_events_to_daily_records_overlapping_events():
+    # GIVEN a multi-day outage with shorter outages logged over it
+    utc_tzinfo = ZoneInfo("UTC")
+    df_blackout_events = pd.DataFrame({
+        "id": [1, 2, 3],
+        "start_date": pd.to_datetime(
+            ["2024-01-01 22:00", "2024-01-01 23:00", "2024-01-02 10:00"]
+        ).tz_localize(utc_tzinfo),
+        "end_date": pd.to_datetime(
+            ["2024-01-03 02:00", "2024-01-02 03:00", "2024-01-02 12:00"]
+        ).tz_localize(utc_tzinfo),
+    })
+
+    # WHEN transforming the events to daily records
+    actual_df = sut.transform_events_to_daily_records(
+        df_blackout_events,
+        target_tzinfo=utc_tzinfo,
+        max_output_date=datetime(2024, 1, 3, tzinfo=utc_tzinfo),
+    )
+
+    # THEN the fully covered day should count as 24 hours, not more,
+    # AND the overlapping parts of the other days should be summed
+    expected_df = pd.DataFrame.from_records([
+        {"date": datetime(2024, 1, 1, tzinfo=utc_tzinfo), "daily_downtime": 3.0},
+        {"date": datetime(2024, 1, 2, tzinfo=utc_tzinfo), "daily_downtime": 24.0},
+        {"date": datetime(2024, 1, 3, tzinfo=utc_tzinfo), "daily_downtime": 2.0},
+    ])
+    pd.testing.assert_frame_equal(actual_df, expected_df)
+
+
+def test_transform_events_to_daily_records_does_not_modify_input(df_blackout_events):
+    # GIVEN a dataframe of blackout events
+    df_original = df_blackout_events.copy()
+
+    # WHEN transforming the events to daily records
+    sut.transform_events_to_daily_records(
+        df_blackout_events,
+        target_tzinfo=ZoneInfo("Europe/Kyiv"),
+        max_output_date=datetime.fromisoformat("2024-01-09T00:00:00Z"),
+    )
+
+    # THEN the input dataframe should stay intact
+    pd.testing.assert_frame_equal(df_blackout_events, df_original)
+
+
+def test_parse_blackout_events_shares_memory(df_blackout_events):
+    # GIVEN a dataframe of blackout events with TZ-aware dates
+    # WHEN parsing the events in another timezone
+    kyiv_tzinfo = ZoneInfo("Europe/Kyiv")
+    actual_df = sut.parse_blackout_events(df_blackout_events, target_tzinfo=kyiv_tzinfo)
+
+    # THEN the dates should be converted to the timezone without copying the underlying data
+    assert actual_df["start_date"].dt.tz == kyiv_tzinfo
+    assert np.shares_memory(
+        actual_df["start_date"].array.asi8,
+        df_blackout_events["start_date"].array.asi8,
+    )
+    pd.testing.assert_series_equal(
+        actual_df["start_date"].dt.tz_convert("UTC"),
+        df_blackout_events["start_date"],
+    )
+
+
+def test_transform_events_to_daily_records_dst_transition():
+    # GIVEN a blackout that covers the 23-hour DST day entirely, then ends mid-day
+    kyiv_tzinfo = ZoneInfo("Europe/Kyiv")
+    blackout_records = [
+        {
+            "id": 1,
+            "start_date": datetime(2024, 3, 30, 12, 0, tzinfo=kyiv_tzinfo),
+            "end_date": datetime(2024, 4, 1, 6, 0, tzinfo=kyiv_tzinfo),
+        },
+        {
+            "id": 2,
+            "start_date": datetime(2024, 4, 1, 22, 0, tzinfo=kyiv_tzinfo),
+            "end_date": datetime(2024, 4, 1, 23, 0, tzinfo=kyiv_tzinfo),
+        },
+    ]
+    df_blackout_events = pd.DataFrame.from_records(blackout_records)
+
+    # WHEN transforming the events to daily records
+    actual_df = sut.transform_events_to_daily_records(
+        df_blackout_events,
+        target_tzinfo=kyiv_tzinfo,
+        max_output_date=datetime(2024, 4, 1, tzinfo=kyiv_tzinfo),
+    )
+
+    # THEN the fully covered day should count as 24 hours, and the partial days as actual time
+    expected_df = pd.DataFrame.from_records([
+        {"date": datetime(2024, 3, 30, tzinfo=kyiv_tzinfo), "daily_downtime": 12.0},
+        {"date": datetime(2024, 3, 31, tzinfo=kyiv_tzinfo), "daily_downtime": 24.0},
+        {"date": datetime(2024, 4, 1, tzinfo=kyiv_tzinfo), "daily_downtime": 7.0},
+    ])
+    pd.testing.assert_frame_equal(actual_df, expected_df)
+
+
+def test_transform_events_to_daily_records_missing_dates():
+    # GIVEN an ongoing blackout without an end date, and a broken record without a start date
+    utc_tzinfo = ZoneInfo("UTC")
+    blackout_records = [
+        {
+            "id": 1,
+            "start_date": datetime.fromisoformat("2024-01-01T18:00:00Z"),
+            "end_date": None,
+        },
+        {
+            "id": 2,
+            "start_date": None,
+            "end_date": datetime.fromisoformat("2024-01-01T12:00:00Z"),
+        },
+    ]
+    df_blackout_events = pd.DataFrame.from_records(blackout_records)
+
+    # WHEN transforming the events to daily records
+    actual_df = sut.transform_events_to_daily_records(
+        df_blackout_events,
+        target_tzinfo=utc_tzinfo,
+        max_output_date=datetime.fromisoformat("2024-01-03T00:00:00Z"),
+    )
+
+    # THEN the ongoing blackout should last till the end of the report, the broken one is ignored
+    expected_df = pd.DataFrame.from_records([
+        {"date": datetime(2024, 1, 1, tzinfo=utc_tzinfo), "daily_downtime": 6.0},
+        {"date": datetime(2024, 1, 2, tzinfo=utc_tzinfo), "daily_downtime": 24.0},
+        {"date": datetime(2024, 1, 3, tzinfo=utc_tzinfo), "daily_downtime": 24.0},
+    ])
+    pd.testing.assert_frame_equal(actual_df, expected_df)
+
+
+@pytest.mark.parametrize(
+    "day, expected_hours",
+    [
+        # Spring forward: 03:00 does not exist.
+        (datetime(2024, 3, 31), [0, 1, 2, *range(4, 24)]),
+        # Fall back: 03:00 occurs twice.
+        (datetime(2024, 10, 27), [0, 1, 2, 3, *range(3, 24)]),
+    ],
+)
+def test_transform_events_to_bucket_records_hourly_dst(day, expected_hours):
+    # GIVEN a blackout that covers a DST transition day entirely
+    kyiv_tzinfo = ZoneInfo("Europe/Kyiv")
+    df_blackout_events = pd.DataFrame.from_records([
+        {
+            "id": 1,
+            "start_date": datetime(2024, 1, 1, tzinfo=kyiv_tzinfo),
+            "end_date": datetime(2024, 12, 1, tzinfo=kyiv_tzinfo),
+        },
+    ])
+
+    # WHEN bucketing the downtime by hour
+    actual_df = sut.transform_events_to_bucket_records(
+        df_blackout_events,
+        target_tzinfo=kyiv_tzinfo,
+        freq="1h",
+        min_output_date=day,
+        max_output_date=day,
+    )
+
+    # THEN every local hour that exists on that day should have a full hour of downtime
+    assert actual_df["bucket_start"].dt.hour.tolist() == expected_hours
+    assert (actual_df["bucket_length"] == 1.0).all()
+    assert (actual_df["downtime"] == 1.0).all()
+
+
+def test_transform_events_to_bucket_records_monthly(df_blackout_events):
+    # GIVEN a dataframe of blackout events
+    # WHEN bucketing the downtime by calendar month
+    utc_tzinfo = ZoneInfo("UTC")
+    actual_df = sut.transform_events_to_bucket_records(
+        df_blackout_events,
+        target_tzinfo=utc_tzinfo,
+        freq="1M",
+        max_output_date=datetime.fromisoformat("2024-02-15T00:00:00Z"),
+    )
+
+    # THEN each month should contain the sum of all blackouts within it
+    expected_df = pd.DataFrame.from_records([
+        {
+            "bucket_start": datetime(2024, 1, 1, tzinfo=utc_tzinfo),
+            "bucket_length": 744.0,
+            "downtime": 58.0,
+        },
+        {
+            "bucket_start": datetime(2024, 2, 1, tzinfo=utc_tzinfo),
+            "bucket_length": 696.0,
+            "downtime": 0.0,
+        },
+    ])
+    pd.testing.assert_frame_equal(actual_df, expected_df)
+
+
+def test_compute_hour_of_day_downtime_profile():
+    # GIVEN hourly downtime for two Mondays, with a blackout at 18:00 on one of them
+    utc_tzinfo = ZoneInfo("UTC")
+    df_blackout_events = pd.DataFrame.from_records([
+        {
+            "id": 1,
+            "start_date": datetime.fromisoformat("2024-01-01T18:00:00Z"),
+            "end_date": datetime.fromisoformat("2024-01-01T19:00:00Z"),
+        },
+    ])
+    df_hourly_downtime = sut.transform_events_to_bucket_records(
+        df_blackout_events,
+        target_tzinfo=utc_tzinfo,
+        freq="1h",
+        max_output_date=datetime.fromisoformat("2024-01-08T00:00:00Z"),
+    )
+
+    # WHEN computing the hour-of-day profile
+    actual_df = sut.compute_hour_of_day_downtime_profile(df_hourly_downtime)
+
+    # THEN the power should have been off half of the time on Mondays at 18:00 only
+    expected_df = pd.DataFrame(
+        0.0,
+        index=pd.Index(range(24), name="hour"),
+        columns=pd.Index(range(7), name="weekday"),
+    )
+    expected_df.loc[18, 0] = 0.5
+    pd.testing.assert_frame_equal(actual_df, expected_df)
+
+
 def test_compute_rolling_statistics():
     # GIVEN a dataframe of daily downtime durations
     tzinfo = ZoneInfo("Europe/Kyiv")
@@ -111,3 +334,74 @@ def test_compute_summary_statistics():
         "last_30_days_downtime": 31.5,
         "last_30_days_avg_downtime": 1.05,
     }
+
+
+def test_compute_summary_statistics_with_missing_days():
+    # GIVEN daily downtime durations with no records for most of the last week
+    tzinfo = ZoneInfo("Europe/Kyiv")
+    df_daily_downtime = pd.DataFrame({
+        "date": [datetime(2024, 1, day, tzinfo=tzinfo) for day in (1, 2, 3, 9)],
+        "daily_downtime": [5.0, 6.0, 7.0, 1.0],
+    })
+
+    # WHEN computing summary statistics
+    summary_stats = sut.compute_summary_statistics(df_daily_downtime)
+
+    # THEN the last 7 days should be the calendar days till the last record
+    assert summary_stats["last_7_days_downtime"] == 8.0  # noqa: PLR2004
+    assert summary_stats["total_downtime"] == 19.0  # noqa: PLR2004
+
+
+def test_compute_location_ranking():
+    # GIVEN daily downtime durations for two locations
+    tzinfo = ZoneInfo("Europe/Kyiv")
+    dates = [datetime(2024, 1, day, tzinfo=tzinfo) for day in (1, 2)]
+    daily_downtime_by_location = {
+        "Home": pd.DataFrame({"date": dates, "daily_downtime": [1.0, 2.0]}),
+        "Office": pd.DataFrame({"date": dates, "daily_downtime": [4.0, 6.0]}),
+    }
+
+    # WHEN ranking the locations
+    actual_df = sut.compute_location_ranking(daily_downtime_by_location)
+
+    # THEN the location with the most downtime should come first
+    expected_df = pd.DataFrame(
+        {
+            "total_downtime": [10.0, 3.0],
+            "last_7_days_downtime": [10.0, 3.0],
+            "last_7_days_avg_downtime": [10.0 / 7, 3.0 / 7],
+            "last_30_days_downtime": [10.0, 3.0],
+            "last_30_days_avg_downtime": [10.0 / 30, 3.0 / 30],
+            "avg_downtime": [5.0, 1.5],
+        },
+        index=["Office", "Home"],
+    )
+    pd.testing.assert_frame_equal(actual_df, expected_df)
+
+
+def test_compute_rolling_statistics_by_location():
+    # GIVEN daily downtime durations for two locations with different date ranges
+    tzinfo = ZoneInfo("Europe/Kyiv")
+    daily_downtime_by_location = {
+        "Home": pd.DataFrame({
+            "date": [datetime(2024, 1, day, tzinfo=tzinfo) for day in (1, 2)],
+            "daily_downtime": [1.0, 3.0],
+        }),
+        "Office": pd.DataFrame({
+            "date": [datetime(2024, 1, day, tzinfo=tzinfo) for day in (2, 3)],
+            "daily_downtime": [4.0, 6.0],
+        }),
+    }
+
+    # WHEN computing the rolling statistics for all locations
+    actual_df = sut.compute_rolling_statistics_by_location(daily_downtime_by_location, period="2d")
+
+    # THEN there should be one column per location, aligned by date
+    expected_df = pd.DataFrame(
+        {"Home": [1.0, 2.0, np.nan], "Office": [np.nan, 4.0, 5.0]},
+        index=pd.Index(
+            [datetime(2024, 1, day, tzinfo=tzinfo) for day in (1, 2, 3)],
+            name="date",
+        ),
+    )
+    pd.testing.assert_frame_equal(actual_df, expected_df, check_freq=False)
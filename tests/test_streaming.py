@@ -0,0 +1,147 @@
+import json
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import pandas as pd
+import pytest
+
+from blackout_stats import streaming as sut
+from blackout_stats.stats import transform_events_to_daily_records
+
+
+def test_pair_outage_records():
+    # GIVEN records with a repeated start, a stray stop and a broken line
+    df_records = pd.DataFrame({
+        "timestamp": [
+            "2024-01-01 10:00:00",
+            "2024-01-01 10:05:00",
+            "2024-01-01 12:00:00",
+            "2024-01-01 13:00:00",
+            "not a date",
+            "2024-01-02 08:00:00",
+        ],
+        "event": ["start", "START", "stop", "stop", "start", "start"],
+    })
+
+    # WHEN pairing them
+    df_events, df_rejected, open_start = sut.pair_outage_records(df_records)
+
+    # THEN the first start and the first stop should make an event
+    expected_events_df = pd.DataFrame({
+        "start_date": pd.to_datetime(["2024-01-01 10:00:00"], utc=True),
+        "end_date": pd.to_datetime(["2024-01-01 12:00:00"], utc=True),
+    })
+    pd.testing.assert_frame_equal(df_events, expected_events_df)
+
+    # AND the other records should be rejected with the reason
+    expected_rejected_df = df_records.loc[[1, 3, 4]].assign(
+        reason=["duplicate start", "stop without start", "invalid record"],
+    )
+    pd.testing.assert_frame_equal(df_rejected, expected_rejected_df)
+
+    # AND the last blackout should still be going on
+    assert open_start == pd.Timestamp("2024-01-02 08:00:00", tz="UTC")
+
+    # WHEN pairing the next records THEN the blackout should be closed
+    df_events, _, open_start = sut.pair_outage_records(
+        pd.DataFrame({"timestamp": ["2024-01-02 09:30:00"], "event": ["stop"]}),
+        open_start=open_start,
+    )
+    assert df_events["end_date"].tolist() == [pd.Timestamp("2024-01-02 09:30:00", tz="UTC")]
+    assert open_start is None
+
+
+def append_lines(path, lines):
+    with open(path, "a") as log_file:
+        log_file.write("".join(lines))
+
+
+def to_json_line(timestamp, event):
+    return json.dumps({"timestamp": timestamp, "event": event}) + "\n"
+
+
+def test_outage_log_stream_reads_only_the_appended_records(tmp_path):
+    # GIVEN a JSON lines log with a closed blackout and an ongoing one
+    tzinfo = ZoneInfo("Europe/Kyiv")
+    path = str(tmp_path / "outages.jsonl")
+    append_lines(path, [
+        to_json_line("2024-01-01T20:00:00+02:00", "start"),
+        to_json_line("2024-01-02T01:30:00+02:00", "stop"),
+        to_json_line("2024-01-03T10:00:00+02:00", "start"),
+    ])
+    stream = sut.OutageLogStream(path, tzinfo)
+    max_output_date = datetime(2024, 1, 5)
+
+    # WHEN polling it
+    snapshot = stream.poll(max_output_date)
+
+    # THEN the closed blackout should be an event, and the ongoing one should be set aside
+    assert snapshot.df_blackout_events["id"].tolist() == [1]
+    assert snapshot.df_rejected_events["reason"].tolist() == ["missing end date"]
+
+    # WHEN more records are appended, the last line being still written
+    append_lines(path, [
+        to_json_line("2024-01-03T12:30:00+02:00", "stop"),
+        to_json_line("2024-01-04T23:00:00+02:00", "start"),
+        to_json_line("2024-01-05T01:00:00+02:00", "stop"),
+        '{"timestamp": "2024-01-05T02:00:00+02:00", "ev',
+    ])
+    next_snapshot = stream.poll(max_output_date)
+
+    # THEN only the complete lines should be read
+    assert next_snapshot.data_version != snapshot.data_version
+    assert next_snapshot.df_blackout_events["id"].tolist() == [1, 2, 3]
+    assert next_snapshot.df_rejected_events.empty
+
+    # AND the previous snapshot should not change, even though it shares the stored events
+    assert snapshot.df_blackout_events["id"].tolist() == [1]
+
+    # AND the daily downtime should be the same as computing it from all the events
+    expected_daily_df = transform_events_to_daily_records(
+        next_snapshot.df_blackout_events,
+        target_tzinfo=tzinfo,
+        max_output_date=max_output_date,
+    )
+    pd.testing.assert_frame_equal(next_snapshot.df_daily_downtime, expected_daily_df)
+
+    # WHEN nothing new is appended THEN the same snapshot should be returned
+    assert stream.poll(max_output_date) is next_snapshot
+
+
+def test_outage_log_stream_rereads_a_truncated_csv_log(tmp_path):
+    # GIVEN a CSV log that has been read
+    tzinfo = ZoneInfo("Europe/Kyiv")
+    path = str(tmp_path / "outages.csv")
+    append_lines(path, [
+        "timestamp,event\n",
+        "2024-03-01 08:00:00,start\n",
+        "2024-03-01 09:00:00,stop\n",
+    ])
+    stream = sut.OutageLogStream(path, tzinfo)
+    snapshot = stream.poll(datetime(2024, 3, 2))
+    assert len(snapshot.df_blackout_events) == 1
+
+    # WHEN the log is replaced with a shorter one
+    with open(path, "w") as log_file:
+        log_file.write("timestamp,event\n2024-03-01 10:00:00,start\n")
+
+    # THEN it should be read again from the beginning
+    next_snapshot = stream.poll(datetime(2024, 3, 2))
+    assert next_snapshot.data_version != snapshot.data_version
+    assert next_snapshot.df_blackout_events.empty
+    assert next_snapshot.df_rejected_events["start_date"].tolist() == [
+        "2024-03-01T10:00:00+00:00",
+    ]
+
+
+@pytest.mark.parametrize("lines", [[], ["not json\n", "[1, 2]\n"]])
+def test_outage_log_stream_without_events(tmp_path, lines):
+    # GIVEN a log without any valid records
+    path = str(tmp_path / "outages.jsonl")
+    append_lines(path, lines)
+
+    # WHEN polling it THEN there should be no events and no daily downtime
+    snapshot = sut.OutageLogStream(path, ZoneInfo("Europe/Kyiv")).poll()
+    assert snapshot.df_blackout_events.empty
+    assert snapshot.df_daily_downtime.empty
+    assert len(snapshot.df_rejected_events) == len(lines)
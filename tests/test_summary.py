@@ -0,0 +1,109 @@
+from datetime import date
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from blackout_stats import summary as sut
+
+
+@pytest.fixture
+def df_daily_downtime():
+    # Spans the spring DST transition on 2024-03-31, and has no record for 2024-04-02.
+    tzinfo = ZoneInfo("Europe/Kyiv")
+    daily_downtimes = {
+        datetime(2024, 3, 29, tzinfo=tzinfo): 1.0,
+        datetime(2024, 3, 30, tzinfo=tzinfo): 2.0,
+        datetime(2024, 3, 31, tzinfo=tzinfo): 4.0,
+        datetime(2024, 4, 1, tzinfo=tzinfo): 8.0,
+        datetime(2024, 4, 3, tzinfo=tzinfo): 16.0,
+    }
+    return pd.DataFrame({
+        "date": list(daily_downtimes),
+        "daily_downtime": list(daily_downtimes.values()),
+    })
+
+
+@pytest.mark.parametrize(
+    "start, end, expected_downtime",
+    [
+        (date(2024, 3, 29), date(2024, 4, 4), 31.0),
+        (date(2024, 3, 30), date(2024, 4, 1), 6.0),
+        (date(2024, 4, 1), date(2024, 4, 3), 8.0),
+        (date(2024, 4, 2), date(2024, 4, 3), 0.0),
+        (date(2024, 1, 1), date(2024, 3, 31), 3.0),
+        (date(2024, 4, 3), date(2025, 1, 1), 16.0),
+        (date(2023, 1, 1), date(2024, 1, 1), 0.0),
+        (date(2024, 4, 1), date(2024, 3, 30), 0.0),
+        (datetime(2024, 3, 31, 23, 0), datetime(2024, 4, 1, 1, 0), 4.0),
+    ],
+)
+def test_downtime_prefix_sums_total_downtime(df_daily_downtime, start, end, expected_downtime):
+    # GIVEN the prefix sums of the daily downtime
+    prefix_sums = sut.DowntimePrefixSums(df_daily_downtime)
+
+    # WHEN getting the total downtime of a range of days
+    # THEN only the days within the range should be counted
+    assert prefix_sums.total_downtime(start, end) == expected_downtime
+
+
+def test_downtime_prefix_sums_summarize(df_daily_downtime):
+    # GIVEN the prefix sums of the daily downtime, with one day missing
+    prefix_sums = sut.DowntimePrefixSums(df_daily_downtime)
+
+    # WHEN summarizing a range that starts before the report
+    summary = prefix_sums.summarize(date(2024, 3, 1), date(2024, 4, 3))
+
+    # THEN the average should be taken over the days of the report within the range
+    assert prefix_sums.start_date == date(2024, 3, 29)
+    assert prefix_sums.end_date == date(2024, 4, 4)
+    assert summary == {"total_downtime": 15.0, "avg_downtime": 3.0, "day_count": 5}
+
+
+def test_downtime_prefix_sums_without_days():
+    # GIVEN the prefix sums of an empty daily downtime report
+    df_daily_downtime = pd.DataFrame({
+        "date": pd.Series(dtype=pd.DatetimeTZDtype(tz=ZoneInfo("Europe/Kyiv"))),
+        "daily_downtime": pd.Series(dtype=float),
+    })
+    prefix_sums = sut.DowntimePrefixSums(df_daily_downtime)
+
+    # WHEN summarizing any range
+    summary = prefix_sums.summarize(date(2024, 1, 1), date(2025, 1, 1))
+
+    # THEN there should be no downtime and no average
+    assert len(prefix_sums) == 0
+    assert summary["total_downtime"] == 0.0
+    assert np.isnan(summary["avg_downtime"])
+    assert summary["day_count"] == 0
+
+
+@pytest.mark.parametrize(
+    "get_range, expected_range",
+    [
+        (sut.get_week_to_date_range, (date(2024, 3, 4), date(2024, 3, 7))),
+        (sut.get_month_to_date_range, (date(2024, 3, 1), date(2024, 3, 7))),
+        (sut.get_year_to_date_range, (date(2024, 1, 1), date(2024, 3, 7))),
+    ],
+)
+def test_get_to_date_ranges(get_range, expected_range):
+    # GIVEN a Wednesday
+    today = date(2024, 3, 6)
+
+    # WHEN getting the range of days from the start of the calendar period
+    # THEN it should end with today (inclusive)
+    assert get_range(today) == expected_range
+
+
+@pytest.mark.parametrize(
+    "start, end, expected_range",
+    [
+        (date(2024, 3, 1), date(2024, 3, 8), (date(2023, 3, 1), date(2023, 3, 8))),
+        (date(2024, 2, 29), date(2024, 3, 1), (date(2023, 2, 28), date(2023, 3, 1))),
+        (date(2025, 1, 1), date(2025, 3, 1), (date(2024, 1, 1), date(2024, 3, 1))),
+    ],
+)
+def test_get_same_period_last_year(start, end, expected_range):
+    assert sut.get_same_period_last_year(start, end) == expected_range
@@ -0,0 +1,97 @@
+from datetime import datetime
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from blackout_stats import timeline as sut
+
+
+def utc(value):
+    return pd.Timestamp(value, tz="UTC")
+
+
+@pytest.fixture
+def df_overlapping_events():
+    # Unsorted events, where the second and the third one overlap, and the last one touches it.
+    return pd.DataFrame({
+        "id": [1, 2, 3, 4],
+        "start_date": pd.to_datetime(
+            ["2024-01-02 10:00", "2024-01-01 08:00", "2024-01-01 09:00", "2024-01-01 12:00"],
+        ).tz_localize("UTC"),
+        "end_date": pd.to_datetime(
+            ["2024-01-02 11:00", "2024-01-01 10:00", "2024-01-01 12:00", "2024-01-01 13:00"],
+        ).tz_localize("UTC"),
+    })
+
+
+def test_build_outage_timeline_merges_overlapping_events(df_overlapping_events):
+    # WHEN building the timeline
+    timeline = sut.build_outage_timeline(df_overlapping_events)
+
+    # THEN the overlapping and touching events should be merged into a single outage
+    expected_change_points = pd.to_datetime(
+        ["2024-01-01 08:00", "2024-01-01 13:00", "2024-01-02 10:00", "2024-01-02 11:00"],
+    ).tz_localize("UTC").asi8
+    np.testing.assert_array_equal(timeline.change_points, expected_change_points)
+    assert not timeline.is_ongoing
+
+
+@pytest.mark.parametrize(
+    "at, expected_is_down, expected_since",
+    [
+        ("2024-01-01 07:00", False, None),
+        ("2024-01-01 08:00", True, "2024-01-01 08:00"),
+        ("2024-01-01 12:30", True, "2024-01-01 08:00"),
+        ("2024-01-01 13:00", False, "2024-01-01 13:00"),
+        ("2024-01-02 10:30", True, "2024-01-02 10:00"),
+        ("2024-05-01 00:00", False, "2024-01-02 11:00"),
+    ]
+)
+def test_outage_timeline_state_at(df_overlapping_events, at, expected_is_down, expected_since):
+    # GIVEN a timeline
+    timeline = sut.build_outage_timeline(df_overlapping_events)
+
+    # WHEN querying the state at a point in time
+    state = timeline.state_at(utc(at))
+
+    # THEN it should tell whether the power was off, and since when
+    assert state.is_down == expected_is_down
+    assert state.since == (utc(expected_since) if expected_since else None)
+
+
+def test_build_outage_timeline_with_an_ongoing_blackout(df_overlapping_events):
+    # GIVEN rejected rows without an end date: an old data entry error, and the ongoing blackout
+    df_rejected_events = pd.DataFrame({
+        "id": [10, 11],
+        "start_date": ["2023-12-01 00:00:00", "2024-01-03 06:00:00"],
+        "end_date": [None, None],
+        "reason": ["missing end date", "missing end date"],
+    })
+
+    # WHEN building the timeline
+    timeline = sut.build_outage_timeline(df_overlapping_events, df_rejected_events)
+
+    # THEN only the blackout after the last valid one should be treated as ongoing
+    assert timeline.is_ongoing
+    assert not timeline.state_at(utc("2023-12-01 12:00")).is_down
+    state = timeline.state_at(datetime(2024, 1, 3, 9, 30, tzinfo=utc(0).tzinfo))
+    assert state.is_down
+    assert state.since == utc("2024-01-03 06:00")
+    assert state.duration == timedelta(hours=3, minutes=30)
+
+
+def test_build_outage_timeline_without_events():
+    # GIVEN no events
+    df_blackout_events = pd.DataFrame({
+        "start_date": pd.Series(dtype="datetime64[ns, UTC]"),
+        "end_date": pd.Series(dtype="datetime64[ns, UTC]"),
+    })
+
+    # WHEN building the timeline THEN the power should be on at any time
+    timeline = sut.build_outage_timeline(df_blackout_events, pd.DataFrame())
+    state = timeline.state_at(utc("2024-01-01"))
+    assert not state.is_down
+    assert state.since is None
+    assert state.duration is None
@@ -0,0 +1,151 @@
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pandas as pd
+
+from blackout_stats import visualization as sut
+
+
+def test_compute_month_calendar_layout():
+    # GIVEN a month that starts on a Thursday and spans 5 weeks
+    # WHEN computing its calendar layout
+    layout = sut.compute_month_calendar_layout(2024, 2)
+
+    # THEN the days should be placed in a Monday-first grid, with padding around them
+    expected_week_count = 5
+    assert layout.week_count == expected_week_count
+    assert list(layout.day_names[:7]) == ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+    assert list(layout.week_numbers[[0, 6, 7, 34]]) == ["0", "0", "1", "4"]
+    assert list(layout.days_of_year[:5]) == [0, 0, 0, 32, 33]
+    assert layout.days_of_year[31] == 31 + 29
+    assert layout.datetime_labels[:4] == [None, None, None, "2024-02-01"]
+
+    # AND the layout should be memoized
+    assert sut.compute_month_calendar_layout(2024, 2) is layout
+
+
+def test_update_year_calendar_heatmap():
+    # GIVEN a calendar heatmap built for a year
+    tzinfo = ZoneInfo("Europe/Kyiv")
+    heatmap = sut.create_year_calendar_heatmap(2024)
+    january_source = heatmap.month_sources[0]
+
+    # WHEN filling it with the daily downtime for a couple of days
+    df_daily_downtime = pd.DataFrame({
+        "date": [datetime(2024, 1, day, tzinfo=tzinfo) for day in (1, 2)],
+        "daily_downtime": [24.0, 5.5],
+    })
+    sut.update_year_calendar_heatmap(heatmap, df_daily_downtime)
+
+    # THEN the days should be shown in their calendar cells, with the rest of the month empty
+    # (January 1, 2024 is a Monday, so there is no padding at the start)
+    data = january_source.data
+    assert data["daily_downtime_values"][:3] == [24.0, 5.5, 0.0]
+    assert data["daily_downtime_labels"][:3] == ["24", "6", "0"]
+    assert data["day_backgrounds"][0] == sut.DAY_BACKGROUND_PALETTE[0]
+    assert data["day_backgrounds"][2] == "white"
+    assert data["daily_downtime_values"][-1] is None
+
+    # WHEN the data changes
+    df_daily_downtime["daily_downtime"] = [0.0, 1.0]
+    sut.update_year_calendar_heatmap(heatmap, df_daily_downtime)
+
+    # THEN the same data sources should be updated in place
+    assert heatmap.month_sources[0] is january_source
+    assert january_source.data["daily_downtime_values"][:2] == [0.0, 1.0]
+
+
+def test_align_daily_downtime_to_days_of_year_ignores_other_years():
+    # GIVEN daily downtime records spanning two years
+    tzinfo = ZoneInfo("Europe/Kyiv")
+    df_daily_downtime = pd.DataFrame({
+        "date": [datetime(2023, 12, 31, tzinfo=tzinfo), datetime(2024, 1, 2, tzinfo=tzinfo)],
+        "daily_downtime": [3.0, 4.0],
+    })
+
+    # WHEN aligning the records to the days of 2024
+    values = sut.align_daily_downtime_to_days_of_year(df_daily_downtime, 2024)
+
+    # THEN only the records of 2024 should be included, indexed by the day of the year
+    expected_values = np.zeros(366 + 1)
+    expected_values[2] = 4.0
+    np.testing.assert_array_equal(values, expected_values)
+
+
+def test_generate_compact_calendar_heatmap_plot():
+    # GIVEN daily downtime records of two years
+    tzinfo = ZoneInfo("Europe/Kyiv")
+    df_daily_downtime = pd.DataFrame({
+        "date": [datetime(2023, 12, 31, tzinfo=tzinfo), datetime(2024, 1, 2, tzinfo=tzinfo)],
+        "daily_downtime": [3.0, 4.0],
+    })
+
+    # WHEN plotting both years in the compact calendar
+    plot = sut.generate_compact_calendar_heatmap_plot(df_daily_downtime)
+
+    # THEN all glyphs should share a single data source
+    sources = {renderer.data_source for renderer in plot.renderers}
+    assert len(sources) == 1
+    data = sources.pop().data
+
+    # AND every day of both years should be a cell, with the days in their calendar positions
+    is_cell = np.array(data["cell_sizes"]) > 0
+    cell_dates = np.array(data["datetime_labels"], dtype=object)[is_cell]
+    assert len(cell_dates) == 365 + 366
+    first_day_2024 = list(cell_dates).index("2024-01-01")
+    second_day_2024 = list(cell_dates).index("2024-01-02")
+    cell_x = np.array(data["x"])[is_cell]
+    cell_y = np.array(data["y"])[is_cell]
+    assert cell_x[second_day_2024] == cell_x[first_day_2024] + 1
+    assert cell_y[second_day_2024] == cell_y[first_day_2024]
+    assert np.array(data["daily_downtime_values"], dtype=object)[is_cell][second_day_2024] == (
+        df_daily_downtime["daily_downtime"].iloc[1]
+    )
+
+    # AND the year titles should be labels
+    assert "2023" in data["labels"]
+    assert "2024" in data["labels"]
+
+
+def test_compact_calendar_heatmap_payload_is_smaller():
+    # GIVEN daily downtime records of a year
+    tzinfo = ZoneInfo("Europe/Kyiv")
+    df_daily_downtime = pd.DataFrame({
+        "date": pd.date_range("2024-01-01", "2024-12-31", freq="D", tz=tzinfo),
+        "daily_downtime": 1.0,
+    })
+
+    # WHEN plotting it with both renderers
+    grid_plot = sut.generate_year_calendar_heatmap_plot(df_daily_downtime)
+    compact_plot = sut.generate_compact_calendar_heatmap_plot(df_daily_downtime)
+
+    # THEN the compact renderer should send less data to the browser
+    assert sut.compute_plot_payload_size(compact_plot) < sut.compute_plot_payload_size(grid_plot)
+
+
+def test_generate_hour_of_day_heatmap_plot():
+    # GIVEN a downtime profile with a single hour without data
+    df_hour_of_day_profile = pd.DataFrame(0.0, index=range(24), columns=range(7))
+    df_hour_of_day_profile.loc[10, 2] = 0.5
+    df_hour_of_day_profile.loc[23, 6] = np.nan
+
+    # WHEN plotting it
+    plot = sut.generate_hour_of_day_heatmap_plot(df_hour_of_day_profile)
+
+    # THEN every hour of every weekday should be a cell
+    data = plot.renderers[0].data_source.data
+    assert len(data["day_names"]) == 24 * 7
+
+    # AND the cells should show the share of the time without power in their positions
+    cell = data["hour_labels"].index("10:00") + 2
+    assert data["day_names"][cell] == sut.DAY_NAMES[2]
+    assert data["downtime_share_values"][cell] == 50.0  # noqa: PLR2004
+    assert data["downtime_share_labels"][cell] == "50"
+    assert data["cell_backgrounds"][cell] != "white"
+
+    # AND the hours without power or without data should be white, the latter without a label
+    assert data["cell_backgrounds"][0] == "white"
+    assert data["downtime_share_labels"][0] == "0"
+    assert data["cell_backgrounds"][-1] == "white"
+    assert data["downtime_share_labels"][-1] == ""